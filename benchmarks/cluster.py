@@ -0,0 +1,176 @@
+"""
+Multi-node worker simulation.
+
+Runs N workers as threads sharing one job queue and one metrics store (a
+``LocalRedis`` standing in for a Redis server, or SQLite files) against a
+stub service whose jobs sleep for a fixed time, and prints throughput per
+node count. Then simulates a crashed node: it claims a job and never
+heartbeats, and the benchmark measures how long the surviving worker takes
+to requeue and finish the job.
+
+Usage:
+    python benchmarks/cluster.py [--backend redis|sqlite] [--jobs 48] [--job-seconds 0.05]
+"""
+
+import argparse
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from research_bot.distributed import ClusterMetrics, LocalRedis, RedisJobQueue, SqliteKeyValueStore
+from research_bot.distributed.store import KeyValueStore
+from research_bot.models.job import JobStatus
+from research_bot.services.job_queue import JobQueue, QueueBackend
+from research_bot.services.worker import ResearchWorker
+
+NODE_COUNTS = (1, 2, 4, 8)
+
+
+class SleepingService:
+    """Stands in for ``ResearchService``: each job takes a fixed time."""
+
+    def __init__(self, job_seconds: float) -> None:
+        self._job_seconds = job_seconds
+
+    def execute_research(self, topic: str, output_file: Optional[str] = None) -> str:
+        time.sleep(self._job_seconds)
+        return f"# {topic}\n"
+
+
+def open_backend(
+    backend: str, workdir: Path, name: str, lease_seconds: float
+) -> Tuple[QueueBackend, KeyValueStore]:
+    """A fresh queue and metrics store on the chosen backend."""
+    if backend == "redis":
+        client = LocalRedis()
+        return RedisJobQueue(client, lease_seconds=lease_seconds), client
+    return (
+        JobQueue(str(workdir / f"{name}-queue.db"), lease_seconds=lease_seconds),
+        SqliteKeyValueStore(workdir / f"{name}-shared.db"),
+    )
+
+
+def run_nodes(
+    queue: QueueBackend,
+    metrics: ClusterMetrics,
+    nodes: int,
+    concurrency: int,
+    job_seconds: float,
+    output_dir: Path,
+) -> float:
+    """Drain the queue with ``nodes`` workers; return the wall time."""
+    workers = [
+        ResearchWorker(
+            SleepingService(job_seconds),  # type: ignore[arg-type]
+            queue,
+            output_dir=output_dir,
+            concurrency=concurrency,
+            poll_interval=0.01,
+            worker_id=f"node-{index}",
+            heartbeat_interval=1.0,
+            metrics=metrics,
+        )
+        for index in range(nodes)
+    ]
+    threads = [threading.Thread(target=worker.run, kwargs={"drain": True}) for worker in workers]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - started
+
+
+def throughput(args: argparse.Namespace, workdir: Path) -> None:
+    """Print jobs per second for each node count."""
+    print(f"{'nodes':>5} {'slots':>5} {'wall s':>8} {'jobs/s':>8} {'speedup':>8} {'per node':>30}")
+    baseline: Optional[float] = None
+    for nodes in NODE_COUNTS:
+        queue, store = open_backend(args.backend, workdir, f"nodes-{nodes}", lease_seconds=30.0)
+        metrics = ClusterMetrics(store)
+        for index in range(args.jobs):
+            queue.submit(f"topic {index}")
+        elapsed = run_nodes(
+            queue, metrics, nodes, args.concurrency, args.job_seconds, workdir / "reports"
+        )
+        rate = args.jobs / elapsed
+        baseline = baseline or rate
+        summary = metrics.summary(window_minutes=1)
+        per_node: List[str] = [str(node.succeeded) for node in summary.nodes]
+        print(
+            f"{nodes:>5} {nodes * args.concurrency:>5} {elapsed:>8.2f} {rate:>8.1f} "
+            f"{rate / baseline:>7.1f}x {'/'.join(per_node):>30}",
+            flush=True,
+        )
+
+
+def crash_recovery(args: argparse.Namespace, workdir: Path) -> None:
+    """Time the requeue of a job claimed by a node that died."""
+    lease_seconds = 0.5
+    queue, store = open_backend(args.backend, workdir, "crash", lease_seconds=lease_seconds)
+    metrics = ClusterMetrics(store)
+    job = queue.submit("job of a crashed node")
+    claimed = queue.claim("crashed-node")
+    if claimed is None or claimed.id != job.id:
+        raise RuntimeError("crashed node failed to claim the job")
+    crashed_at = time.perf_counter()
+
+    worker = ResearchWorker(
+        SleepingService(args.job_seconds),  # type: ignore[arg-type]
+        queue,
+        output_dir=workdir / "reports",
+        concurrency=1,
+        poll_interval=0.01,
+        worker_id="survivor",
+        heartbeat_interval=lease_seconds / 5,
+        metrics=metrics,
+    )
+    thread = threading.Thread(target=worker.run)
+    thread.start()
+    finished = None
+    while time.perf_counter() - crashed_at < 30:
+        finished = queue.get(job.id)
+        if finished is not None and finished.status.is_terminal:
+            break
+        time.sleep(0.01)
+    worker.stop()
+    thread.join()
+
+    if finished is None or finished.status != JobStatus.SUCCEEDED:
+        raise RuntimeError(f"job was not recovered: {finished}")
+    print(
+        f"\nCrashed node: job finished by {finished.worker_id} on attempt {finished.attempts}, "
+        f"{time.perf_counter() - crashed_at:.2f}s after the crash "
+        f"(lease {lease_seconds}s, requeued {metrics.summary().requeued})"
+    )
+
+
+def main() -> None:
+    """Run the throughput and crash recovery simulations."""
+    parser = argparse.ArgumentParser(description="research-bot multi-node worker simulation")
+    parser.add_argument(
+        "--backend",
+        choices=("redis", "sqlite"),
+        default="redis",
+        help="Shared queue and metrics store (default: redis, simulated by LocalRedis)",
+    )
+    parser.add_argument("--jobs", type=int, default=48, help="Jobs per node count (default: 48)")
+    parser.add_argument(
+        "--job-seconds",
+        type=float,
+        default=0.05,
+        help="Duration of each stub job (default: 0.05)",
+    )
+    parser.add_argument("--concurrency", type=int, default=2, help="Jobs per node (default: 2)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="research-bot-cluster-") as tmp:
+        workdir = Path(tmp)
+        throughput(args, workdir)
+        crash_recovery(args, workdir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""
+Minimal benchmark harness: latency percentiles, peak memory, retained
+memory blocks and baseline comparison. Standard library only.
+"""
+
+import gc
+import json
+import statistics
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+
+@dataclass
+class Benchmark:
+    """A named workload and how often to run it."""
+
+    name: str
+    fn: Callable[[], object]
+    iterations: int = 50
+    warmup: int = 3
+    setup: Optional[Callable[[], None]] = None
+
+
+@dataclass
+class BenchmarkResult:
+    """Measurements for one benchmark."""
+
+    name: str
+    iterations: int
+    mean_ms: float
+    p50_ms: float
+    p90_ms: float
+    p99_ms: float
+    max_ms: float
+    peak_memory_kb: float
+    # Memory blocks still allocated after one iteration (tracemalloc net
+    # count growth), not the number of allocations the iteration made
+    retained_blocks: int
+
+    def format_row(self) -> str:
+        """Render as a fixed-width table row."""
+        return (
+            f"{self.name:<32} {self.iterations:>5} {self.p50_ms:>10.3f} {self.p90_ms:>10.3f} "
+            f"{self.p99_ms:>10.3f} {self.peak_memory_kb:>12.1f} {self.retained_blocks:>10}"
+        )
+
+
+HEADER = (
+    f"{'benchmark':<32} {'iters':>5} {'p50 ms':>10} {'p90 ms':>10} "
+    f"{'p99 ms':>10} {'peak KiB':>12} {'retained':>10}"
+)
+
+
+def _percentile(sorted_samples: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of pre-sorted samples."""
+    index = min(len(sorted_samples) - 1, max(0, round(fraction * len(sorted_samples)) - 1))
+    return sorted_samples[index]
+
+
+def run_benchmark(benchmark: Benchmark, iterations: Optional[int] = None) -> BenchmarkResult:
+    """
+    Time a benchmark, then measure one extra iteration under tracemalloc.
+
+    Memory is measured separately so tracing overhead does not distort the
+    latency samples: the peak traced memory of that iteration and the
+    memory blocks it left allocated.
+    """
+    if benchmark.setup is not None:
+        benchmark.setup()
+    for _ in range(benchmark.warmup):
+        benchmark.fn()
+
+    count = iterations or benchmark.iterations
+    samples: List[float] = []
+    gc.collect()
+    for _ in range(count):
+        started = time.perf_counter()
+        benchmark.fn()
+        samples.append((time.perf_counter() - started) * 1000)
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    tracemalloc.reset_peak()
+    benchmark.fn()
+    _, peak = tracemalloc.get_traced_memory()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    retained_blocks = sum(
+        max(0, stat.count_diff) for stat in after.compare_to(before, "filename")
+    )
+
+    ordered = sorted(samples)
+    return BenchmarkResult(
+        name=benchmark.name,
+        iterations=count,
+        mean_ms=statistics.fmean(samples),
+        p50_ms=_percentile(ordered, 0.50),
+        p90_ms=_percentile(ordered, 0.90),
+        p99_ms=_percentile(ordered, 0.99),
+        max_ms=ordered[-1],
+        peak_memory_kb=peak / 1024,
+        retained_blocks=retained_blocks,
+    )
+
+
+def load_baseline(path: Path) -> Dict[str, BenchmarkResult]:
+    """Load stored baseline results keyed by benchmark name."""
+    if not path.exists():
+        return {}
+    data = json.loads(path.read_text(encoding="utf-8"))
+    return {name: BenchmarkResult(**result) for name, result in data["results"].items()}
+
+
+def save_baseline(path: Path, results: List[BenchmarkResult], version: str) -> None:
+    """Store results as the new baseline."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "version": version,
+        "recorded_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "results": {result.name: asdict(result) for result in results},
+    }
+    path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+
+
+def find_regressions(
+    results: List[BenchmarkResult],
+    baseline: Dict[str, BenchmarkResult],
+    tolerance: float,
+) -> List[str]:
+    """
+    Compare results against a baseline.
+
+    Returns:
+        Human-readable descriptions of p50/p90 latency or peak memory growth
+        beyond ``tolerance`` (e.g. 0.2 = 20%).
+    """
+    regressions: List[str] = []
+    for result in results:
+        reference = baseline.get(result.name)
+        if reference is None:
+            continue
+        for metric in ("p50_ms", "p90_ms", "peak_memory_kb"):
+            current, previous = getattr(result, metric), getattr(reference, metric)
+            if previous > 0 and current > previous * (1 + tolerance):
+                regressions.append(
+                    f"{result.name}: {metric} {previous:.3f} -> {current:.3f} "
+                    f"(+{(current / previous - 1) * 100:.0f}%)"
+                )
+    return regressions
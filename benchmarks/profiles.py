@@ -0,0 +1,149 @@
+"""
+Pipeline profile comparison.
+
+Runs the pipeline under every profile against a stubbed search API and a
+scripted LLM with a fixed delay per call, then prints latency, LLM
+requests, tool calls, tokens and estimated cost per profile side by side.
+
+The scripted agents behave like thorough ones: agents with tools keep
+searching until their iteration cap or the run's tool call budget stops
+them, so the profiles' agent sets, iteration caps and source budgets all
+show up in the numbers.
+
+Usage:
+    python benchmarks/profiles.py [--runs 3] [--llm-latency 0.2]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+# Keep CrewAI from waiting on telemetry endpoints during measurements
+os.environ.setdefault("CREWAI_DISABLE_TELEMETRY", "true")
+os.environ.setdefault("OTEL_SDK_DISABLED", "true")
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from run import StubTavilyClient, bench_settings  # noqa: E402
+
+from research_bot.config import PROFILES  # noqa: E402
+from research_bot.replay import FixedLatency, FixtureStore, ReplayLLM  # noqa: E402
+from research_bot.replay.llm import llm_call_context  # noqa: E402
+from research_bot.services import ResearchService  # noqa: E402
+from research_bot.services.run_store import RunStore  # noqa: E402
+from research_bot.tools import TavilySearchTool  # noqa: E402
+
+SEARCH_TOOL = "tavily_web_search"
+
+FINDINGS = (
+    "Finding with facts and figures from [a source](https://example.com/articles/1). " * 30
+)
+
+
+class ScriptedAgentLLM(ReplayLLM):
+    """
+    Searches until stopped, then answers.
+
+    Agents with tools call the search tool once per step (one assistant
+    message per call so far) until the tool reports an error, e.g. the
+    source budget; CrewAI forces a final answer at the iteration cap.
+    """
+
+    def call(self, messages: Any, *args: Any, **kwargs: Any) -> Any:
+        if isinstance(messages, str):
+            messages = [{"role": "user", "content": messages}]
+        with llm_call_context():
+            self._emit_started(messages, kwargs)
+            completion = self._script(messages)
+            delay = self._latency.sample(None)
+            if delay > 0:
+                time.sleep(delay)
+            self._report_usage(messages, completion, kwargs)
+        return completion
+
+    @staticmethod
+    def _script(messages: List[Dict[str, Any]]) -> str:
+        """The next agent step: another search, or the final answer."""
+        has_tools = SEARCH_TOOL in str(messages[0].get("content") or "")
+        steps = sum(1 for message in messages if message.get("role") == "assistant")
+        stopped = any("error:" in str(message.get("content") or "") for message in messages[-2:])
+        if has_tools and not stopped:
+            return (
+                f"Thought: I need more sources\nAction: {SEARCH_TOOL}\n"
+                f'Action Input: {{"query": "profile benchmark query {steps}"}}'
+            )
+        return f"Thought: I now know the final answer\nFinal Answer: {FINDINGS}"
+
+
+class StubToolProvider:
+    """Only the search tool, backed by a stub client."""
+
+    def __init__(self) -> None:
+        self._settings = bench_settings()
+        self._client = StubTavilyClient(results=5, content_chars=1500)
+
+    def get_tools(self) -> List[Any]:
+        return [TavilySearchTool(self._settings, client=self._client)]
+
+
+def main() -> None:
+    """Run every profile and print the comparison."""
+    parser = argparse.ArgumentParser(description="research-bot pipeline profile comparison")
+    parser.add_argument("--runs", type=int, default=3, help="Runs per profile (default: 3)")
+    parser.add_argument(
+        "--llm-latency",
+        type=float,
+        default=0.2,
+        help="Seconds per LLM call (default: 0.2)",
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="research-bot-profiles-") as tmp:
+        workdir = Path(tmp)
+        store = RunStore(str(workdir / "runs.db"))
+        llm = ScriptedAgentLLM(
+            FixtureStore(workdir / "fixtures"),
+            latency=FixedLatency(args.llm_latency),
+            fallback_completion=FINDINGS,
+        )
+        service = ResearchService(
+            bench_settings(),
+            tool_provider=StubToolProvider(),
+            llm=llm,
+            run_store=store,
+        )
+
+        print(
+            f"{'profile':<10} {'agents':>6} {'p50 s':>8} {'LLM reqs':>9} "
+            f"{'tool calls':>10} {'tokens':>9} {'cost USD':>10}"
+        )
+        for name, profile in PROFILES.items():
+            for run in range(args.runs):
+                with contextlib.redirect_stdout(io.StringIO()):
+                    service.execute_research(
+                        "Benchmarking multi-agent research pipelines",
+                        output_file=str(workdir / f"{name}-{run}.md"),
+                        profile=profile,
+                    )
+            runs = store.list_runs(limit=args.runs)
+            tool_calls = statistics.median(sum(usage.calls for usage in r.tools) for r in runs)
+            print(
+                f"{name:<10} {len(profile.phases):>6} "
+                f"{statistics.median(r.duration_seconds for r in runs):>8.2f} "
+                f"{statistics.median(r.tokens.requests for r in runs):>9.0f} "
+                f"{tool_calls:>10.0f} "
+                f"{statistics.median(r.tokens.total_tokens for r in runs):>9.0f} "
+                f"{statistics.median(r.cost_usd for r in runs):>10.5f}",
+                flush=True,
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,535 @@
+"""
+Research pipeline benchmark suite.
+
+Runs every workload against stubbed tool clients and a replaying LLM (no
+network, no API keys), prints latency percentiles, peak memory and
+retained memory blocks, and compares them against a stored baseline.
+
+Usage:
+    python benchmarks/run.py                       # run and compare
+    python benchmarks/run.py --save-baseline       # store results as baseline
+    python benchmarks/run.py -k scrape --iterations 20
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import requests
+
+# Keep CrewAI from waiting on telemetry endpoints during measurements
+os.environ.setdefault("CREWAI_DISABLE_TELEMETRY", "true")
+os.environ.setdefault("OTEL_SDK_DISABLED", "true")
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from harness import (  # noqa: E402
+    HEADER,
+    Benchmark,
+    find_regressions,
+    load_baseline,
+    run_benchmark,
+    save_baseline,
+)
+
+import research_bot  # noqa: E402
+from research_bot.config import Settings  # noqa: E402
+
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baseline.json"
+
+FINAL_ANSWER = (
+    "Thought: I now know the final answer\n"
+    "Final Answer: # Benchmark Report\n\n## Executive Summary\n\nStubbed output."
+)
+
+
+def bench_settings() -> Settings:
+    """Settings that never reach a real API."""
+    return Settings(
+        _env_file=None,
+        tavily_api_key="bench",
+        scrape_do_api_key="bench",
+        google_api_key="bench",
+        crew_verbose=False,
+        run_history_path="",
+        url_health_path="",
+    )
+
+
+class StubTavilyClient:
+    """Returns a fixed, realistically sized Tavily response."""
+
+    def __init__(self, results: int = 20, content_chars: int = 4000) -> None:
+        self._response: Dict[str, Any] = {
+            "answer": "A synthesized answer. " * 40,
+            "results": [
+                {
+                    "title": f"Result {idx}: an authoritative source on the topic",
+                    "url": f"https://example.com/articles/{idx}",
+                    "content": ("Sentence about the topic with facts and figures. " * 200)[
+                        :content_chars
+                    ],
+                    "score": 0.9,
+                }
+                for idx in range(results)
+            ],
+        }
+
+    def search(self, **kwargs: Any) -> Dict[str, Any]:
+        if not kwargs.get("include_raw_content"):
+            return self._response
+        page = "Extracted page paragraph with facts, figures and context.\n\n  " * 400
+        return {
+            **self._response,
+            "results": [{**result, "raw_content": page} for result in self._response["results"]],
+        }
+
+
+class StubResponse:
+    """Minimal ``requests.Response`` stand-in holding a large HTML page."""
+
+    def __init__(self, body: bytes, content_type: str = "text/html; charset=utf-8") -> None:
+        self._body = body
+        self.status_code = 200
+        self.headers = {"Content-Type": content_type}
+        self.encoding = "utf-8"
+
+    @property
+    def text(self) -> str:
+        return self._body.decode("utf-8")
+
+    @property
+    def content(self) -> bytes:
+        return self._body
+
+    def iter_content(self, chunk_size: int = 1, decode_unicode: bool = False) -> Any:
+        for start in range(0, len(self._body), chunk_size):
+            yield self._body[start:start + chunk_size]
+
+    def raise_for_status(self) -> None:
+        return None
+
+    def close(self) -> None:
+        return None
+
+
+class StubSession:
+    """``requests.Session`` stand-in serving one page for every URL."""
+
+    def __init__(
+        self,
+        page_bytes: int,
+        paragraph: bytes = b"<p>Rendered paragraph with <a href='#'>links</a> and text.</p>\n",
+    ) -> None:
+        body = paragraph * (page_bytes // len(paragraph))
+        self._body = b"<html><body>" + body + b"</body></html>"
+
+    def get(self, url: str, **kwargs: Any) -> StubResponse:
+        return StubResponse(self._body)
+
+    def request(self, method: str, url: str, **kwargs: Any) -> StubResponse:
+        return StubResponse(self._body)
+
+
+def build_pdf(pages: int, lines_per_page: int = 50) -> bytes:
+    """A text-only PDF of ``pages`` pages (Helvetica, no compression)."""
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"",  # the page tree, once the pages are known
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    kids = []
+    for page in range(pages):
+        lines = b"".join(
+            b"(Page %d line %d: revenue grew in the segment covered by this report.) Tj T*\n"
+            % (page + 1, line)
+            for line in range(lines_per_page)
+        )
+        stream = b"BT /F1 9 Tf 12 TL 40 800 Td\n" + lines + b"ET"
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % len(objects)
+        )
+        kids.append(b"%d 0 R" % len(objects))
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (b" ".join(kids), pages)
+
+    body = b"%PDF-1.4\n"
+    offsets = []
+    for number, obj in enumerate(objects, start=1):
+        offsets.append(len(body))
+        body += b"%d 0 obj\n%s\nendobj\n" % (number, obj)
+    xref = len(body)
+    body += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    body += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    body += b"trailer\n<< /Size %d /Root 1 0 R >>\n" % (len(objects) + 1)
+    body += b"startxref\n%d\n%%%%EOF\n" % xref
+    return body
+
+
+class PdfSession(StubSession):
+    """Session serving one PDF document for every URL."""
+
+    def __init__(self, pages: int) -> None:
+        self._body = build_pdf(pages)
+
+    def get(self, url: str, **kwargs: Any) -> StubResponse:
+        return StubResponse(self._body, content_type="application/pdf")
+
+
+class OutageSession(StubSession):
+    """Session whose scrape.do requests time out; direct page requests succeed."""
+
+    def __init__(self, page_bytes: int, timeout_seconds: float) -> None:
+        super().__init__(page_bytes)
+        self._timeout_seconds = timeout_seconds
+
+    def get(self, url: str, **kwargs: Any) -> StubResponse:
+        if url.startswith("https://api.scrape.do/"):
+            time.sleep(self._timeout_seconds)
+            raise requests.Timeout("scrape.do timed out")
+        return super().get(url, **kwargs)
+
+
+def build_benchmarks(workdir: Path) -> List[Benchmark]:
+    """Create the benchmark workloads, writing fixtures and reports to ``workdir``."""
+    from research_bot.crews import CrewTemplate, ResearchCrewBuilder
+    from research_bot.models import (
+        PlannedQuery,
+        QueryPlan,
+        ReportMetadata,
+        ReportSection,
+        ResearchFinding,
+        ResearchPhase,
+        ResearchReport,
+        ResearchResult,
+        ResearchSource,
+    )
+    from research_bot.models.report import SectionType
+    from research_bot.replay import FixedLatency, FixtureStore, ReplayLLM, ReplayToolProvider
+    from research_bot.services import ResearchService
+    from research_bot.services.citations import CitationVerifier, UrlChecker
+    from research_bot.services.digest import MapReduceDigester, SourceDocument
+    from research_bot.services.plan_executor import PlanExecutor
+    from research_bot.services.profiling import PipelineProfiler
+    from research_bot.services.section_drafter import SectionDrafter
+    from research_bot.tools import ScrapeTool, SourceStore, TavilySearchTool
+    from research_bot.tools.cache import ResultCache
+    from research_bot.tools.circuit_breaker import CircuitBreaker
+
+    settings = bench_settings()
+    store = FixtureStore(workdir / "fixtures")
+    llm = ReplayLLM(store, fallback_completion=FINAL_ANSWER)
+    tool_provider = ReplayToolProvider(store)
+
+    # Tool formatting / post-processing
+    search_tool = TavilySearchTool(settings, client=StubTavilyClient())
+    compact_search_tool = TavilySearchTool(
+        settings,
+        client=StubTavilyClient(),
+        sources=SourceStore(),
+    )
+    raw_search_tool = TavilySearchTool(
+        settings,
+        client=StubTavilyClient(),
+        sources=SourceStore(),
+        page_cache=ResultCache(),
+    )
+    scrape_tool = ScrapeTool(settings, session=StubSession(page_bytes=5 * 1024 * 1024))
+    large_scrape_tool = ScrapeTool(settings, session=StubSession(page_bytes=50 * 1024 * 1024))
+    markup_scrape_tool = ScrapeTool(
+        settings,
+        session=StubSession(page_bytes=5 * 1024 * 1024, paragraph=b"<script>var x = 1;</script>\n"),
+    )
+    pdf_scrape_tool = ScrapeTool(settings, session=PdfSession(pages=300))
+
+    # scrape.do outage (each request times out after 20 ms) during 40 page
+    # extractions: the breaker opens after 5 failures and later calls go
+    # straight to a direct fetch
+    def scrape_during_outage() -> None:
+        outage_tool = ScrapeTool(
+            settings,
+            session=OutageSession(page_bytes=64 * 1024, timeout_seconds=0.02),
+            breaker=CircuitBreaker("scrape.do", min_calls=5),
+            direct_fallback=True,
+        )
+        for n in range(40):
+            outage_tool._run(url=f"https://example.com/outage/{n}")
+
+    # Model serialization
+    report = ResearchReport(
+        metadata=ReportMetadata(title="Benchmark Report", topic="benchmarks"),
+        sections=[
+            ReportSection(
+                section_type=section_type,
+                title=section_type.value.replace("_", " ").title(),
+                content="Paragraph of report content. " * 80,
+                order=order,
+            )
+            for order, section_type in enumerate(SectionType)
+        ],
+    )
+    result = ResearchResult(
+        topic="benchmarks",
+        findings=[
+            ResearchFinding(
+                content=f"Finding {idx}",
+                phase=ResearchPhase.RESEARCH,
+                sources=[
+                    ResearchSource(title=f"Source {n}", url=f"https://example.com/{idx}/{n}")
+                    for n in range(3)
+                ],
+            )
+            for idx in range(50)
+        ],
+    )
+
+    # Citation checks: 200 reports citing 20 URLs each, half shared between
+    # reports and a quarter seen by the run; a fresh cache per batch
+    citation_batch = [
+        (
+            f"report-{idx}",
+            "\n".join(
+                f"- [Source {n}](https://site{n % 7}.example/{'shared' if n % 2 else idx}/{n})"
+                for n in range(20)
+            ),
+            [f"https://site{n % 7}.example/{idx}/{n}" for n in range(0, 20, 4)],
+        )
+        for idx in range(200)
+    ]
+    citation_session = StubSession(page_bytes=0)
+
+    def verify_citation_batch() -> None:
+        checker = UrlChecker(session=citation_session, requests_per_host=0)
+        CitationVerifier(checker).verify_batch(citation_batch)
+
+    # Plan-then-execute: 8 searches and their top pages in two parallel bursts
+    query_plan = QueryPlan(
+        queries=[PlannedQuery(query=f"benchmark query {idx}") for idx in range(8)],
+    )
+
+    def execute_query_plan() -> None:
+        tools = [
+            TavilySearchTool(settings, client=StubTavilyClient(), sources=SourceStore()),
+            ScrapeTool(settings, session=StubSession(page_bytes=256 * 1024)),
+        ]
+        PlanExecutor(tools).execute(query_plan).to_prompt()
+
+    # Report phase with 50 ms per LLM call: about one call's latency when the
+    # sections are drafted concurrently, six when drafted one by one
+    section_llm = ReplayLLM(
+        FixtureStore(workdir / "sections"),
+        latency=FixedLatency(0.05),
+        fallback_completion="Section text citing [a source](https://example.com/a). " * 40,
+    )
+    section_material = [
+        (phase, "Phase output with findings and https://example.com/source. " * 60)
+        for phase in ("Planning", "Research", "Analysis", "Review")
+    ]
+    parallel_drafter = SectionDrafter(section_llm)
+    serial_drafter = SectionDrafter(section_llm, max_workers=1)
+
+    # Source digest of 60 fetched pages (~25k chars each) with 50 ms per LLM
+    # call: map batches and merge levels run concurrently
+    digest_documents = [
+        SourceDocument(
+            source=f"https://example.com/page-{n}",
+            text="\n\n".join(
+                f"Paragraph {p} of page {n} with facts and figures. " * 12 for p in range(40)
+            ),
+        )
+        for n in range(60)
+    ]
+    digester = MapReduceDigester(
+        ReplayLLM(
+            FixtureStore(workdir / "digest"),
+            latency=FixedLatency(0.05),
+            fallback_completion=(
+                "### source\nSummary: condensed.\n- fact (https://example.com/a)\n" * 10
+            ),
+        ),
+    )
+
+    def serialize_models() -> None:
+        ResearchReport.model_validate_json(report.model_dump_json())
+        ResearchResult.model_validate_json(result.model_dump_json())
+        report.to_markdown()
+
+    def build_crew() -> None:
+        (
+            ResearchCrewBuilder(llm)
+            .with_tools(tool_provider.get_tools())
+            .with_max_iterations(settings.max_iterations)
+            .with_verbose(False)
+            .with_output_file(str(workdir / "crew.md"))
+            .for_topic("Benchmarking multi-agent research pipelines")
+            .build()
+        )
+
+    template = CrewTemplate(llm, max_iterations=settings.max_iterations)
+
+    def build_crew_from_template() -> None:
+        (
+            ResearchCrewBuilder(llm)
+            .with_tools(tool_provider.get_tools())
+            .with_verbose(False)
+            .with_output_file(str(workdir / "crew.md"))
+            .with_template(template)
+            .for_topic("Benchmarking multi-agent research pipelines")
+            .build()
+        )
+
+    service = ResearchService(settings, tool_provider=tool_provider, llm=llm)
+
+    def execute_research(
+        profile: str = "standard", profiler: Optional[PipelineProfiler] = None
+    ) -> None:
+        output_file = workdir / "report.md"
+        output_file.unlink(missing_ok=True)
+        with contextlib.redirect_stdout(io.StringIO()), profiler or contextlib.nullcontext():
+            service.execute_research(
+                "Benchmarking multi-agent research pipelines",
+                output_file=str(output_file),
+                on_progress=profiler.on_progress if profiler else None,
+                profile=profile,
+            )
+
+    return [
+        Benchmark(
+            "tavily_format_20_results",
+            lambda: search_tool._run(query="benchmark query", max_results=20),
+            iterations=500,
+        ),
+        Benchmark(
+            "tavily_compact_20_results",
+            lambda: compact_search_tool._run(query="benchmark query", max_results=20),
+            iterations=500,
+        ),
+        Benchmark(
+            "tavily_raw_content_20_results",
+            lambda: raw_search_tool._run(query="benchmark query", max_results=20),
+            iterations=200,
+        ),
+        Benchmark(
+            "scrape_postprocess_5mb",
+            lambda: scrape_tool._run(url="https://example.com/large"),
+            iterations=30,
+        ),
+        # Same peak memory as the 5 MB page: reading stops at the text budget
+        Benchmark(
+            "scrape_postprocess_50mb",
+            lambda: large_scrape_tool._run(url="https://example.com/huge"),
+            iterations=30,
+        ),
+        # Page without text: reading stops at the byte cap
+        Benchmark(
+            "scrape_markup_only_5mb",
+            lambda: markup_scrape_tool._run(url="https://example.com/scripts"),
+            iterations=10,
+        ),
+        # 300-page PDF (needs the pdf extra): parsing stops once the budget is met
+        Benchmark(
+            "scrape_pdf_300_pages",
+            lambda: pdf_scrape_tool._run(url="https://example.com/report.pdf"),
+            iterations=30,
+        ),
+        Benchmark("plan_execute_8_queries", execute_query_plan, iterations=50),
+        Benchmark(
+            "draft_sections_parallel",
+            lambda: parallel_drafter.draft("benchmarks", section_material),
+            iterations=20,
+        ),
+        Benchmark(
+            "draft_sections_serial",
+            lambda: serial_drafter.draft("benchmarks", section_material),
+            iterations=10,
+        ),
+        Benchmark(
+            "digest_60_sources",
+            lambda: digester.digest("benchmarks", digest_documents),
+            iterations=5,
+        ),
+        Benchmark("scrape_outage_40_pages_breaker", scrape_during_outage, iterations=10),
+        Benchmark("citation_batch_200_reports", verify_citation_batch, iterations=20),
+        Benchmark("model_serialization", serialize_models, iterations=200),
+        Benchmark("crew_build", build_crew, iterations=30),
+        Benchmark("crew_build_from_template", build_crew_from_template, iterations=30),
+        Benchmark("execute_research_stubbed", execute_research, iterations=10, warmup=1),
+        Benchmark(
+            "execute_research_fast_profile",
+            lambda: execute_research("fast"),
+            iterations=10,
+            warmup=1,
+        ),
+        # Stack sampling every 5 ms, profile files written on each run
+        Benchmark(
+            "execute_research_profiled",
+            lambda: execute_research(profiler=PipelineProfiler(workdir / "profile")),
+            iterations=10,
+            warmup=1,
+        ),
+    ]
+
+
+def main() -> None:
+    """Run the suite and exit non-zero on regressions."""
+    parser = argparse.ArgumentParser(description="research-bot benchmark suite")
+    parser.add_argument("-k", "--filter", default="", help="Only run benchmarks containing this")
+    parser.add_argument("--iterations", type=int, help="Override iterations per benchmark")
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        default=DEFAULT_BASELINE,
+        help=f"Baseline file (default: {DEFAULT_BASELINE.name})",
+    )
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="Store these results as the new baseline",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="Allowed growth before flagging a regression (default: 0.25 = 25%%)",
+    )
+    args = parser.parse_args()
+
+    print(f"research-bot {research_bot.__version__} benchmarks - {datetime.now():%Y-%m-%d %H:%M}")
+    print(HEADER)
+    results = []
+    with tempfile.TemporaryDirectory(prefix="research-bot-bench-") as workdir:
+        benchmarks = [b for b in build_benchmarks(Path(workdir)) if args.filter in b.name]
+        for benchmark in benchmarks:
+            result = run_benchmark(benchmark, iterations=args.iterations)
+            results.append(result)
+            print(result.format_row(), flush=True)
+
+    if args.save_baseline:
+        save_baseline(args.baseline, results, research_bot.__version__)
+        print(f"\nBaseline saved to {args.baseline}")
+        return
+
+    baseline = load_baseline(args.baseline)
+    if not baseline:
+        print(f"\nNo baseline at {args.baseline}; run with --save-baseline to create one.")
+        return
+
+    regressions = find_regressions(results, baseline, args.tolerance)
+    if regressions:
+        print(f"\nRegressions vs baseline (tolerance {args.tolerance:.0%}):")
+        for regression in regressions:
+            print(f"  - {regression}")
+        sys.exit(1)
+    print(f"\nNo regressions vs baseline (tolerance {args.tolerance:.0%}).")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""
+Job scheduling simulation.
+
+Queues a nightly batch of jobs for one tenant, then submits interactive
+jobs from two other tenants while the batch runs, and lets worker threads
+drain the queue against a stub service whose jobs sleep for a fixed time.
+Prints queue wait percentiles per class under first-in-first-out order and
+under the priority scheduler, then with a running limit for the batch
+tenant and with a low provider budget.
+
+Usage:
+    python benchmarks/scheduling.py [--backend redis|sqlite] [--batch 60] [--interactive 20]
+"""
+
+import argparse
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, List, Mapping, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from cluster import SleepingService  # noqa: E402
+
+from research_bot.distributed import LocalRedis, RedisJobQueue  # noqa: E402
+from research_bot.models.job import JobPriority, ResearchJob  # noqa: E402
+from research_bot.services.job_queue import JobQueue, QueueBackend  # noqa: E402
+from research_bot.services.scheduler import (  # noqa: E402
+    JobScheduler,
+    SchedulingPolicy,
+    wait_summary,
+)
+from research_bot.services.worker import ResearchWorker  # noqa: E402
+
+WORKERS = 2
+CONCURRENCY = 2
+
+
+class FifoScheduler(JobScheduler):
+    """Baseline: the oldest queued job first, whatever its class or tenant."""
+
+    def select(
+        self,
+        candidates: Iterable[ResearchJob],
+        running_by_tenant: Mapping[str, int],
+        now: Optional[datetime] = None,
+    ) -> Optional[ResearchJob]:
+        return min(candidates, key=lambda job: job.created_at, default=None)
+
+
+def open_queue(backend: str, path: Path, scheduler: JobScheduler) -> QueueBackend:
+    if backend == "redis":
+        return RedisJobQueue(LocalRedis(), scheduler=scheduler)
+    return JobQueue(str(path), scheduler=scheduler)
+
+
+def simulate(args: argparse.Namespace, workdir: Path, name: str, scheduler: JobScheduler) -> None:
+    """Run one scenario and print its wait times per class."""
+    queue = open_queue(args.backend, workdir / f"{name}.db", scheduler)
+    for index in range(args.batch):
+        queue.submit(f"nightly report {index}", priority=JobPriority.BATCH, tenant="nightly")
+
+    workers = [
+        ResearchWorker(
+            SleepingService(args.job_seconds),  # type: ignore[arg-type]
+            queue,
+            output_dir=workdir / "reports",
+            concurrency=CONCURRENCY,
+            poll_interval=0.005,
+            worker_id=f"worker-{index}",
+        )
+        for index in range(WORKERS)
+    ]
+    threads = [threading.Thread(target=worker.run, kwargs={"drain": True}) for worker in workers]
+    for thread in threads:
+        thread.start()
+    # Ad-hoc requests keep arriving while the batch runs
+    for index in range(args.interactive):
+        time.sleep(args.job_seconds)
+        tenant = ("sales", "support")[index % 2]
+        queue.submit(f"ad-hoc question {index}", priority=JobPriority.INTERACTIVE, tenant=tenant)
+    for thread in threads:
+        thread.join()
+
+    for waits in wait_summary(queue.list_jobs(limit=args.batch + args.interactive)):
+        if not waits.started:
+            continue
+        print(
+            f"{name:<22} {waits.priority.value:<12} {waits.started:>5} "
+            f"{waits.wait_seconds.p50:>8.2f} {waits.wait_seconds.p90:>8.2f} "
+            f"{waits.wait_seconds.p99:>8.2f}",
+            flush=True,
+        )
+
+
+def main() -> None:
+    """Run every scenario and print the comparison."""
+    parser = argparse.ArgumentParser(description="research-bot job scheduling simulation")
+    parser.add_argument(
+        "--backend",
+        choices=("redis", "sqlite"),
+        default="redis",
+        help="Queue backend (default: redis, simulated by LocalRedis)",
+    )
+    parser.add_argument(
+        "--batch", type=int, default=60, help="Batch jobs queued up front (default: 60)"
+    )
+    parser.add_argument(
+        "--interactive",
+        type=int,
+        default=20,
+        help="Interactive jobs submitted during the batch (default: 20)",
+    )
+    parser.add_argument(
+        "--job-seconds",
+        type=float,
+        default=0.05,
+        help="Duration of each stub job (default: 0.05)",
+    )
+    args = parser.parse_args()
+
+    # Aging is scaled to the simulation: a batch job is promoted after the
+    # time of ~10 rounds of jobs
+    aging = args.job_seconds * 10
+    scenarios: List[tuple] = [
+        ("fifo", FifoScheduler()),
+        ("priority", JobScheduler(SchedulingPolicy(aging_seconds=aging))),
+        (
+            "priority+tenant-limit",
+            JobScheduler(SchedulingPolicy(aging_seconds=aging, tenant_limits={"nightly": 2})),
+        ),
+        (
+            "priority+low-budget",
+            # A provider at 30% of its budget: batch jobs wait until aged
+            JobScheduler(SchedulingPolicy(aging_seconds=aging), headroom=lambda: {"tavily": 0.3}),
+        ),
+    ]
+    print(f"{'scenario':<22} {'class':<12} {'jobs':>5} {'p50 s':>8} {'p90 s':>8} {'p99 s':>8}")
+    with tempfile.TemporaryDirectory(prefix="research-bot-scheduling-") as workdir:
+        for name, scheduler in scenarios:
+            simulate(args, Path(workdir), name, scheduler)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+CLI startup benchmark.
+
+Runs the ``research-bot`` entry point under ``python -X importtime`` and
+fails if heavy dependencies are imported on the light paths (``--help`` and
+argument errors) or if cumulative import time exceeds the budget.
+
+Usage:
+    python benchmarks/startup.py [--budget-ms 250] [--runs 5]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+from dataclasses import dataclass
+from typing import Dict, List, Sequence
+
+# Top-level packages that must only load when a pipeline actually executes
+HEAVY_MODULES = (
+    "crewai",
+    "litellm",
+    "tavily",
+    "requests",
+    "pydantic_settings",
+)
+
+# (label, CLI arguments) for each light path guarded by the benchmark
+SCENARIOS = (
+    ("help", ["--help"]),
+    ("usage-error", []),
+)
+
+
+@dataclass
+class ImportProfile:
+    """Parsed ``-X importtime`` output for one interpreter run."""
+
+    # Cumulative microseconds of imports made directly by the interpreter
+    # (not nested inside another import), keyed by module name
+    top_level_us: Dict[str, int]
+    # Every module imported, at any nesting depth
+    modules: List[str]
+
+    @property
+    def total_ms(self) -> float:
+        """Cumulative import time of all top-level imports in milliseconds."""
+        return sum(self.top_level_us.values()) / 1000
+
+    def heavy_imports(self) -> List[str]:
+        """Return the heavy top-level packages that were imported."""
+        return sorted({name.split(".")[0] for name in self.modules} & set(HEAVY_MODULES))
+
+
+def profile_imports(cli_args: Sequence[str]) -> ImportProfile:
+    """Run the CLI with ``-X importtime`` and parse its import table."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "research_bot", *cli_args],
+        capture_output=True,
+        text=True,
+    )
+    top_level: Dict[str, int] = {}
+    modules: List[str] = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative_field, name_field = line[len("import time:"):].split("|")
+        if not cumulative_field.strip().isdigit():
+            continue  # header row
+        name = name_field.strip()
+        modules.append(name)
+        # Nested imports are indented by two extra spaces per level
+        if len(name_field) - len(name_field.lstrip()) == 1:
+            top_level[name] = int(cumulative_field)
+    return ImportProfile(top_level_us=top_level, modules=modules)
+
+
+def main() -> None:
+    """Run the startup benchmark and exit non-zero on regressions."""
+    parser = argparse.ArgumentParser(description="research-bot CLI startup benchmark")
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=250.0,
+        help="Maximum median cumulative import time per scenario (default: 250)",
+    )
+    parser.add_argument(
+        "--runs",
+        type=int,
+        default=5,
+        help="Interpreter runs per scenario (default: 5)",
+    )
+    args = parser.parse_args()
+
+    failed = False
+    for label, cli_args in SCENARIOS:
+        profiles = [profile_imports(cli_args) for _ in range(args.runs)]
+        median_ms = statistics.median(p.total_ms for p in profiles)
+        heavy = profiles[-1].heavy_imports()
+
+        status = "ok"
+        if heavy or median_ms > args.budget_ms:
+            status = "FAIL"
+            failed = True
+
+        print(f"{label:<12} median import time {median_ms:8.1f} ms  [{status}]")
+        if heavy:
+            print(f"{'':<12} heavy modules imported: {', '.join(heavy)}")
+
+    if failed:
+        print(f"\nStartup regression (budget {args.budget_ms:.0f} ms, no heavy imports).")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -16,16 +16,43 @@ Architecture:
 - tools/      - Research tool implementations
 - services/   - Orchestration layer (Strategy Pattern)
 - config/     - Settings management
+
+Public names are imported lazily so that light entry points (``--help``,
+argument errors, job submission) do not pay for importing CrewAI and the
+LLM stack.
 """
 
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
 __version__ = "0.1.0"
 __author__ = "Research Bot Team"
 
-from research_bot.config import Settings
-from research_bot.services import ResearchService
+if TYPE_CHECKING:
+    from research_bot.config import Settings
+    from research_bot.services import ResearchService
+
+_LAZY_EXPORTS = {
+    "Settings": "research_bot.config",
+    "ResearchService": "research_bot.services",
+}
 
 __all__ = [
     "Settings",
     "ResearchService",
     "__version__",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import public names on first access (PEP 562)."""
+    module_path = _LAZY_EXPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
@@ -0,0 +1,10 @@
+"""HTTP API module."""
+
+from research_bot.api.jobs import JobManager, JobQueueFullError
+from research_bot.api.server import ResearchAPIServer
+
+__all__ = [
+    "JobManager",
+    "JobQueueFullError",
+    "ResearchAPIServer",
+]
@@ -0,0 +1,264 @@
+"""In-process job management for the HTTP API."""
+
+import asyncio
+import logging
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, Optional
+
+from research_bot.models.job import JobPriority, JobStatus, ResearchJob
+from research_bot.models.research import PhaseUpdate
+from research_bot.services.scheduler import JobScheduler
+
+if TYPE_CHECKING:
+    from research_bot.services.research_service import ResearchService
+
+logger = logging.getLogger(__name__)
+
+# Finished jobs kept in memory for status/report lookups
+MAX_FINISHED_JOBS = 1000
+
+# Seconds before jobs the scheduler held back (tenant limits, provider
+# budgets) are offered a free slot again
+DISPATCH_RETRY_SECONDS = 1.0
+
+
+class JobQueueFullError(Exception):
+    """Raised when the number of unfinished jobs reaches the limit."""
+
+
+@dataclass
+class JobEvent:
+    """A server-sent event in a job's progress stream."""
+
+    id: int
+    event: str
+    data: Dict[str, Any]
+
+
+@dataclass
+class _JobRecord:
+    """Mutable state of one job. Only touched from the event loop thread."""
+
+    job: ResearchJob
+    deadline: Optional[float] = None
+    profile: Optional[str] = None
+    # Handed to the thread pool (its RUNNING status follows from the thread)
+    dispatched: bool = False
+    events: List[JobEvent] = field(default_factory=list)
+    changed: asyncio.Event = field(default_factory=asyncio.Event)
+
+
+class JobManager:
+    """
+    Runs research jobs on a shared service with a bounded thread pool.
+
+    All bookkeeping happens on the event loop; pipeline threads hand results
+    back with ``call_soon_threadsafe``. Each job keeps an append-only event
+    log so progress streams can replay history and then follow live updates.
+    Jobs wait in the manager until a pipeline slot frees up; the
+    ``JobScheduler`` then picks which one runs (by class, tenant and age).
+    """
+
+    def __init__(
+        self,
+        service: "ResearchService",
+        output_dir: str | Path = "reports",
+        concurrency: int = 2,
+        max_pending: int = 100,
+        scheduler: Optional[JobScheduler] = None,
+    ) -> None:
+        """
+        Initialize the manager.
+
+        Args:
+            service: Research service shared by all jobs.
+            output_dir: Directory for job reports.
+            concurrency: Maximum number of pipelines running at once.
+            max_pending: Maximum number of unfinished (queued + running) jobs.
+            scheduler: Picks the job a free slot runs (default: by class and age).
+        """
+        self._service = service
+        self._output_dir = Path(output_dir)
+        self._concurrency = concurrency
+        self._max_pending = max_pending
+        self._scheduler = scheduler or JobScheduler()
+        self._retry: Optional[asyncio.TimerHandle] = None
+        self._executor = ThreadPoolExecutor(
+            max_workers=concurrency,
+            thread_name_prefix="api-job",
+        )
+        self._jobs: Dict[str, _JobRecord] = {}
+
+    def shutdown(self) -> None:
+        """Stop accepting work and wait for running pipelines."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def get(self, job_id: str) -> Optional[ResearchJob]:
+        """Return a job by id, or None if unknown."""
+        record = self._jobs.get(job_id)
+        return record.job if record else None
+
+    def read_report(self, job_id: str) -> Optional[str]:
+        """Return the report of a succeeded job, or None."""
+        job = self.get(job_id)
+        if job is None or job.status != JobStatus.SUCCEEDED or not job.output_file:
+            return None
+        return Path(job.output_file).read_text(encoding="utf-8")
+
+    def submit(
+        self,
+        topic: str,
+        deadline: Optional[float] = None,
+        profile: Optional[str] = None,
+        priority: JobPriority = JobPriority.STANDARD,
+        tenant: str = "default",
+    ) -> ResearchJob:
+        """
+        Queue a job for execution. Must be called from the event loop.
+
+        Args:
+            topic: Research topic.
+            deadline: Time limit for the run in seconds (default: settings).
+            profile: Pipeline profile name (default: settings).
+            priority: Scheduling class of the job.
+            tenant: Team or client the job runs for (fair share, limits).
+
+        Raises:
+            JobQueueFullError: If too many jobs are unfinished.
+        """
+        pending = sum(1 for r in self._jobs.values() if not r.job.status.is_terminal)
+        if pending >= self._max_pending:
+            raise JobQueueFullError(f"{pending} jobs pending, try again later")
+
+        self._output_dir.mkdir(parents=True, exist_ok=True)
+        job_id = uuid.uuid4().hex[:12]
+        job = ResearchJob(
+            id=job_id,
+            topic=topic,
+            output_file=str(self._output_dir / f"{job_id}.md"),
+            priority=priority,
+            tenant=tenant,
+        )
+        record = _JobRecord(job=job, deadline=deadline, profile=profile)
+        self._jobs[job_id] = record
+        self._publish(record, "status", {"status": job.status.value})
+        self._prune()
+        self._dispatch()
+        return job
+
+    def _dispatch(self) -> None:
+        """Start scheduled jobs while pipeline slots are free."""
+        if self._retry is not None:
+            self._retry.cancel()
+            self._retry = None
+        loop = asyncio.get_running_loop()
+        while True:
+            waiting = [r for r in self._jobs.values() if not r.dispatched]
+            running: Dict[str, int] = {}
+            for r in self._jobs.values():
+                if r.dispatched and not r.job.status.is_terminal:
+                    running[r.job.tenant] = running.get(r.job.tenant, 0) + 1
+            if not waiting or sum(running.values()) >= self._concurrency:
+                return
+            job = self._scheduler.select([r.job for r in waiting], running)
+            if job is None:
+                # Held back; offer the slot again once limits may have eased
+                self._retry = loop.call_later(DISPATCH_RETRY_SECONDS, self._dispatch)
+                return
+            record = self._jobs[job.id]
+            record.dispatched = True
+            loop.run_in_executor(self._executor, self._run, record, loop)
+
+    async def events(
+        self,
+        job_id: str,
+        after: int = -1,
+        keepalive: float = 15.0,
+    ) -> AsyncIterator[Optional[JobEvent]]:
+        """
+        Yield a job's events, replaying history then following live updates.
+
+        Yields None when ``keepalive`` seconds pass without an event so the
+        caller can keep the connection open. Ends after the job finishes.
+
+        Args:
+            job_id: Job to follow.
+            after: Only yield events with a greater id (for Last-Event-ID).
+            keepalive: Seconds between keepalive ticks.
+        """
+        record = self._jobs.get(job_id)
+        if record is None:
+            return
+
+        index = after + 1
+        while True:
+            changed = record.changed
+            while index < len(record.events):
+                yield record.events[index]
+                index += 1
+            if record.job.status.is_terminal:
+                return
+            try:
+                await asyncio.wait_for(changed.wait(), timeout=keepalive)
+            except asyncio.TimeoutError:
+                yield None
+
+    def _run(self, record: _JobRecord, loop: asyncio.AbstractEventLoop) -> None:
+        """Execute the pipeline on an executor thread."""
+        job = record.job
+        loop.call_soon_threadsafe(self._update, record, JobStatus.RUNNING, {})
+
+        def on_progress(update: PhaseUpdate) -> None:
+            loop.call_soon_threadsafe(
+                self._publish, record, "phase", update.model_dump(mode="json")
+            )
+
+        try:
+            report = self._service.execute_research(
+                job.topic,
+                output_file=job.output_file or f"{job.id}.md",
+                on_progress=on_progress,
+                deadline=record.deadline,
+                profile=record.profile,
+            )
+        except Exception as e:
+            logger.exception("Job failed", extra={"job_id": job.id})
+            loop.call_soon_threadsafe(self._update, record, JobStatus.FAILED, {"error": str(e)})
+            return
+
+        loop.call_soon_threadsafe(
+            self._update,
+            record,
+            JobStatus.SUCCEEDED,
+            {"report_length": len(report)},
+        )
+
+    def _update(
+        self,
+        record: _JobRecord,
+        status: JobStatus,
+        fields: Dict[str, Any],
+    ) -> None:
+        """Apply a status transition and publish it."""
+        now = datetime.now()
+        timestamps = {"started_at": now} if status == JobStatus.RUNNING else {"finished_at": now}
+        record.job = record.job.model_copy(update={"status": status, **timestamps, **fields})
+        self._publish(record, "status", {"status": status.value, **fields})
+        if status.is_terminal:
+            self._dispatch()
+
+    def _publish(self, record: _JobRecord, event: str, data: Dict[str, Any]) -> None:
+        """Append an event and wake up stream readers."""
+        record.events.append(JobEvent(id=len(record.events), event=event, data=data))
+        record.changed.set()
+        record.changed = asyncio.Event()
+
+    def _prune(self) -> None:
+        """Forget the oldest finished jobs beyond ``MAX_FINISHED_JOBS``."""
+        finished = [job_id for job_id, r in self._jobs.items() if r.job.status.is_terminal]
+        for job_id in finished[: max(0, len(finished) - MAX_FINISHED_JOBS)]:
+            del self._jobs[job_id]
@@ -0,0 +1,287 @@
+"""Minimal asyncio HTTP server exposing research jobs."""
+
+import asyncio
+import json
+import logging
+import re
+from http import HTTPStatus
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+from research_bot.api.jobs import JobManager, JobQueueFullError
+from research_bot.config.profiles import PROFILES
+from research_bot.models.job import JobPriority
+
+logger = logging.getLogger(__name__)
+
+MAX_BODY_BYTES = 64 * 1024
+MAX_TOPIC_LENGTH = 1000
+MAX_TENANT_LENGTH = 100
+REQUEST_TIMEOUT_SECONDS = 30.0
+
+_JOB_ROUTE = re.compile(r"^/jobs/(?P<job_id>[0-9a-f]+)(?P<action>/events|/report)?/?$")
+
+
+class BadRequestError(Exception):
+    """Raised for malformed HTTP requests."""
+
+
+class ResearchAPIServer:
+    """
+    HTTP/1.1 front end for a ``JobManager``.
+
+    Endpoints:
+        GET  /health              Liveness check
+        POST /jobs                Submit ``{"topic": "...", "deadline": 300,
+                                  "profile": "fast", "priority": "interactive",
+                                  "tenant": "sales"}`` (all but the topic
+                                  optional), returns 202 + job
+        GET  /jobs/{id}           Job status
+        GET  /jobs/{id}/events    Phase progress as Server-Sent Events
+        GET  /jobs/{id}/report    Finished markdown report
+
+    Implemented on asyncio streams so the API needs no web framework; every
+    response closes the connection.
+    """
+
+    def __init__(self, manager: JobManager, host: str = "127.0.0.1", port: int = 8000) -> None:
+        self._manager = manager
+        self._host = host
+        self._port = port
+
+    async def serve_forever(self) -> None:
+        """Listen for connections until cancelled."""
+        server = await asyncio.start_server(self._handle, self._host, self._port)
+        addresses = ", ".join(str(sock.getsockname()) for sock in server.sockets)
+        logger.info("API server listening on %s", addresses)
+        async with server:
+            await server.serve_forever()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve a single request."""
+        try:
+            method, path, headers, body = await asyncio.wait_for(
+                self._read_request(reader),
+                timeout=REQUEST_TIMEOUT_SECONDS,
+            )
+            await self._dispatch(writer, method, path, headers, body)
+        except BadRequestError as e:
+            await self._send_json(writer, HTTPStatus.BAD_REQUEST, {"error": str(e)})
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+            pass
+        except Exception:
+            logger.exception("Unhandled API error")
+            await self._send_json(
+                writer,
+                HTTPStatus.INTERNAL_SERVER_ERROR,
+                {"error": "internal server error"},
+            )
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _read_request(
+        reader: asyncio.StreamReader,
+    ) -> Tuple[str, str, Dict[str, str], bytes]:
+        """Parse request line, headers and body."""
+        request_line = (await reader.readline()).decode("latin-1").strip()
+        parts = request_line.split(" ")
+        if len(parts) != 3:
+            raise BadRequestError("malformed request line")
+        method, target, _ = parts
+
+        headers: Dict[str, str] = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        try:
+            length = int(headers.get("content-length", "0"))
+        except ValueError:
+            raise BadRequestError("invalid Content-Length")
+        if length < 0:
+            raise BadRequestError("invalid Content-Length")
+        if length > MAX_BODY_BYTES:
+            raise BadRequestError("request body too large")
+        body = await reader.readexactly(length) if length else b""
+
+        return method.upper(), urlsplit(target).path, headers, body
+
+    async def _dispatch(
+        self,
+        writer: asyncio.StreamWriter,
+        method: str,
+        path: str,
+        headers: Dict[str, str],
+        body: bytes,
+    ) -> None:
+        """Route a parsed request to its handler."""
+        if path == "/health" and method == "GET":
+            await self._send_json(writer, HTTPStatus.OK, {"status": "ok"})
+            return
+
+        if path.rstrip("/") == "/jobs":
+            if method != "POST":
+                await self._send_json(writer, HTTPStatus.METHOD_NOT_ALLOWED, {"error": "use POST"})
+                return
+            await self._submit(writer, body)
+            return
+
+        match = _JOB_ROUTE.match(path)
+        if match is None:
+            await self._send_json(writer, HTTPStatus.NOT_FOUND, {"error": "not found"})
+            return
+        if method != "GET":
+            await self._send_json(writer, HTTPStatus.METHOD_NOT_ALLOWED, {"error": "use GET"})
+            return
+
+        job_id, action = match.group("job_id"), match.group("action")
+        job = self._manager.get(job_id)
+        if job is None:
+            await self._send_json(writer, HTTPStatus.NOT_FOUND, {"error": "unknown job"})
+        elif action == "/events":
+            await self._stream_events(writer, job_id, headers)
+        elif action == "/report":
+            report = self._manager.read_report(job_id)
+            if report is None:
+                await self._send_json(
+                    writer,
+                    HTTPStatus.CONFLICT,
+                    {"error": f"job is {job.status.value}", "status": job.status.value},
+                )
+            else:
+                await self._send(
+                    writer,
+                    HTTPStatus.OK,
+                    report.encode("utf-8"),
+                    "text/markdown; charset=utf-8",
+                )
+        else:
+            await self._send_json(writer, HTTPStatus.OK, job.model_dump(mode="json"))
+
+    async def _submit(self, writer: asyncio.StreamWriter, body: bytes) -> None:
+        """Handle POST /jobs."""
+        try:
+            payload = json.loads(body or b"{}")
+        except json.JSONDecodeError:
+            raise BadRequestError("body must be JSON")
+
+        topic = payload.get("topic") if isinstance(payload, dict) else None
+        if not isinstance(topic, str) or not topic.strip():
+            raise BadRequestError("'topic' must be a non-empty string")
+        if len(topic) > MAX_TOPIC_LENGTH:
+            raise BadRequestError(f"'topic' exceeds {MAX_TOPIC_LENGTH} characters")
+
+        deadline = payload.get("deadline")
+        if deadline is not None and (
+            isinstance(deadline, bool) or not isinstance(deadline, (int, float)) or deadline <= 0
+        ):
+            raise BadRequestError("'deadline' must be a positive number of seconds")
+
+        profile = payload.get("profile")
+        if profile is not None and (
+            not isinstance(profile, str) or profile.strip().lower() not in PROFILES
+        ):
+            raise BadRequestError(f"'profile' must be one of: {', '.join(PROFILES)}")
+
+        priorities = [priority.value for priority in JobPriority]
+        priority = payload.get("priority", JobPriority.STANDARD.value)
+        if priority not in priorities:
+            raise BadRequestError(f"'priority' must be one of: {', '.join(priorities)}")
+
+        tenant = payload.get("tenant", "default")
+        if not isinstance(tenant, str) or not tenant.strip() or len(tenant) > MAX_TENANT_LENGTH:
+            raise BadRequestError(
+                f"'tenant' must be a non-empty string of at most {MAX_TENANT_LENGTH} characters"
+            )
+
+        try:
+            job = self._manager.submit(
+                topic.strip(),
+                deadline=deadline,
+                profile=profile,
+                priority=JobPriority(priority),
+                tenant=tenant.strip(),
+            )
+        except JobQueueFullError as e:
+            await self._send_json(writer, HTTPStatus.TOO_MANY_REQUESTS, {"error": str(e)})
+            return
+
+        await self._send_json(
+            writer,
+            HTTPStatus.ACCEPTED,
+            job.model_dump(mode="json"),
+            extra_headers={"Location": f"/jobs/{job.id}"},
+        )
+
+    async def _stream_events(
+        self,
+        writer: asyncio.StreamWriter,
+        job_id: str,
+        headers: Dict[str, str],
+    ) -> None:
+        """Handle GET /jobs/{id}/events as a Server-Sent Events stream."""
+        try:
+            after = int(headers.get("last-event-id", "-1"))
+        except ValueError:
+            after = -1
+
+        self._write_head(
+            writer,
+            HTTPStatus.OK,
+            {"Content-Type": "text/event-stream", "Cache-Control": "no-cache"},
+        )
+        async for event in self._manager.events(job_id, after=after):
+            if event is None:
+                writer.write(b": keepalive\n\n")
+            else:
+                writer.write(
+                    f"id: {event.id}\nevent: {event.event}\n"
+                    f"data: {json.dumps(event.data)}\n\n".encode()
+                )
+            await writer.drain()
+
+    @staticmethod
+    def _write_head(
+        writer: asyncio.StreamWriter,
+        status: HTTPStatus,
+        headers: Dict[str, str],
+    ) -> None:
+        """Write the status line and headers."""
+        lines = [f"HTTP/1.1 {status.value} {status.phrase}", "Connection: close"]
+        lines.extend(f"{name}: {value}" for name, value in headers.items())
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+
+    async def _send(
+        self,
+        writer: asyncio.StreamWriter,
+        status: HTTPStatus,
+        body: bytes,
+        content_type: str,
+        extra_headers: Optional[Dict[str, str]] = None,
+    ) -> None:
+        """Write a complete response."""
+        headers = {"Content-Type": content_type, "Content-Length": str(len(body))}
+        headers.update(extra_headers or {})
+        self._write_head(writer, status, headers)
+        writer.write(body)
+        await writer.drain()
+
+    async def _send_json(
+        self,
+        writer: asyncio.StreamWriter,
+        status: HTTPStatus,
+        payload: Any,
+        extra_headers: Optional[Dict[str, str]] = None,
+    ) -> None:
+        """Write a JSON response."""
+        await self._send(
+            writer,
+            status,
+            json.dumps(payload).encode("utf-8"),
+            "application/json",
+            extra_headers,
+        )
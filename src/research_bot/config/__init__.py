@@ -1,5 +1,6 @@
 """Configuration module."""
 
+from research_bot.config.profiles import PROFILES, PipelineProfile, get_profile
 from research_bot.config.settings import Settings
 
-__all__ = ["Settings"]
+__all__ = ["PROFILES", "PipelineProfile", "Settings", "get_profile"]
@@ -0,0 +1,83 @@
+"""Pipeline profiles - how much of the research pipeline a run uses."""
+
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+from research_bot.models.research import ResearchPhase
+
+# Every phase, in pipeline order
+ALL_PHASES: Tuple[ResearchPhase, ...] = tuple(ResearchPhase)
+
+
+@dataclass(frozen=True)
+class PipelineProfile:
+    """
+    Agent set, iteration cap and source budget of a research run.
+
+    Each phase is run by its own agent (planner, researcher, analyst,
+    director, writer), so ``phases`` also selects the agents. Every profile
+    plans, researches and writes; analysis and review are optional.
+    """
+
+    name: str
+    description: str
+    phases: Tuple[ResearchPhase, ...] = ALL_PHASES
+    # Iterations per research agent (None: settings.max_iterations)
+    max_iterations: Optional[int] = None
+    # Tool calls per run (None: unlimited)
+    max_tool_calls: Optional[int] = None
+
+    def __post_init__(self) -> None:
+        required = (ResearchPhase.PLANNING, ResearchPhase.RESEARCH, ResearchPhase.REPORT)
+        if any(phase not in self.phases for phase in required):
+            raise ValueError(f"Profile {self.name!r} must plan, research and report")
+        if list(self.phases) != sorted(set(self.phases), key=ALL_PHASES.index):
+            raise ValueError(f"Profile {self.name!r} phases must be distinct and in pipeline order")
+        if self.max_iterations is not None and self.max_iterations < 1:
+            raise ValueError(f"Profile {self.name!r} max_iterations must be positive")
+        if self.max_tool_calls is not None and self.max_tool_calls < 0:
+            raise ValueError(f"Profile {self.name!r} max_tool_calls must not be negative")
+
+
+PROFILES: Dict[str, PipelineProfile] = {
+    profile.name: profile
+    for profile in (
+        PipelineProfile(
+            name="fast",
+            description="Planner and researcher feed the writer directly; for interactive requests",
+            phases=(ResearchPhase.PLANNING, ResearchPhase.RESEARCH, ResearchPhase.REPORT),
+            max_iterations=3,
+            max_tool_calls=12,
+        ),
+        PipelineProfile(
+            name="standard",
+            description="All five agents with the configured iteration cap",
+        ),
+        PipelineProfile(
+            name="deep",
+            description="All five agents with a higher iteration cap; for scheduled deep dives",
+            max_iterations=10,
+        ),
+    )
+}
+
+DEFAULT_PROFILE = "standard"
+
+
+def get_profile(name: str) -> PipelineProfile:
+    """
+    Look up a pipeline profile by name.
+
+    Args:
+        name: Profile name (case-insensitive).
+
+    Returns:
+        The profile.
+
+    Raises:
+        ValueError: If no profile has that name.
+    """
+    profile = PROFILES.get(name.strip().lower())
+    if profile is None:
+        raise ValueError(f"Unknown pipeline profile {name!r} (choose from: {', '.join(PROFILES)})")
+    return profile
@@ -1,5 +1,7 @@
 """Application settings loaded from environment variables."""
 
+from typing import Dict, Optional
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -28,11 +30,162 @@ class Settings(BaseSettings):
     writer_temperature: float = 0.7
 
     # Research Configuration
+    # Pipeline profile of runs that request none: fast (planner, researcher
+    # and writer; fewer iterations and tool calls), standard or deep
+    pipeline_profile: str = "standard"
     max_iterations: int = 5
     max_research_rounds: int = 3
     max_sources_per_round: int = 10
     topic_similarity_threshold: float = 0.7
 
+    # Show search results as ids + key sentences; full text via an expand tool
+    compact_search_results: bool = True
+
+    # Build agents once per configuration and copy them for each run
+    reuse_crew_templates: bool = True
+
+    # Tool result caches (shared across runs within one process)
+    search_cache_ttl_seconds: float = 3600.0
+    page_cache_ttl_seconds: float = 86400.0
+    cache_max_entries: int = 1024
+
+    # Circuit breakers per provider (Tavily, scrape.do), shared by all runs:
+    # once breaker_min_calls of the last breaker_window calls ran and at
+    # least breaker_failure_rate of them failed, calls fail fast for
+    # breaker_open_seconds, then one probe call tests recovery. Meanwhile
+    # expired cache entries answer where they exist, and pages are fetched
+    # directly without JavaScript rendering if scrape_direct_fallback is set
+    circuit_breakers: bool = True
+    breaker_window: int = 20
+    breaker_min_calls: int = 5
+    breaker_failure_rate: float = 0.5
+    breaker_open_seconds: float = 30.0
+    scrape_direct_fallback: bool = True
+
+    # Provider requests allowed per minute (0: unknown, not tracked); as a
+    # provider's budget runs low, the job scheduler holds back less urgent jobs
+    tavily_calls_per_minute: float = 0.0
+    scrape_calls_per_minute: float = 0.0
+
+    # URL health: URLs that keep failing (404, paywall, repeated timeouts)
+    # are rejected without a fetch, and search results flag them and list
+    # slow or unreliable domains last. Kept in url_health_path across
+    # restarts (empty: in memory only)
+    url_health: bool = True
+    url_health_path: str = "research_url_health.db"
+    slow_domain_seconds: float = 10.0
+
+    # Bytes of a scraped page read at most (pages are streamed and parsed
+    # incrementally; reading also stops once enough text is extracted)
+    scrape_max_bytes: int = 2 * 1024 * 1024
+
+    # PDF documents (detected by content type or signature) are spooled up
+    # to this size and parsed locally page by page, until the page text
+    # budget is met or pdf_max_pages were read (needs the pdf extra)
+    scrape_max_pdf_bytes: int = 20 * 1024 * 1024
+    pdf_max_pages: int = 50
+
+    # Ask Tavily for result page text too and cache it for the extraction tool
+    search_raw_content: bool = True
+
+    # Fetch the top search hits into the page cache in the background
+    # (0 disables); the per-run cap bounds fetches the agents never use
+    prefetch_top_n: int = 3
+    prefetch_max_per_run: int = 10
+    prefetch_concurrency: int = 4
+
+    # Plan-then-execute: the planner returns a structured query plan whose
+    # searches (and top result pages) are fetched in parallel before the
+    # research agents run, and handed to them as a corpus
+    plan_then_execute: bool = False
+    plan_max_queries: int = 8
+    plan_pages_per_query: int = 1
+    plan_max_pages: int = 8
+    plan_page_chars: int = 3000
+    plan_concurrency: int = 8
+
+    # Condense the fetched corpus (map-reduce LLM summaries) after research
+    # and give the digest to the analysis and review tasks; only runs when
+    # the research phase fetched at least digest_min_sources documents
+    source_digest: bool = False
+    digest_min_sources: int = 20
+    digest_concurrency: int = 8
+    digest_chunk_chars: int = 6000
+    digest_max_chars: int = 8000
+    digest_process_workers: int = 0  # 0: one per CPU core
+
+    # Draft the report sections as concurrent LLM calls instead of one
+    # writer generation; the report phase then takes about as long as its
+    # longest section
+    parallel_sections: bool = False
+    section_concurrency: int = 6
+
+    # Report formats written next to the markdown report (md, json, html, index)
+    report_formats: str = "md"
+
+    # Check the URLs a report cites after writing it (<report>.citations.json);
+    # URLs the run's tools saw need no request, the rest are checked live
+    verify_citations: bool = False
+    citation_check_concurrency: int = 16
+    citation_requests_per_host: float = 2.0
+    citation_timeout_seconds: float = 10.0
+    citation_cache_ttl_seconds: float = 86400.0
+
+    # Run deadline in seconds when execute_research gets none (unset: no deadline)
+    default_deadline_seconds: Optional[float] = None
+
+    # Run history database (empty string disables recording)
+    run_history_path: str = "research_runs.db"
+
+    # LLM pricing used for cost estimates, USD per million tokens
+    llm_prompt_cost_per_million: float = 0.10
+    llm_completion_cost_per_million: float = 0.40
+
+    # Worker mode
+    job_queue_path: str = "research_jobs.db"
+    worker_output_dir: str = "reports"
+    worker_concurrency: int = 2
+    worker_poll_interval: float = 2.0
+
+    # Distributed workers: nodes share the job queue, tool and LLM caches
+    # and throughput metrics through one store, "sqlite" (job_queue_path
+    # and shared_store_path; one machine, or hosts sharing a filesystem
+    # with working SQLite locking) or "redis" (redis_url; needs the redis
+    # extra, memory:// runs an in-process stand-in)
+    shared_store: str = "sqlite"
+    shared_store_path: str = "research_shared.db"
+    redis_url: str = "redis://localhost:6379/0"
+    shared_caches: bool = False
+    llm_cache: bool = False
+    llm_cache_ttl_seconds: float = 86400.0
+    # Worker id in leases and metrics (empty: <hostname>-<pid>)
+    node_id: str = ""
+    # A job whose worker misses heartbeats this long is requeued, at most
+    # job_max_attempts claims in all
+    job_lease_seconds: float = 60.0
+    job_max_attempts: int = 3
+
+    # Job scheduling: a queued job runs after more urgent classes
+    # (interactive, standard, batch), but every job_aging_seconds it waits
+    # promotes it one class. Tenants get free slots in turn (more for a
+    # higher tenant_weights entry) and run at most tenant_max_running jobs
+    # at once (0: no limit; tenant_limits per tenant, as JSON objects).
+    # Standard and batch jobs wait while a provider has less than
+    # standard_headroom_reserve or batch_headroom_reserve of its budget left
+    job_aging_seconds: float = 300.0
+    tenant_max_running: int = 0
+    tenant_limits: Dict[str, int] = {}
+    tenant_weights: Dict[str, float] = {}
+    standard_headroom_reserve: float = 0.2
+    batch_headroom_reserve: float = 0.5
+
+    # HTTP API server
+    api_host: str = "127.0.0.1"
+    api_port: int = 8000
+    api_concurrency: int = 2
+    api_max_pending: int = 100
+    api_output_dir: str = "reports"
+
     # Logging
     log_level: str = "INFO"
     crew_verbose: bool = True
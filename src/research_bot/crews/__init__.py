@@ -1,5 +1,6 @@
 """Crew assembly module."""
 
 from research_bot.crews.research_crew import ResearchCrewBuilder
+from research_bot.crews.template import CrewTemplate
 
-__all__ = ["ResearchCrewBuilder"]
+__all__ = ["CrewTemplate", "ResearchCrewBuilder"]
@@ -1,25 +1,44 @@
 """Research crew builder - Builder Pattern implementation."""
 
-from typing import List, Optional
+import logging
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 from crewai import Agent, Crew, LLM, Process, Task
+from crewai.tasks.task_output import TaskOutput
 from crewai.tools import BaseTool
 
 from research_bot.agents import (
+    AgentFactory,
     AnalystAgentFactory,
     DirectorAgentFactory,
     PlannerAgentFactory,
     ResearcherAgentFactory,
     WriterAgentFactory,
 )
+from research_bot.models.plan import QueryPlan
+from research_bot.models.research import ResearchPhase
 from research_bot.tasks import (
     AnalysisTaskFactory,
     PlanningTaskFactory,
+    QueryPlanTaskFactory,
     ReportTaskFactory,
     ResearchTaskFactory,
     ReviewTaskFactory,
+    TaskFactory,
 )
 
+if TYPE_CHECKING:
+    from research_bot.crews.template import CrewTemplate
+
+logger = logging.getLogger(__name__)
+
+# Runs a query plan and returns the gathered corpus as prompt text
+PlanRunner = Callable[[QueryPlan], str]
+
+# Digests the sources fetched so far (LLM calls attributed to the given
+# agent) and returns the digest as prompt text, or "" to add nothing
+DigestRunner = Callable[[Agent], str]
+
 
 class ResearchCrewBuilder:
     """
@@ -41,6 +60,13 @@ class ResearchCrewBuilder:
         self._verbose: bool = True
         self._output_file: str = "research_report.md"
         self._topic: Optional[str] = None
+        self._task_callback: Optional[Callable[[Any], None]] = None
+        self._template: Optional["CrewTemplate"] = None
+        self._plan_runner: Optional[PlanRunner] = None
+        self._max_planned_queries: int = 8
+        self._report_task: bool = True
+        self._digest_runner: Optional[DigestRunner] = None
+        self._phases: Tuple[ResearchPhase, ...] = tuple(ResearchPhase)
 
         # Built components
         self._agents: List[Agent] = []
@@ -66,86 +92,221 @@ class ResearchCrewBuilder:
         self._output_file = output_file
         return self
 
+    def with_task_callback(self, callback: Callable[[Any], None]) -> "ResearchCrewBuilder":
+        """Set a callback invoked with each task's output as it completes."""
+        self._task_callback = callback
+        return self
+
+    def with_phases(self, phases: Sequence[ResearchPhase]) -> "ResearchCrewBuilder":
+        """
+        Select the pipeline phases (and so the agents) of the crew.
+
+        Args:
+            phases: Phases in pipeline order; must include planning,
+                research and report (see ``PipelineProfile``).
+
+        Raises:
+            ValueError: If a required phase is missing.
+        """
+        required = (ResearchPhase.PLANNING, ResearchPhase.RESEARCH, ResearchPhase.REPORT)
+        if any(phase not in phases for phase in required):
+            raise ValueError("A crew must plan, research and report")
+        self._phases = tuple(phases)
+        return self
+
+    def with_template(self, template: "CrewTemplate") -> "ResearchCrewBuilder":
+        """Reuse prototype agents from a template instead of creating them."""
+        self._template = template
+        return self
+
+    def with_query_plan(self, runner: PlanRunner, max_queries: int = 8) -> "ResearchCrewBuilder":
+        """
+        Enable plan-then-execute mode.
+
+        The planner returns a structured ``QueryPlan``; as soon as it does,
+        ``runner`` gathers its results (without the LLM) and the corpus is
+        added to the research and analysis tasks.
+
+        Args:
+            runner: Executes a plan and returns the corpus as prompt text.
+            max_queries: Maximum number of searches the planner may plan.
+        """
+        self._plan_runner = runner
+        self._max_planned_queries = max_queries
+        return self
+
+    def with_source_digest(self, runner: DigestRunner) -> "ResearchCrewBuilder":
+        """
+        Digest the fetched corpus between research and analysis.
+
+        When the research task completes, ``runner`` condenses the sources
+        fetched so far and the digest is added to the analysis and review
+        tasks.
+
+        Args:
+            runner: Builds the digest; called with the researcher agent.
+        """
+        self._digest_runner = runner
+        return self
+
+    def with_parallel_sections(self) -> "ResearchCrewBuilder":
+        """
+        Leave the report phase to a ``SectionDrafter``.
+
+        The crew ends after the review task; the caller drafts the report
+        sections concurrently from the crew's task outputs. The writer is
+        still built, so it can own the drafting calls.
+        """
+        self._report_task = False
+        return self
+
     def for_topic(self, topic: str) -> "ResearchCrewBuilder":
         """Set the research topic."""
         self._topic = topic
         return self
 
+    def build_agents(self) -> List[Agent]:
+        """
+        Build the pipeline's agents without tasks or a crew.
+
+        Returns:
+            Agents in pipeline order, one per phase (planner, researcher,
+            analyst, director, writer for the full pipeline).
+        """
+        self._build_agents()
+        return list(self._agents)
+
     def _build_agents(self) -> None:
-        """Build all agents using factories."""
-        # Planner agent (no tools)
-        planner_factory = PlannerAgentFactory(self._llm)
-        planner = planner_factory.create()
-
-        # Lead researcher (with tools)
-        researcher_factory = ResearcherAgentFactory(
-            self._llm,
-            research_tools=self._tools,
-            max_iterations=self._max_iterations,
-        )
-        researcher = researcher_factory.create()
-
-        # Market analyst (with tools)
-        analyst_factory = AnalystAgentFactory(
-            self._llm,
-            research_tools=self._tools,
-            max_iterations=self._max_iterations,
-        )
-        analyst = analyst_factory.create()
-
-        # Director (no tools)
-        director_factory = DirectorAgentFactory(self._llm)
-        director = director_factory.create()
-
-        # Writer (no tools)
-        writer_factory = WriterAgentFactory(self._llm)
-        writer = writer_factory.create()
-
-        self._agents = [planner, researcher, analyst, director, writer]
+        """Build the phases' agents using factories, or copy them from the template."""
+        if self._template is not None:
+            self._agents = self._template.agents(self._tools)
+            return
+
+        self._agents = [self._agent_factory(phase).create() for phase in self._phases]
+
+    def _agent_factory(self, phase: ResearchPhase) -> AgentFactory:
+        """Factory of the agent that runs a phase."""
+        # Lead researcher and market analyst (with tools)
+        if phase == ResearchPhase.RESEARCH:
+            return ResearcherAgentFactory(
+                self._llm,
+                research_tools=self._tools,
+                max_iterations=self._max_iterations,
+            )
+        if phase == ResearchPhase.ANALYSIS:
+            return AnalystAgentFactory(
+                self._llm,
+                research_tools=self._tools,
+                max_iterations=self._max_iterations,
+            )
+
+        # Planner, director and writer (no tools)
+        if phase == ResearchPhase.PLANNING:
+            return PlannerAgentFactory(self._llm)
+        if phase == ResearchPhase.REVIEW:
+            return DirectorAgentFactory(self._llm)
+        return WriterAgentFactory(self._llm)
+
+    def _task_factory(self, phase: ResearchPhase, topic: str) -> TaskFactory:
+        """Factory of a phase's task."""
+        if phase == ResearchPhase.PLANNING:
+            # A structured query plan in plan-then-execute mode
+            if self._plan_runner is not None:
+                return QueryPlanTaskFactory(topic, max_queries=self._max_planned_queries)
+            return PlanningTaskFactory(topic)
+        if phase == ResearchPhase.RESEARCH:
+            return ResearchTaskFactory(topic)
+        if phase == ResearchPhase.ANALYSIS:
+            return AnalysisTaskFactory(topic)
+        if phase == ResearchPhase.REVIEW:
+            return ReviewTaskFactory(topic)
+        return ReportTaskFactory(topic, self._output_file)
 
     def _build_tasks(self) -> None:
-        """Build all tasks using factories with proper context chaining."""
+        """Build one task per phase; each task gets all earlier tasks as context."""
         if not self._topic:
             raise ValueError("Topic must be set before building tasks")
 
-        if len(self._agents) != 5:
+        if len(self._agents) != len(self._phases):
             raise ValueError("Agents must be built before tasks")
 
-        planner, researcher, analyst, director, writer = self._agents
-
-        # Task 1: Planning
-        planning_factory = PlanningTaskFactory(self._topic)
-        planning_task = planning_factory.create(agent=planner)
-
-        # Task 2: Research (depends on planning)
-        research_factory = ResearchTaskFactory(self._topic)
-        research_task = research_factory.create(
-            agent=researcher,
-            context=[planning_task],
-        )
-
-        # Task 3: Analysis (depends on planning + research)
-        analysis_factory = AnalysisTaskFactory(self._topic)
-        analysis_task = analysis_factory.create(
-            agent=analyst,
-            context=[planning_task, research_task],
-        )
-
-        # Task 4: Review (depends on all previous)
-        review_factory = ReviewTaskFactory(self._topic)
-        review_task = review_factory.create(
-            agent=director,
-            context=[planning_task, research_task, analysis_task],
-        )
-
-        # Task 5: Report (depends on all previous)
-        report_factory = ReportTaskFactory(self._topic, self._output_file)
-        report_task = report_factory.create(
-            agent=writer,
-            context=[planning_task, research_task, analysis_task, review_task],
-        )
-
-        self._tasks = [planning_task, research_task, analysis_task, review_task, report_task]
+        agents: Dict[ResearchPhase, Agent] = dict(zip(self._phases, self._agents))
+        tasks: Dict[ResearchPhase, Task] = {}
+        for phase in self._phases:
+            if phase == ResearchPhase.REPORT and not self._report_task:
+                continue
+            tasks[phase] = self._task_factory(phase, self._topic).create(
+                agent=agents[phase],
+                context=list(tasks.values()),
+            )
+        self._tasks = list(tasks.values())
+
+        if self._plan_runner is not None:
+            tasks[ResearchPhase.PLANNING].callback = self._corpus_injector(
+                self._plan_runner,
+                [
+                    tasks[phase]
+                    for phase in (ResearchPhase.RESEARCH, ResearchPhase.ANALYSIS)
+                    if phase in tasks
+                ],
+            )
+        if self._digest_runner is not None:
+            # Analysis and review read the digest; without them, the writer
+            later = list(self._phases[self._phases.index(ResearchPhase.RESEARCH) + 1:])
+            readers = [
+                phase for phase in later if phase in (ResearchPhase.ANALYSIS, ResearchPhase.REVIEW)
+            ] or later
+            tasks[ResearchPhase.RESEARCH].callback = self._digest_injector(
+                self._digest_runner,
+                agents[ResearchPhase.RESEARCH],
+                [tasks[phase] for phase in readers if phase in tasks],
+            )
+
+    @staticmethod
+    def _corpus_injector(runner: PlanRunner, tasks: List[Task]) -> Callable[[TaskOutput], None]:
+        """
+        Planning task callback that executes the plan and hands the corpus on.
+
+        Runs on the crew's thread after planning and before the next task,
+        so the corpus is in the research and analysis task descriptions when
+        their prompts are built. Without a valid plan the agents research
+        with their tools as usual.
+        """
+
+        def inject(output: TaskOutput) -> None:
+            plan = output.pydantic
+            if not isinstance(plan, QueryPlan):
+                logger.warning("Planner returned no valid query plan; researching step by step")
+                return
+            try:
+                corpus = runner(plan)
+            except Exception:
+                logger.exception("Query plan execution failed; researching step by step")
+                return
+            for task in tasks:
+                task.description = f"{task.description}\n\n{corpus}"
+
+        return inject
+
+    @staticmethod
+    def _digest_injector(
+        runner: DigestRunner,
+        agent: Agent,
+        tasks: List[Task],
+    ) -> Callable[[TaskOutput], None]:
+        """Research task callback that adds the source digest to later tasks."""
+
+        def inject(output: TaskOutput) -> None:
+            try:
+                digest = runner(agent)
+            except Exception:
+                logger.exception("Source digest failed; continuing without it")
+                return
+            if digest:
+                for task in tasks:
+                    task.description = f"{task.description}\n\n{digest}"
+
+        return inject
 
     def build(self) -> Crew:
         """
@@ -163,9 +324,14 @@ class ResearchCrewBuilder:
         self._build_agents()
         self._build_tasks()
 
-        return Crew(
-            agents=self._agents,
-            tasks=self._tasks,
-            process=Process.sequential,
-            verbose=self._verbose,
-        )
+        crew_kwargs = {
+            "agents": self._agents,
+            "tasks": self._tasks,
+            "process": Process.sequential,
+            "verbose": self._verbose,
+        }
+
+        if self._task_callback is not None:
+            crew_kwargs["task_callback"] = self._task_callback
+
+        return Crew(**crew_kwargs)
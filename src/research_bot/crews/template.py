@@ -0,0 +1,96 @@
+"""Reusable crew templates - build agents once, instantiate per topic."""
+
+import copy
+import threading
+import uuid
+from typing import Any, Dict, List, Optional, Sequence
+
+from crewai import LLM, Agent
+from crewai.tools import BaseTool
+
+from research_bot.models.research import ResearchPhase
+
+
+class CrewTemplate:
+    """
+    Prototype agents for one crew configuration.
+
+    Constructing and validating the CrewAI agents is the same work for
+    every topic; only task descriptions depend on the topic and date. A
+    template builds the agents once (on first use) and hands out cheap
+    per-run copies via ``model_copy``, which skips pydantic validation. Each
+    copy gets this run's tools and fresh per-run state (id, tool results,
+    executor, counters), so copies can execute concurrently.
+
+    Prototypes themselves are never executed.
+    """
+
+    def __init__(
+        self,
+        llm: LLM,
+        max_iterations: Optional[int] = None,
+        phases: Sequence[ResearchPhase] = tuple(ResearchPhase),
+    ) -> None:
+        """
+        Initialize template.
+
+        Args:
+            llm: LLM shared by all agents.
+            max_iterations: Maximum iterations for research agents.
+            phases: Pipeline phases whose agents the template holds.
+        """
+        self._llm = llm
+        self._max_iterations = max_iterations
+        self._phases = tuple(phases)
+        self._prototypes: Optional[List[Agent]] = None
+        self._lock = threading.Lock()
+
+    def agents(self, tools: List[BaseTool]) -> List[Agent]:
+        """
+        Return fresh agents for one run.
+
+        Args:
+            tools: This run's research tools, given to every agent that
+                takes tools.
+
+        Returns:
+            Agents in pipeline order, one per phase.
+        """
+        with self._lock:
+            if self._prototypes is None:
+                # Imported here: the builder uses templates, avoid a cycle
+                from research_bot.crews.research_crew import ResearchCrewBuilder
+
+                builder = ResearchCrewBuilder(self._llm).with_tools(tools).with_phases(self._phases)
+                if self._max_iterations is not None:
+                    builder.with_max_iterations(self._max_iterations)
+                self._prototypes = builder.build_agents()
+
+        return [
+            self._copy_agent(prototype, tools if prototype.tools else None)
+            for prototype in self._prototypes
+        ]
+
+    @staticmethod
+    def _copy_agent(prototype: Agent, tools: Optional[List[BaseTool]]) -> Agent:
+        """Shallow-copy a prototype with independent per-run state."""
+        update: Dict[str, Any] = {
+            "id": uuid.uuid4(),
+            "tools_results": [],
+            "agent_executor": None,
+            "crew": None,
+            "tools_handler": copy.copy(prototype.tools_handler),
+        }
+        if tools is not None:
+            update["tools"] = list(tools)
+
+        agent = prototype.model_copy(update=update)
+
+        # Private state (token counters, tool failures, message history) must
+        # not be shared between runs; the LLM reference is shared on purpose.
+        private = prototype.__pydantic_private__ or {}
+        agent.__pydantic_private__ = {
+            name: value if isinstance(value, LLM) else copy.copy(value)
+            for name, value in private.items()
+        }
+        return agent
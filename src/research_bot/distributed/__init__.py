@@ -0,0 +1,66 @@
+"""
+Distributed execution: workers on several nodes sharing one store.
+
+The job queue, the tool and LLM caches and throughput metrics live in a
+pluggable shared store: SQLite files by default, or any Redis-compatible
+server (``LocalRedis`` stands in for one in tests and benchmarks).
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from research_bot.distributed.cache import SharedResultCache
+    from research_bot.distributed.llm_cache import SharedCacheLLM
+    from research_bot.distributed.metrics import ClusterMetrics, ClusterSummary, NodeStats
+    from research_bot.distributed.queue import RedisJobQueue
+    from research_bot.distributed.store import (
+        KeyValueStore,
+        LocalRedis,
+        RedisLike,
+        SqliteKeyValueStore,
+        create_store,
+    )
+
+# Resolved on first access so the queue CLI doesn't import CrewAI
+_LAZY_EXPORTS = {
+    "KeyValueStore": "research_bot.distributed.store",
+    "RedisLike": "research_bot.distributed.store",
+    "LocalRedis": "research_bot.distributed.store",
+    "SqliteKeyValueStore": "research_bot.distributed.store",
+    "create_store": "research_bot.distributed.store",
+    "RedisJobQueue": "research_bot.distributed.queue",
+    "SharedResultCache": "research_bot.distributed.cache",
+    "SharedCacheLLM": "research_bot.distributed.llm_cache",
+    "ClusterMetrics": "research_bot.distributed.metrics",
+    "ClusterSummary": "research_bot.distributed.metrics",
+    "NodeStats": "research_bot.distributed.metrics",
+}
+
+__all__ = [
+    "KeyValueStore",
+    "RedisLike",
+    "LocalRedis",
+    "SqliteKeyValueStore",
+    "create_store",
+    "RedisJobQueue",
+    "SharedResultCache",
+    "SharedCacheLLM",
+    "ClusterMetrics",
+    "ClusterSummary",
+    "NodeStats",
+]
+
+
+def __getattr__(name: str) -> Any:
+    """Import public names on first access (PEP 562)."""
+    module_path = _LAZY_EXPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
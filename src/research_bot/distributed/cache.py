@@ -0,0 +1,102 @@
+"""Tool result cache shared between nodes through a key-value store."""
+
+import hashlib
+import json
+import logging
+import math
+import time
+from typing import Any, Callable, Hashable, Optional, TypeVar
+
+from research_bot.distributed.store import KeyValueStore
+from research_bot.tools.cache import ResultCache
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def shared_key(namespace: str, key: Hashable) -> str:
+    """Store key of a local cache key (tuples of strings, numbers and booleans)."""
+    canonical = json.dumps(key, sort_keys=True, ensure_ascii=False, default=str)
+    return f"{namespace}:{hashlib.sha256(canonical.encode('utf-8')).hexdigest()[:32]}"
+
+
+class SharedResultCache(ResultCache[T]):
+    """
+    Two-level ``ResultCache``: this process's LRU in front of a shared store.
+
+    Lookups that miss locally are tried in the store (a search or page one
+    node fetched is a hit on every other node) and copied into the local
+    level; writes go to both, with the same TTL. Values must be JSON
+    serializable. The store is best-effort: if it fails, the cache
+    degrades to the local level instead of failing the tool call.
+    Expired values are only kept (for ``get_stale``) locally.
+    """
+
+    def __init__(
+        self,
+        store: KeyValueStore,
+        namespace: str,
+        max_entries: int = 1024,
+        ttl_seconds: float = 3600.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize cache.
+
+        Args:
+            store: Shared key-value store.
+            namespace: Key prefix of this cache in the store.
+            max_entries: Entries kept in the local level.
+            ttl_seconds: Lifetime of an entry in both levels.
+            clock: Monotonic time source of the local level.
+        """
+        super().__init__(max_entries=max_entries, ttl_seconds=ttl_seconds, clock=clock)
+        self._store = store
+        self._namespace = namespace
+
+    def get(self, key: Hashable) -> Optional[T]:
+        """Return the value for ``key`` from either level, or None."""
+        value = super().get(key)
+        if value is not None:
+            return value
+        shared = self._get_shared(key)
+        if shared is None:
+            return None
+        # Counted as a hit: the local miss above was provisional
+        with self._lock:
+            self._misses -= 1
+            self._hits += 1
+        super().set(key, shared)
+        return shared
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Whether ``key`` has a live entry in either level; does not count as a lookup."""
+        return super().__contains__(key) or self._get_shared(key) is not None
+
+    def set(self, key: Hashable, value: T) -> None:
+        """Store ``value`` in both levels."""
+        super().set(key, value)
+        try:
+            self._store.set(
+                shared_key(self._namespace, key),
+                json.dumps(value, ensure_ascii=False),
+                ex=max(1, math.ceil(self._ttl_seconds)),
+            )
+        except Exception:
+            logger.warning(
+                "Shared cache write failed", extra={"cache": self._namespace}, exc_info=True
+            )
+
+    def _get_shared(self, key: Hashable) -> Optional[T]:
+        try:
+            raw = self._store.get(shared_key(self._namespace, key))
+        except Exception:
+            logger.warning(
+                "Shared cache read failed", extra={"cache": self._namespace}, exc_info=True
+            )
+            return None
+        if raw is None:
+            return None
+        value: Any = json.loads(raw)
+        return value
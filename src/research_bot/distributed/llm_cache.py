@@ -0,0 +1,113 @@
+"""LLM completions cached in the shared store."""
+
+import hashlib
+import json
+import logging
+import math
+from typing import Any, Dict
+
+from research_bot.distributed.store import KeyValueStore
+
+try:
+    from crewai.llms.base_llm import BaseLLM
+except ImportError:  # older CrewAI releases have no BaseLLM; subclass LLM itself
+    from crewai import LLM as BaseLLM  # noqa: N811 (one base name for both releases)
+
+logger = logging.getLogger(__name__)
+
+
+def _completion_key(namespace: str, model: str, messages: Any, stop: Any) -> str:
+    """Store key of an LLM request: model, stop words and role/content messages."""
+    if isinstance(messages, str):
+        messages = [{"role": "user", "content": messages}]
+    request: Dict[str, Any] = {
+        "model": model,
+        "stop": stop or [],
+        "messages": [
+            {"role": message.get("role"), "content": message.get("content")}
+            for message in messages
+        ],
+    }
+    canonical = json.dumps(request, sort_keys=True, ensure_ascii=False, default=str)
+    return f"{namespace}:{hashlib.sha256(canonical.encode('utf-8')).hexdigest()[:32]}"
+
+
+class SharedCacheLLM(BaseLLM):
+    """
+    Wraps an LLM and shares its text completions between nodes.
+
+    A request identical to one any node made within ``ttl_seconds`` (same
+    model, stop words and messages) is answered from the store without a
+    model call. Only plain text calls are cached: calls with tools,
+    functions or a response model always go to the model, since their
+    results drive side effects. Cache hits use no tokens and are not
+    reported as LLM usage. The store is best-effort.
+    """
+
+    _inner: Any
+    _store: KeyValueStore
+    _namespace: str
+    _ttl_seconds: int
+
+    def __init__(
+        self,
+        inner: Any,
+        store: KeyValueStore,
+        ttl_seconds: float = 86400.0,
+        namespace: str = "research-bot:llm",
+    ) -> None:
+        """
+        Initialize caching LLM.
+
+        Args:
+            inner: The LLM making the actual calls.
+            store: Shared key-value store.
+            ttl_seconds: How long a completion is reused.
+            namespace: Key prefix of the cache in the store.
+        """
+        super().__init__(model=inner.model)
+        self._inner = inner
+        self._store = store
+        self._namespace = namespace
+        self._ttl_seconds = max(1, math.ceil(ttl_seconds))
+
+    def call(self, messages: Any, *args: Any, **kwargs: Any) -> Any:
+        # CrewAI sets stop words on the agent's LLM; forward them to the real one
+        stop = getattr(self, "stop", None)
+        if stop:
+            self._inner.stop = stop
+
+        cacheable = not args and not any(
+            kwargs.get(name) for name in ("tools", "available_functions", "response_model")
+        )
+        if not cacheable:
+            return self._inner.call(messages, *args, **kwargs)
+
+        key = _completion_key(self._namespace, self.model, messages, stop)
+        try:
+            cached = self._store.get(key)
+        except Exception:
+            logger.warning("LLM cache read failed", exc_info=True)
+            cached = None
+        if cached is not None:
+            return cached.decode("utf-8") if isinstance(cached, bytes) else cached
+
+        completion = self._inner.call(messages, *args, **kwargs)
+        if isinstance(completion, str) and completion.strip():
+            try:
+                self._store.set(key, completion, ex=self._ttl_seconds)
+            except Exception:
+                logger.warning("LLM cache write failed", exc_info=True)
+        return completion
+
+    def supports_function_calling(self) -> bool:
+        return bool(self._inner.supports_function_calling())
+
+    def supports_stop_words(self) -> bool:
+        return bool(self._inner.supports_stop_words())
+
+    def get_context_window_size(self) -> int:
+        return int(self._inner.get_context_window_size())
+
+    def get_token_usage_summary(self) -> Any:
+        return self._inner.get_token_usage_summary()
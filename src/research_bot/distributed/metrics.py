@@ -0,0 +1,165 @@
+"""Throughput metrics aggregated across the worker nodes of a deployment."""
+
+import logging
+import os
+import socket
+import time
+from dataclasses import dataclass, field
+from typing import Callable, List
+
+from research_bot.distributed.store import KeyValueStore, decode_hash
+
+logger = logging.getLogger(__name__)
+
+# Per-minute completion counters are kept this long
+_BUCKET_TTL_SECONDS = 86400
+
+
+@dataclass(frozen=True)
+class NodeStats:
+    """One worker node as last reported."""
+
+    node_id: str
+    alive: bool
+    seen_seconds_ago: float
+    running: int
+    concurrency: int
+    succeeded: int
+    failed: int
+    busy_seconds: float
+
+
+@dataclass(frozen=True)
+class ClusterSummary:
+    """Throughput of all nodes."""
+
+    window_minutes: int
+    jobs_per_minute: float
+    succeeded: int
+    failed: int
+    requeued: int
+    # Share of the live nodes' job slots in use
+    utilization: float
+    nodes: List[NodeStats] = field(default_factory=list)
+
+
+class ClusterMetrics:
+    """
+    Job counters every worker node writes to the shared store.
+
+    Each node keeps a hash of its totals (jobs succeeded and failed, busy
+    seconds, running jobs, last heartbeat) and adds each finished job to a
+    per-minute counter shared by all nodes, so ``summary()`` on any machine
+    sees cluster-wide throughput. Writes are best-effort: a store outage
+    loses metrics, never jobs.
+    """
+
+    def __init__(
+        self,
+        store: KeyValueStore,
+        namespace: str = "research-bot",
+        node_timeout_seconds: float = 60.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Initialize metrics.
+
+        Args:
+            store: Shared key-value store.
+            namespace: Key prefix in the store.
+            node_timeout_seconds: Heartbeat age after which a node counts as dead.
+            clock: Wall-clock time source (shared by all nodes).
+        """
+        self._store = store
+        self._namespace = namespace
+        self._node_timeout_seconds = node_timeout_seconds
+        self._clock = clock
+
+    def _key(self, *parts: str) -> str:
+        return ":".join((self._namespace, "metrics", *parts))
+
+    def node_heartbeat(self, node_id: str, running: int, concurrency: int) -> None:
+        """Report a node as alive with its current load."""
+        try:
+            self._store.hset(self._key("nodes"), node_id, self._clock())
+            self._store.hset(
+                self._key("node", node_id),
+                mapping={"running": running, "concurrency": concurrency},
+            )
+        except Exception:
+            logger.warning("Metrics heartbeat failed", extra={"node_id": node_id}, exc_info=True)
+
+    def record_job(self, node_id: str, succeeded: bool, duration_seconds: float) -> None:
+        """Count a finished job."""
+        bucket = self._key("done", str(int(self._clock() // 60)))
+        try:
+            node = self._key("node", node_id)
+            self._store.hincrbyfloat(node, "succeeded" if succeeded else "failed", 1)
+            self._store.hincrbyfloat(node, "busy_seconds", duration_seconds)
+            self._store.incrbyfloat(bucket, 1)
+            self._store.expire(bucket, _BUCKET_TTL_SECONDS)
+        except Exception:
+            logger.warning("Job metrics write failed", extra={"node_id": node_id}, exc_info=True)
+
+    def record_requeued(self, count: int) -> None:
+        """Count jobs requeued from lost workers."""
+        if count <= 0:
+            return
+        try:
+            self._store.hincrbyfloat(self._key("cluster"), "requeued", count)
+        except Exception:
+            logger.warning("Requeue metrics write failed", exc_info=True)
+
+    def summary(self, window_minutes: int = 15) -> ClusterSummary:
+        """
+        Aggregate all nodes.
+
+        Args:
+            window_minutes: Minutes ``jobs_per_minute`` averages over
+                (the current minute included).
+
+        Returns:
+            Cluster throughput, totals and per-node stats.
+        """
+        now = self._clock()
+        current = int(now // 60)
+        done = 0.0
+        for minute in range(current - window_minutes + 1, current + 1):
+            raw = self._store.get(self._key("done", str(minute)))
+            done += float(raw) if raw is not None else 0.0
+
+        nodes: List[NodeStats] = []
+        seen = decode_hash(self._store.hgetall(self._key("nodes")))
+        for node_id, seen_at in sorted(seen.items()):
+            stats = decode_hash(self._store.hgetall(self._key("node", node_id)))
+            age = now - float(seen_at)
+            nodes.append(
+                NodeStats(
+                    node_id=node_id,
+                    alive=age <= self._node_timeout_seconds,
+                    seen_seconds_ago=age,
+                    running=int(float(stats.get("running", 0))),
+                    concurrency=int(float(stats.get("concurrency", 0))),
+                    succeeded=int(float(stats.get("succeeded", 0))),
+                    failed=int(float(stats.get("failed", 0))),
+                    busy_seconds=float(stats.get("busy_seconds", 0.0)),
+                )
+            )
+
+        live = [node for node in nodes if node.alive]
+        slots = sum(node.concurrency for node in live)
+        cluster = decode_hash(self._store.hgetall(self._key("cluster")))
+        return ClusterSummary(
+            window_minutes=window_minutes,
+            jobs_per_minute=done / window_minutes if window_minutes else 0.0,
+            succeeded=sum(node.succeeded for node in nodes),
+            failed=sum(node.failed for node in nodes),
+            requeued=int(float(cluster.get("requeued", 0))),
+            utilization=sum(node.running for node in live) / slots if slots else 0.0,
+            nodes=nodes,
+        )
+
+
+def default_node_id() -> str:
+    """``<hostname>-<pid>``: unique per worker process."""
+    return f"{socket.gethostname()}-{os.getpid()}"
@@ -0,0 +1,309 @@
+"""Job queue on a Redis-compatible store, for workers on several nodes."""
+
+import logging
+import time
+import uuid
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from research_bot.distributed.store import RedisLike, decode_hash
+from research_bot.models.job import JobPriority, JobStatus, ResearchJob
+from research_bot.services.job_queue import LEASE_EXPIRED_ERROR
+from research_bot.services.scheduler import JobScheduler
+
+logger = logging.getLogger(__name__)
+
+
+class RedisJobQueue:
+    """
+    Durable queue of research jobs in Redis (or ``LocalRedis``).
+
+    Keys, under ``namespace``:
+
+    - ``job:<id>``: hash with the job's fields
+    - ``jobs``: sorted set of all job ids by creation time (for listing)
+    - ``queue:<priority>:<tenant>``: list of queued job ids per class and tenant
+    - ``queues``: hash whose fields name those lists (``<priority>:<tenant>``)
+    - ``processing``: list of claimed job ids
+    - ``leases``: sorted set of claimed job ids by lease expiry
+
+    ``claim()`` shows the ``JobScheduler`` the head of every queue list and
+    leases the job it picks with ZADD NX: adding the lease is the claim,
+    so each job goes to exactly one worker. Workers extend leases with
+    ``heartbeat()``, and ``requeue_expired()`` (run by every worker)
+    returns the jobs of lost workers to their queue list. Removing an
+    expired lease is the claim on requeuing it, so concurrent reapers
+    requeue a job once. Delivery is at least once: a worker that loses its
+    lease while still running its job may finish it after another worker
+    took it over.
+    """
+
+    def __init__(
+        self,
+        client: RedisLike,
+        namespace: str = "research-bot",
+        lease_seconds: float = 60.0,
+        max_attempts: int = 3,
+        scheduler: Optional[JobScheduler] = None,
+    ) -> None:
+        """
+        Initialize the queue.
+
+        Args:
+            client: Redis client (``redis.Redis``) or ``LocalRedis``.
+            namespace: Prefix of every key, so deployments can share a server.
+            lease_seconds: How long a claimed job stays leased without a heartbeat.
+            max_attempts: Claims of a job before a lost lease fails it.
+            scheduler: Picks the job each claim takes (default: by class and age).
+        """
+        self._client = client
+        self._namespace = namespace
+        self._lease_seconds = lease_seconds
+        self._max_attempts = max(1, max_attempts)
+        self._scheduler = scheduler or JobScheduler()
+
+    @property
+    def location(self) -> str:
+        """Key namespace of the queue."""
+        return f"redis:{self._namespace}"
+
+    def _key(self, *parts: str) -> str:
+        return ":".join((self._namespace, *parts))
+
+    @staticmethod
+    def _decode_id(raw: bytes | str) -> str:
+        return raw.decode() if isinstance(raw, bytes) else raw
+
+    def _enqueue(self, job: ResearchJob) -> None:
+        """Append a job to the queue list of its class and tenant."""
+        group = f"{job.priority.value}:{job.tenant}"
+        self._client.hset(self._key("queues"), group, 1)
+        self._client.rpush(self._key("queue", group), job.id)
+
+    def submit(
+        self,
+        topic: str,
+        output_file: Optional[str] = None,
+        priority: JobPriority = JobPriority.STANDARD,
+        tenant: str = "default",
+    ) -> ResearchJob:
+        """
+        Enqueue a research job.
+
+        Args:
+            topic: The research topic.
+            output_file: Optional report path; workers pick one if omitted.
+            priority: Scheduling class of the job.
+            tenant: Team or client the job runs for (fair share, limits).
+
+        Returns:
+            The queued job.
+        """
+        job = ResearchJob(
+            id=uuid.uuid4().hex[:12],
+            topic=topic,
+            output_file=output_file,
+            priority=priority,
+            tenant=tenant,
+        )
+        self._save(job)
+        self._client.zadd(self._key("jobs"), {job.id: job.created_at.timestamp()})
+        self._enqueue(job)
+        return job
+
+    def _queue_heads(self) -> List[ResearchJob]:
+        """Oldest queued job of each class and tenant, dropping stale list entries."""
+        heads: List[ResearchJob] = []
+        for group in decode_hash(self._client.hgetall(self._key("queues"))):
+            queue = self._key("queue", group)
+            while (raw := self._client.lindex(queue, 0)) is not None:
+                job = self.get(self._decode_id(raw))
+                if job is not None and job.status == JobStatus.QUEUED:
+                    heads.append(job)
+                    break
+                self._client.lrem(queue, 1, raw)  # deleted, or no longer queued
+        return heads
+
+    def _running_by_tenant(self) -> Dict[str, int]:
+        running: Dict[str, int] = {}
+        for raw in self._client.lrange(self._key("processing"), 0, -1):
+            tenant = self._client.hget(self._key("job", self._decode_id(raw)), "tenant")
+            if tenant is not None:
+                name = self._decode_id(tenant)
+                running[name] = running.get(name, 0) + 1
+        return running
+
+    def claim(self, worker_id: Optional[str] = None) -> Optional[ResearchJob]:
+        """
+        Take the job the scheduler picks, mark it running and lease it.
+
+        Args:
+            worker_id: Id of the claiming worker (needed for heartbeats).
+
+        Returns:
+            The claimed job, or None if the queue is empty or every queued
+            job has to wait (tenant limits, provider budgets).
+        """
+        # A job another worker leased between the scan and the claim is
+        # skipped; the next scan sees the queue without it
+        for _ in range(3):
+            job = self._scheduler.select(self._queue_heads(), self._running_by_tenant())
+            if job is None:
+                return None
+            expiry = time.time() + self._lease_seconds
+            if not self._client.zadd(self._key("leases"), {job.id: expiry}, nx=True):
+                continue
+            group = f"{job.priority.value}:{job.tenant}"
+            if not self._client.lrem(self._key("queue", group), 1, job.id):
+                self._client.zrem(self._key("leases"), job.id)  # finished since the scan
+                continue
+            self._client.rpush(self._key("processing"), job.id)
+            return self._start(job, worker_id)
+        return None
+
+    def _start(self, job: ResearchJob, worker_id: Optional[str]) -> ResearchJob:
+        """Record a claimed job as running."""
+        claimed = job.model_copy(
+            update={
+                "status": JobStatus.RUNNING,
+                "started_at": datetime.now(),
+                "worker_id": worker_id,
+                "attempts": job.attempts + 1,
+            }
+        )
+        self._save(claimed)
+        return claimed
+
+    def heartbeat(self, job_id: str, worker_id: str) -> bool:
+        """
+        Extend the lease of a running job.
+
+        Returns:
+            False if the job is no longer leased to this worker.
+        """
+        owner = self._client.hget(self._key("job", job_id), "worker_id")
+        if owner is None or self._decode_id(owner) != worker_id:
+            return False
+        # XX: never re-create a lease a reaper removed in the meantime
+        changed = self._client.zadd(
+            self._key("leases"),
+            {job_id: time.time() + self._lease_seconds},
+            xx=True,
+            ch=True,
+        )
+        return changed > 0
+
+    def requeue_expired(self) -> int:
+        """
+        Requeue claimed jobs whose lease expired, or fail them after ``max_attempts``.
+
+        Returns:
+            Number of jobs requeued.
+        """
+        requeued = failed = 0
+        for raw in self._client.zrangebyscore(self._key("leases"), "-inf", time.time()):
+            job_id = self._decode_id(raw)
+            if not self._client.zrem(self._key("leases"), job_id):
+                continue  # another worker is requeuing it
+            self._client.lrem(self._key("processing"), 0, job_id)
+            job = self.get(job_id)
+            if job is None or job.status.is_terminal:
+                continue
+            if job.attempts >= self._max_attempts:
+                self._save(
+                    job.model_copy(
+                        update={
+                            "status": JobStatus.FAILED,
+                            "error": LEASE_EXPIRED_ERROR,
+                            "finished_at": datetime.now(),
+                        }
+                    )
+                )
+                failed += 1
+                continue
+            requeued_job = job.model_copy(update={"status": JobStatus.QUEUED})
+            self._save(requeued_job)
+            group = f"{job.priority.value}:{job.tenant}"
+            # Left there by a crash mid-claim
+            self._client.lrem(self._key("queue", group), 0, job_id)
+            self._enqueue(requeued_job)
+            requeued += 1
+        if requeued or failed:
+            logger.warning(
+                "Requeued jobs of lost workers", extra={"requeued": requeued, "failed": failed}
+            )
+        return requeued
+
+    def complete(self, job_id: str, worker_id: str, output_file: str, report_length: int) -> bool:
+        """
+        Mark a job as succeeded.
+
+        Returns:
+            False if the job is no longer leased to this worker; nothing is changed.
+        """
+        return self._finish(
+            job_id,
+            worker_id,
+            JobStatus.SUCCEEDED,
+            output_file=output_file,
+            report_length=report_length,
+        )
+
+    def fail(self, job_id: str, worker_id: str, error: str) -> bool:
+        """
+        Mark a job as failed.
+
+        Returns:
+            False if the job is no longer leased to this worker; nothing is changed.
+        """
+        return self._finish(job_id, worker_id, JobStatus.FAILED, error=error)
+
+    def _finish(self, job_id: str, worker_id: str, status: JobStatus, **fields: object) -> bool:
+        """Move a job leased to ``worker_id`` to a terminal state and drop its lease."""
+        # Taking the lease first shuts out a reaper requeuing the job meanwhile
+        score = self._client.zscore(self._key("leases"), job_id)
+        if score is None or not self._client.zrem(self._key("leases"), job_id):
+            return False
+        job = self.get(job_id)
+        if job is None or job.status != JobStatus.RUNNING or job.worker_id != worker_id:
+            # Requeued and claimed by another worker: hand its lease back
+            self._client.zadd(self._key("leases"), {job_id: score}, nx=True)
+            return False
+        self._save(
+            job.model_copy(update={"status": status, "finished_at": datetime.now(), **fields})
+        )
+        self._client.lrem(self._key("processing"), 0, job_id)
+        return True
+
+    def get(self, job_id: str) -> Optional[ResearchJob]:
+        """Return a job by id, or None if unknown."""
+        fields = decode_hash(self._client.hgetall(self._key("job", job_id)))
+        if not fields:
+            return None
+        return ResearchJob.model_validate({name: value or None for name, value in fields.items()})
+
+    def list_jobs(self, status: Optional[JobStatus] = None, limit: int = 50) -> List[ResearchJob]:
+        """
+        Return the most recent jobs, newest first.
+
+        Args:
+            status: Optional status filter.
+            limit: Maximum number of jobs to return.
+        """
+        jobs: List[ResearchJob] = []
+        for raw in self._client.zrevrange(self._key("jobs"), 0, -1):
+            job = self.get(self._decode_id(raw))
+            if job is None or (status is not None and job.status != status):
+                continue
+            jobs.append(job)
+            if len(jobs) >= limit:
+                break
+        return jobs
+
+    def _save(self, job: ResearchJob) -> None:
+        """Write every field of a job to its hash ("" for None)."""
+        mapping: Dict[str, str] = {
+            name: "" if value is None else str(value)
+            for name, value in job.model_dump(mode="json").items()
+        }
+        self._client.hset(self._key("job", job.id), mapping=mapping)
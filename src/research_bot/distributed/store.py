@@ -0,0 +1,598 @@
+"""Shared key-value stores: the Redis-compatible interface and its backends."""
+
+import sqlite3
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Protocol,
+    Union,
+)
+
+Value = Union[bytes, str, int, float]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS kv (
+    name TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    expires_at REAL
+);
+CREATE TABLE IF NOT EXISTS hashes (
+    name TEXT NOT NULL,
+    field TEXT NOT NULL,
+    value BLOB NOT NULL,
+    PRIMARY KEY (name, field)
+);
+CREATE TABLE IF NOT EXISTS hash_expiry (
+    name TEXT PRIMARY KEY,
+    expires_at REAL NOT NULL
+);
+"""
+
+
+def _to_bytes(value: Value) -> bytes:
+    """Encode a value the way redis-py does."""
+    if isinstance(value, bytes):
+        return value
+    if isinstance(value, float):
+        return repr(value).encode()
+    return str(value).encode()
+
+
+def _to_str(value: Union[bytes, str]) -> str:
+    return value.decode() if isinstance(value, bytes) else value
+
+
+class KeyValueStore(Protocol):
+    """
+    Strings and hashes shared by every node (a subset of redis-py).
+
+    A ``redis.Redis`` client satisfies this protocol as is, as do
+    ``SqliteKeyValueStore`` and ``LocalRedis``. Values come back as bytes.
+    """
+
+    def get(self, name: str) -> Optional[bytes]:
+        """Value of a key, or None."""
+        ...
+
+    def set(
+        self,
+        name: str,
+        value: Value,
+        ex: Optional[int] = None,
+        nx: bool = False,
+    ) -> Optional[bool]:
+        """Store a value, expiring after ``ex`` (whole) seconds; with ``nx`` only if absent."""
+        ...
+
+    def delete(self, *names: str) -> int:
+        """Remove keys; returns how many existed."""
+        ...
+
+    def expire(self, name: str, time: int) -> bool:
+        """Expire a key after ``time`` seconds."""
+        ...
+
+    def incrbyfloat(self, name: str, amount: float = 1.0) -> float:
+        """Add to a numeric key atomically."""
+        ...
+
+    def hset(
+        self,
+        name: str,
+        key: Optional[str] = None,
+        value: Optional[Value] = None,
+        mapping: Optional[Mapping[str, Value]] = None,
+    ) -> int:
+        """Set hash fields."""
+        ...
+
+    def hget(self, name: str, key: str) -> Optional[bytes]:
+        """Value of a hash field, or None."""
+        ...
+
+    def hgetall(self, name: str) -> Dict[bytes, bytes]:
+        """All fields of a hash."""
+        ...
+
+    def hincrbyfloat(self, name: str, key: str, amount: float = 1.0) -> float:
+        """Add to a numeric hash field atomically."""
+        ...
+
+
+class RedisLike(KeyValueStore, Protocol):
+    """Redis commands used by ``RedisJobQueue``: strings, hashes, lists and sorted sets."""
+
+    def rpush(self, name: str, *values: Value) -> int:
+        """Append to a list."""
+        ...
+
+    def lindex(self, name: str, index: int) -> Optional[bytes]:
+        """List element at ``index`` (negative: from the end), or None."""
+        ...
+
+    def lrange(self, name: str, start: int, end: int) -> List[bytes]:
+        """List elements from ``start`` to ``end`` (inclusive, -1: last)."""
+        ...
+
+    def lrem(self, name: str, count: int, value: Value) -> int:
+        """Remove list elements equal to ``value``."""
+        ...
+
+    def llen(self, name: str) -> int:
+        """Length of a list."""
+        ...
+
+    def zadd(
+        self,
+        name: str,
+        mapping: Mapping[str, float],
+        nx: bool = False,
+        xx: bool = False,
+        ch: bool = False,
+    ) -> int:
+        """
+        Add or update sorted set members.
+
+        ``nx``: only add new members; ``xx``: only update existing ones;
+        ``ch``: count updated members too, not just added ones.
+        """
+        ...
+
+    def zrem(self, name: str, *values: Value) -> int:
+        """Remove sorted set members; returns how many existed."""
+        ...
+
+    def zscore(self, name: str, value: Value) -> Optional[float]:
+        """Score of a sorted set member, or None."""
+        ...
+
+    def zrangebyscore(
+        self, name: str, min: Union[float, str], max: Union[float, str]
+    ) -> List[bytes]:
+        """Members with scores in ``[min, max]``, lowest first."""
+        ...
+
+    def zrevrange(self, name: str, start: int, end: int) -> List[bytes]:
+        """Members by rank, highest score first (``end`` inclusive, -1: last)."""
+        ...
+
+
+class LocalRedis:
+    """
+    In-process stand-in for a Redis server.
+
+    Implements the commands of ``RedisLike`` with Redis semantics (bytes
+    values, key expiry, atomic commands), so the distributed code paths
+    can run in tests, benchmarks and single-machine setups without a
+    server. State is per instance: share one instance between the
+    components (queue, caches, metrics) that should see each other.
+    Thread-safe.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        """
+        Initialize an empty store.
+
+        Args:
+            clock: Monotonic time source for key expiry.
+        """
+        self._clock = clock
+        self._lock = threading.RLock()
+        self._data: Dict[str, Any] = {}
+        self._expiry: Dict[str, float] = {}
+
+    def _live(self, name: str) -> Optional[Any]:
+        """Value of a key, dropping it if expired (caller holds the lock)."""
+        expires_at = self._expiry.get(name)
+        if expires_at is not None and expires_at <= self._clock():
+            self._data.pop(name, None)
+            self._expiry.pop(name, None)
+        return self._data.get(name)
+
+    def _typed(self, name: str, kind: type) -> Any:
+        """A key's container, created if missing (caller holds the lock)."""
+        value = self._live(name)
+        if value is None:
+            value = kind()
+            self._data[name] = value
+        elif not isinstance(value, kind):
+            raise TypeError(f"WRONGTYPE operation against key {name!r}")
+        return value
+
+    def get(self, name: str) -> Optional[bytes]:
+        with self._lock:
+            value = self._live(name)
+            if value is not None and not isinstance(value, bytes):
+                raise TypeError(f"WRONGTYPE operation against key {name!r}")
+            return value
+
+    def set(
+        self,
+        name: str,
+        value: Value,
+        ex: Optional[int] = None,
+        nx: bool = False,
+    ) -> Optional[bool]:
+        with self._lock:
+            if nx and self._live(name) is not None:
+                return None
+            self._data[name] = _to_bytes(value)
+            if ex is not None:
+                self._expiry[name] = self._clock() + ex
+            else:
+                self._expiry.pop(name, None)
+            return True
+
+    def delete(self, *names: str) -> int:
+        with self._lock:
+            removed = 0
+            for name in names:
+                if self._live(name) is not None:
+                    removed += 1
+                self._data.pop(name, None)
+                self._expiry.pop(name, None)
+            return removed
+
+    def expire(self, name: str, time: int) -> bool:
+        with self._lock:
+            if self._live(name) is None:
+                return False
+            self._expiry[name] = self._clock() + time
+            return True
+
+    def incrbyfloat(self, name: str, amount: float = 1.0) -> float:
+        with self._lock:
+            current = self._live(name)
+            value = float(current) + amount if current is not None else amount
+            self._data[name] = _to_bytes(value)
+            return value
+
+    def hset(
+        self,
+        name: str,
+        key: Optional[str] = None,
+        value: Optional[Value] = None,
+        mapping: Optional[Mapping[str, Value]] = None,
+    ) -> int:
+        fields: Dict[str, Value] = dict(mapping or {})
+        if key is not None and value is not None:
+            fields[key] = value
+        with self._lock:
+            hash_ = self._typed(name, dict)
+            added = sum(1 for field in fields if field not in hash_)
+            hash_.update((field, _to_bytes(item)) for field, item in fields.items())
+            return added
+
+    def hget(self, name: str, key: str) -> Optional[bytes]:
+        with self._lock:
+            return self._typed(name, dict).get(key)
+
+    def hgetall(self, name: str) -> Dict[bytes, bytes]:
+        with self._lock:
+            return {field.encode(): value for field, value in self._typed(name, dict).items()}
+
+    def hincrbyfloat(self, name: str, key: str, amount: float = 1.0) -> float:
+        with self._lock:
+            hash_ = self._typed(name, dict)
+            value = float(hash_.get(key, b"0")) + amount
+            hash_[key] = _to_bytes(value)
+            return value
+
+    def rpush(self, name: str, *values: Value) -> int:
+        with self._lock:
+            list_ = self._typed(name, deque)
+            list_.extend(_to_bytes(value) for value in values)
+            return len(list_)
+
+    def lindex(self, name: str, index: int) -> Optional[bytes]:
+        with self._lock:
+            list_: Deque[bytes] = self._typed(name, deque)
+            if -len(list_) <= index < len(list_):
+                return list_[index]
+            return None
+
+    def lrange(self, name: str, start: int, end: int) -> List[bytes]:
+        with self._lock:
+            items = list(self._typed(name, deque))
+        stop = None if end == -1 else end + 1
+        return items[start:stop]
+
+    def lrem(self, name: str, count: int, value: Value) -> int:
+        encoded = _to_bytes(value)
+        with self._lock:
+            list_: Deque[bytes] = self._typed(name, deque)
+            items = list(list_) if count >= 0 else list(reversed(list_))
+            limit = abs(count) or len(items)
+            kept: List[bytes] = []
+            removed = 0
+            for item in items:
+                if item == encoded and removed < limit:
+                    removed += 1
+                else:
+                    kept.append(item)
+            list_.clear()
+            list_.extend(kept if count >= 0 else reversed(kept))
+            return removed
+
+    def llen(self, name: str) -> int:
+        with self._lock:
+            return len(self._typed(name, deque))
+
+    def zadd(
+        self,
+        name: str,
+        mapping: Mapping[str, float],
+        nx: bool = False,
+        xx: bool = False,
+        ch: bool = False,
+    ) -> int:
+        with self._lock:
+            zset = self._typed(name, dict)
+            counted = 0
+            for member, score in mapping.items():
+                key, previous = _to_bytes(member), zset.get(_to_bytes(member))
+                if (previous is None and xx) or (previous is not None and nx):
+                    continue
+                zset[key] = float(score)
+                counted += int(previous is None or (ch and previous != float(score)))
+            return counted
+
+    def zrem(self, name: str, *values: Value) -> int:
+        with self._lock:
+            zset = self._typed(name, dict)
+            return sum(1 for value in values if zset.pop(_to_bytes(value), None) is not None)
+
+    def zscore(self, name: str, value: Value) -> Optional[float]:
+        with self._lock:
+            return self._typed(name, dict).get(_to_bytes(value))
+
+    def zrangebyscore(
+        self, name: str, min: Union[float, str], max: Union[float, str]
+    ) -> List[bytes]:
+        low, high = float(min), float(max)
+        with self._lock:
+            members = sorted(self._typed(name, dict).items(), key=lambda item: (item[1], item[0]))
+        return [member for member, score in members if low <= score <= high]
+
+    def zrevrange(self, name: str, start: int, end: int) -> List[bytes]:
+        with self._lock:
+            members = sorted(
+                self._typed(name, dict).items(),
+                key=lambda item: (item[1], item[0]),
+                reverse=True,
+            )
+        stop = None if end == -1 else end + 1
+        return [member for member, _ in members[start:stop]]
+
+
+class SqliteKeyValueStore:
+    """
+    ``KeyValueStore`` in a SQLite database file.
+
+    The default shared store: processes on one machine (or on hosts
+    sharing a filesystem with working SQLite locking) share caches and
+    metrics through it. Expired keys are dropped when read. Safe to share
+    between processes.
+    """
+
+    def __init__(self, path: str | Path, clock: Callable[[], float] = time.time) -> None:
+        """
+        Initialize the store, creating the database if needed.
+
+        Args:
+            path: Location of the SQLite database file.
+            clock: Wall-clock time source for key expiry.
+        """
+        self._path = Path(path)
+        self._clock = clock
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connection() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+
+    @property
+    def path(self) -> Path:
+        """Location of the SQLite database file."""
+        return self._path
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        """Open a short-lived autocommit connection."""
+        conn = sqlite3.connect(self._path, timeout=30.0, isolation_level=None)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Connection inside an immediate (write-locked) transaction."""
+        with self._connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+
+    def _expires_at(self, ex: Optional[int]) -> Optional[float]:
+        return self._clock() + ex if ex is not None else None
+
+    def _live_value(self, conn: sqlite3.Connection, name: str) -> Optional[bytes]:
+        row = conn.execute(
+            "SELECT value FROM kv WHERE name = ? AND (expires_at IS NULL OR expires_at > ?)",
+            (name, self._clock()),
+        ).fetchone()
+        return bytes(row[0]) if row else None
+
+    def _drop_expired_hash(self, conn: sqlite3.Connection, name: str) -> None:
+        row = conn.execute("SELECT expires_at FROM hash_expiry WHERE name = ?", (name,)).fetchone()
+        if row is not None and row[0] <= self._clock():
+            conn.execute("DELETE FROM hashes WHERE name = ?", (name,))
+            conn.execute("DELETE FROM hash_expiry WHERE name = ?", (name,))
+
+    def get(self, name: str) -> Optional[bytes]:
+        with self._connection() as conn:
+            return self._live_value(conn, name)
+
+    def set(
+        self,
+        name: str,
+        value: Value,
+        ex: Optional[int] = None,
+        nx: bool = False,
+    ) -> Optional[bool]:
+        with self._transaction() as conn:
+            if nx and self._live_value(conn, name) is not None:
+                return None
+            conn.execute(
+                "INSERT OR REPLACE INTO kv (name, value, expires_at) VALUES (?, ?, ?)",
+                (name, _to_bytes(value), self._expires_at(ex)),
+            )
+            return True
+
+    def delete(self, *names: str) -> int:
+        removed = 0
+        with self._transaction() as conn:
+            for name in names:
+                existed = self._live_value(conn, name) is not None or conn.execute(
+                    "SELECT 1 FROM hashes WHERE name = ? LIMIT 1", (name,)
+                ).fetchone() is not None
+                conn.execute("DELETE FROM kv WHERE name = ?", (name,))
+                conn.execute("DELETE FROM hashes WHERE name = ?", (name,))
+                conn.execute("DELETE FROM hash_expiry WHERE name = ?", (name,))
+                removed += int(existed)
+        return removed
+
+    def expire(self, name: str, time: int) -> bool:
+        expires_at = self._clock() + time
+        with self._transaction() as conn:
+            updated = conn.execute(
+                "UPDATE kv SET expires_at = ? "
+                "WHERE name = ? AND (expires_at IS NULL OR expires_at > ?)",
+                (expires_at, name, self._clock()),
+            ).rowcount
+            if conn.execute("SELECT 1 FROM hashes WHERE name = ? LIMIT 1", (name,)).fetchone():
+                conn.execute(
+                    "INSERT OR REPLACE INTO hash_expiry (name, expires_at) VALUES (?, ?)",
+                    (name, expires_at),
+                )
+                updated += 1
+        return updated > 0
+
+    def incrbyfloat(self, name: str, amount: float = 1.0) -> float:
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT value, expires_at FROM kv "
+                "WHERE name = ? AND (expires_at IS NULL OR expires_at > ?)",
+                (name, self._clock()),
+            ).fetchone()
+            value = float(bytes(row[0])) + amount if row else amount
+            conn.execute(
+                "INSERT OR REPLACE INTO kv (name, value, expires_at) VALUES (?, ?, ?)",
+                (name, _to_bytes(value), row[1] if row else None),
+            )
+        return value
+
+    def hset(
+        self,
+        name: str,
+        key: Optional[str] = None,
+        value: Optional[Value] = None,
+        mapping: Optional[Mapping[str, Value]] = None,
+    ) -> int:
+        fields: Dict[str, Value] = dict(mapping or {})
+        if key is not None and value is not None:
+            fields[key] = value
+        added = 0
+        with self._transaction() as conn:
+            self._drop_expired_hash(conn, name)
+            for field, item in fields.items():
+                exists = conn.execute(
+                    "SELECT 1 FROM hashes WHERE name = ? AND field = ?", (name, field)
+                ).fetchone()
+                added += int(exists is None)
+                conn.execute(
+                    "INSERT OR REPLACE INTO hashes (name, field, value) VALUES (?, ?, ?)",
+                    (name, field, _to_bytes(item)),
+                )
+        return added
+
+    def hget(self, name: str, key: str) -> Optional[bytes]:
+        return self.hgetall(name).get(key.encode())
+
+    def hgetall(self, name: str) -> Dict[bytes, bytes]:
+        with self._connection() as conn:
+            row = conn.execute(
+                "SELECT expires_at FROM hash_expiry WHERE name = ?", (name,)
+            ).fetchone()
+            if row is not None and row[0] <= self._clock():
+                return {}
+            rows = conn.execute(
+                "SELECT field, value FROM hashes WHERE name = ?", (name,)
+            ).fetchall()
+        return {field.encode(): bytes(value) for field, value in rows}
+
+    def hincrbyfloat(self, name: str, key: str, amount: float = 1.0) -> float:
+        with self._transaction() as conn:
+            self._drop_expired_hash(conn, name)
+            row = conn.execute(
+                "SELECT value FROM hashes WHERE name = ? AND field = ?", (name, key)
+            ).fetchone()
+            value = float(bytes(row[0])) + amount if row else amount
+            conn.execute(
+                "INSERT OR REPLACE INTO hashes (name, field, value) VALUES (?, ?, ?)",
+                (name, key, _to_bytes(value)),
+            )
+        return value
+
+
+def decode_hash(raw: Mapping[Union[bytes, str], Union[bytes, str]]) -> Dict[str, str]:
+    """Decode a hash returned by ``hgetall`` into strings."""
+    return {_to_str(field): _to_str(value) for field, value in raw.items()}
+
+
+def create_store(backend: str, path: str | Path, redis_url: str) -> KeyValueStore:
+    """
+    Open the shared store of a deployment.
+
+    Args:
+        backend: ``"sqlite"`` or ``"redis"``.
+        path: SQLite database file (``sqlite`` backend).
+        redis_url: Server URL (``redis`` backend); ``memory://`` gives a
+            process-local ``LocalRedis`` (single-machine testing).
+
+    Returns:
+        The store.
+
+    Raises:
+        ValueError: If the backend is unknown.
+        ImportError: If the ``redis`` backend is used without redis-py.
+    """
+    name = backend.strip().lower()
+    if name == "sqlite":
+        return SqliteKeyValueStore(path)
+    if name == "redis":
+        if redis_url.startswith("memory://"):
+            return LocalRedis()
+        try:
+            import redis
+        except ImportError as e:
+            raise ImportError(
+                "The redis shared store needs redis-py: pip install 'research-bot[redis]'"
+            ) from e
+        client: KeyValueStore = redis.Redis.from_url(redis_url)
+        return client
+    raise ValueError(f"Unknown shared store {backend!r} (choose from: sqlite, redis)")
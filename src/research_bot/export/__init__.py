@@ -0,0 +1,18 @@
+"""Report parsing and multi-format export module."""
+
+from research_bot.export.exporters import (
+    EXPORTERS,
+    ExportPipeline,
+    ReportExporter,
+    build_index,
+)
+from research_bot.export.parser import extract_urls, parse_report
+
+__all__ = [
+    "extract_urls",
+    "parse_report",
+    "EXPORTERS",
+    "ExportPipeline",
+    "ReportExporter",
+    "build_index",
+]
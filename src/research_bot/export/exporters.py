@@ -0,0 +1,209 @@
+"""Report exporters - Strategy Pattern for output formats."""
+
+import logging
+import re
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Dict, List, Sequence, Type
+
+from research_bot.export.html import render_html
+from research_bot.export.parser import extract_urls
+from research_bot.models.report import ReportIndex, ReportIndexSection, ResearchReport, SectionType
+
+logger = logging.getLogger(__name__)
+
+_EMPHASIS = re.compile(r"[*`]+")
+_MARKUP = re.compile(r"[#>|]+")
+_LINK = re.compile(r"\[([^\]]+)\]\([^)]*\)")
+
+# Characters of executive summary kept in the search index entry
+INDEX_SUMMARY_CHARS = 500
+
+
+class ReportExporter(ABC):
+    """
+    Renders a parsed report in one output format.
+
+    Follows:
+    - Single Responsibility: One format per exporter
+    - Open/Closed: Register new formats without touching the pipeline
+    """
+
+    @property
+    @abstractmethod
+    def suffix(self) -> str:
+        """File suffix of the format, e.g. ``.json``."""
+        ...
+
+    @abstractmethod
+    def render(self, report: ResearchReport, report_id: str) -> str:
+        """
+        Render a report.
+
+        Args:
+            report: Report with parsed sections.
+            report_id: Identifier of the report (its file stem).
+
+        Returns:
+            The rendered document.
+        """
+        ...
+
+
+class MarkdownExporter(ReportExporter):
+    """The report as markdown (the writer's text when available)."""
+
+    @property
+    def suffix(self) -> str:
+        return ".md"
+
+    def render(self, report: ResearchReport, report_id: str) -> str:
+        return report.to_markdown()
+
+
+class JsonExporter(ReportExporter):
+    """Metadata and typed sections as JSON."""
+
+    @property
+    def suffix(self) -> str:
+        return ".json"
+
+    def render(self, report: ResearchReport, report_id: str) -> str:
+        return report.model_dump_json(indent=2, exclude={"raw_content"})
+
+
+class HtmlExporter(ReportExporter):
+    """Standalone HTML with print styles, ready to print to PDF."""
+
+    @property
+    def suffix(self) -> str:
+        return ".html"
+
+    def render(self, report: ResearchReport, report_id: str) -> str:
+        return render_html(report)
+
+
+def _plain_text(markdown: str) -> str:
+    """Markdown reduced to plain text for indexing."""
+    text = _LINK.sub(r"\1", markdown)
+    return " ".join(_MARKUP.sub(" ", _EMPHASIS.sub("", text)).split())
+
+
+def build_index(report: ResearchReport, report_id: str) -> ReportIndex:
+    """
+    Describe a report compactly for a search index.
+
+    The summary is the start of the executive summary (or of the first
+    section), the sources are the URLs cited in the references section (or
+    anywhere in the report when it has none).
+    """
+    sections = report.sorted_sections
+    by_type = {section.section_type: section for section in reversed(sections)}
+
+    summary_section = by_type.get(SectionType.EXECUTIVE_SUMMARY) or (
+        sections[0] if sections else None
+    )
+    summary = _plain_text(summary_section.content) if summary_section else ""
+    if len(summary) > INDEX_SUMMARY_CHARS:
+        summary = summary[:INDEX_SUMMARY_CHARS].rsplit(" ", 1)[0] + "…"
+
+    references = by_type.get(SectionType.REFERENCES)
+    cited = references.content if references else report.to_markdown()
+    sources = extract_urls(cited)
+
+    return ReportIndex(
+        id=report_id,
+        title=report.metadata.title,
+        topic=report.metadata.topic,
+        generated_at=report.metadata.generated_at,
+        summary=summary,
+        sections=[
+            ReportIndexSection(
+                type=section.section_type,
+                title=section.title,
+                chars=len(section.content),
+            )
+            for section in sections
+        ],
+        sources=sources,
+        word_count=sum(len(section.content.split()) for section in sections),
+    )
+
+
+class IndexExporter(ReportExporter):
+    """Compact ``ReportIndex`` JSON for search indexing."""
+
+    @property
+    def suffix(self) -> str:
+        return ".index.json"
+
+    def render(self, report: ResearchReport, report_id: str) -> str:
+        return build_index(report, report_id).model_dump_json(exclude_none=True)
+
+
+# Format name -> exporter class
+EXPORTERS: Dict[str, Type[ReportExporter]] = {
+    "md": MarkdownExporter,
+    "json": JsonExporter,
+    "html": HtmlExporter,
+    "index": IndexExporter,
+}
+
+
+def parse_formats(spec: str | Sequence[str]) -> List[str]:
+    """
+    Parse a format list such as ``"md,json,html"``.
+
+    Raises:
+        ValueError: If a format is unknown.
+    """
+    names = spec.split(",") if isinstance(spec, str) else list(spec)
+    formats = list(dict.fromkeys(name.strip().lower() for name in names if name.strip()))
+    unknown = [name for name in formats if name not in EXPORTERS]
+    if unknown:
+        raise ValueError(
+            f"unknown report format(s) {', '.join(unknown)} (choose from {', '.join(EXPORTERS)})"
+        )
+    return formats
+
+
+class ExportPipeline:
+    """Writes a parsed report in several formats next to its markdown file."""
+
+    def __init__(self, formats: str | Sequence[str] = ("md",)) -> None:
+        """
+        Initialize pipeline.
+
+        Args:
+            formats: Format names (keys of ``EXPORTERS``) or a comma-separated list.
+
+        Raises:
+            ValueError: If a format is unknown.
+        """
+        self._formats = parse_formats(formats)
+        self._exporters = [EXPORTERS[name]() for name in self._formats]
+
+    @property
+    def formats(self) -> List[str]:
+        """Format names, in export order."""
+        return list(self._formats)
+
+    def export(self, report: ResearchReport, output_file: str | Path) -> Dict[str, Path]:
+        """
+        Render and write every format.
+
+        Markdown goes to ``output_file`` itself; other formats replace its
+        suffix (``report.md`` -> ``report.json``, ``report.html``,
+        ``report.index.json``).
+
+        Returns:
+            Format name -> written path.
+        """
+        output_path = Path(output_file)
+        written: Dict[str, Path] = {}
+        for name, exporter in zip(self._formats, self._exporters):
+            path = output_path if name == "md" else output_path.with_suffix(exporter.suffix)
+            path.write_text(exporter.render(report, output_path.stem), encoding="utf-8")
+            written[name] = path
+        logger.debug("Report exported", extra={"formats": list(written)})
+        return written
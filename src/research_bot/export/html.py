@@ -0,0 +1,196 @@
+"""Minimal markdown-to-HTML rendering for report exports (no dependencies)."""
+
+import html
+import re
+from typing import List
+
+from research_bot.models.report import ResearchReport
+
+_HEADING = re.compile(r"^(#{1,6})\s+(.*?)\s*#*\s*$")
+_FENCE = re.compile(r"^\s*(```|~~~)")
+_RULE = re.compile(r"^\s*([-*_])(\s*\1){2,}\s*$")
+_BULLET = re.compile(r"^\s*[-*+]\s+(.*)$")
+_ORDERED = re.compile(r"^\s*\d+[.)]\s+(.*)$")
+_TABLE_SEPARATOR = re.compile(r"^\s*\|?\s*:?-{2,}:?\s*(\|\s*:?-{2,}:?\s*)*\|?\s*$")
+
+_CODE_SPAN = re.compile(r"`([^`]+)`")
+_LINK = re.compile(r"\[([^\]]+)\]\((https?://[^)\s]+)\)")
+_AUTOLINK = re.compile(r"&lt;(https?://\S+?)&gt;")
+# Bare URLs, except those already inside an attribute or link text
+_BARE_URL = re.compile(r"(?<![\"=>])(https?://[^\s<]*[^\s<.,;:)\]])")
+_BOLD = re.compile(r"\*\*(.+?)\*\*|__(.+?)__")
+_ITALIC = re.compile(r"(?<![\w*])\*(?!\s)(.+?)(?<!\s)\*(?![\w*])|(?<!\w)_(?!\s)(.+?)(?<!\s)_(?!\w)")
+
+# Print rules make the HTML export the PDF-ready format (print to PDF)
+STYLESHEET = """
+body {
+  font-family: Georgia, serif; line-height: 1.55; max-width: 46rem;
+  margin: 2rem auto; padding: 0 1rem; color: #222;
+}
+h1, h2, h3 { font-family: Helvetica, Arial, sans-serif; line-height: 1.25; }
+h2 { border-bottom: 1px solid #ddd; padding-bottom: .2rem; margin-top: 2rem; }
+.meta { color: #666; font-size: .9rem; }
+table { border-collapse: collapse; margin: 1rem 0; }
+th, td { border: 1px solid #ccc; padding: .3rem .6rem; text-align: left; vertical-align: top; }
+pre { background: #f6f6f6; padding: .8rem; overflow-x: auto; }
+blockquote { border-left: 3px solid #ccc; margin-left: 0; padding-left: 1rem; color: #555; }
+a { color: #1a5fb4; word-break: break-word; }
+@page { size: A4; margin: 2cm; }
+@media print {
+  body { max-width: none; margin: 0; }
+  h1, h2, h3 { page-break-after: avoid; }
+  table, pre, blockquote { page-break-inside: avoid; }
+  a { color: inherit; }
+}
+"""
+
+
+def render_inline(text: str) -> str:
+    """Escape text and render code spans, links and emphasis."""
+    codes: List[str] = []
+
+    def stash_code(match: re.Match) -> str:
+        codes.append(f"<code>{html.escape(match.group(1), quote=False)}</code>")
+        return f"\x00{len(codes) - 1}\x00"
+
+    text = _CODE_SPAN.sub(stash_code, text)
+    text = html.escape(text, quote=False)
+    text = _LINK.sub(
+        lambda m: f'<a href="{m.group(2).replace(chr(34), "&quot;")}">{m.group(1)}</a>', text
+    )
+    text = _AUTOLINK.sub(lambda m: f'<a href="{m.group(1)}">{m.group(1)}</a>', text)
+    text = _BARE_URL.sub(lambda m: f'<a href="{m.group(1)}">{m.group(1)}</a>', text)
+    text = _BOLD.sub(lambda m: f"<strong>{m.group(1) or m.group(2)}</strong>", text)
+    text = _ITALIC.sub(lambda m: f"<em>{m.group(1) or m.group(2)}</em>", text)
+    return re.sub("\x00(\\d+)\x00", lambda m: codes[int(m.group(1))], text)
+
+
+def _table_row(line: str, cell_tag: str) -> str:
+    cells = line.strip().strip("|").split("|")
+    return "<tr>" + "".join(
+        f"<{cell_tag}>{render_inline(cell.strip())}</{cell_tag}>" for cell in cells
+    ) + "</tr>"
+
+
+def markdown_to_html(markdown: str) -> str:
+    """
+    Render the markdown subset report writers use.
+
+    Supports headings, paragraphs, bullet and numbered lists, pipe tables,
+    block quotes, code fences, rules, links and emphasis. Anything else is
+    rendered as escaped text.
+    """
+    lines = markdown.splitlines()
+    out: List[str] = []
+    paragraph: List[str] = []
+    i = 0
+
+    def flush_paragraph() -> None:
+        if paragraph:
+            out.append(f"<p>{render_inline(' '.join(paragraph))}</p>")
+            paragraph.clear()
+
+    while i < len(lines):
+        line = lines[i]
+        stripped = line.strip()
+
+        if _FENCE.match(line):
+            flush_paragraph()
+            code: List[str] = []
+            i += 1
+            while i < len(lines) and not _FENCE.match(lines[i]):
+                code.append(lines[i])
+                i += 1
+            out.append(f"<pre><code>{html.escape(chr(10).join(code), quote=False)}</code></pre>")
+            i += 1
+            continue
+
+        if not stripped:
+            flush_paragraph()
+            i += 1
+            continue
+
+        heading = _HEADING.match(line)
+        if heading:
+            flush_paragraph()
+            level = len(heading.group(1))
+            out.append(f"<h{level}>{render_inline(heading.group(2))}</h{level}>")
+            i += 1
+            continue
+
+        if _RULE.match(line):
+            flush_paragraph()
+            out.append("<hr>")
+            i += 1
+            continue
+
+        if stripped.startswith("|") and i + 1 < len(lines) and _TABLE_SEPARATOR.match(lines[i + 1]):
+            flush_paragraph()
+            rows = [_table_row(line, "th")]
+            i += 2
+            while i < len(lines) and lines[i].strip().startswith("|"):
+                rows.append(_table_row(lines[i], "td"))
+                i += 1
+            out.append("<table>" + "".join(rows) + "</table>")
+            continue
+
+        if stripped.startswith(">"):
+            flush_paragraph()
+            quote: List[str] = []
+            while i < len(lines) and lines[i].strip().startswith(">"):
+                quote.append(lines[i].strip()[1:].strip())
+                i += 1
+            out.append(f"<blockquote>{markdown_to_html(chr(10).join(quote))}</blockquote>")
+            continue
+
+        for pattern, tag in ((_BULLET, "ul"), (_ORDERED, "ol")):
+            if pattern.match(line):
+                flush_paragraph()
+                items: List[str] = []
+                while i < len(lines) and lines[i].strip():
+                    item = pattern.match(lines[i])
+                    if item:
+                        items.append(item.group(1))
+                    elif lines[i][:1].isspace():
+                        # Indented continuation (or nested item) of the previous item
+                        items[-1] += " " + lines[i].strip()
+                    else:
+                        break
+                    i += 1
+                listed = "".join(f"<li>{render_inline(item)}</li>" for item in items)
+                out.append(f"<{tag}>{listed}</{tag}>")
+                break
+        else:
+            paragraph.append(stripped)
+            i += 1
+
+    flush_paragraph()
+    return "\n".join(out)
+
+
+def render_html(report: ResearchReport) -> str:
+    """Render a parsed report as a standalone, print-ready HTML document."""
+    metadata = report.metadata
+    title = html.escape(metadata.title)
+    parts = [
+        "<!DOCTYPE html>",
+        '<html lang="en">',
+        "<head>",
+        '<meta charset="utf-8">',
+        f"<title>{title}</title>",
+        f"<style>{STYLESHEET}</style>",
+        "</head>",
+        "<body>",
+        "<article>",
+        f"<h1>{title}</h1>",
+        f'<p class="meta">{html.escape(metadata.topic)} &middot; '
+        f"{metadata.generated_at:%Y-%m-%d %H:%M} &middot; {html.escape(metadata.author)}</p>",
+    ]
+    for section in report.sorted_sections:
+        anchor = re.sub(r"[^a-z0-9]+", "-", section.title.lower()).strip("-") or "section"
+        parts.append(f'<section id="{anchor}" data-type="{section.section_type.value}">')
+        parts.append(f"<h2>{render_inline(section.title)}</h2>")
+        parts.append(markdown_to_html(section.content))
+        parts.append("</section>")
+    parts.extend(["</article>", "</body>", "</html>", ""])
+    return "\n".join(parts)
@@ -0,0 +1,150 @@
+"""Parse the writer's markdown report into structured sections."""
+
+import re
+from typing import List, Optional, Tuple
+
+from research_bot.models.report import ReportMetadata, ReportSection, ResearchReport, SectionType
+
+_HEADING = re.compile(r"^(#{1,6})\s+(.*?)\s*#*\s*$")
+_URL = re.compile(r"https?://[^\s<>\"'`\]]+")
+_FENCE = re.compile(r"^\s*(```|~~~)")
+# "1. Introduction", "2) Findings", "IV. Conclusions"
+_NUMBERING = re.compile(r"^(?:\d+(?:\.\d+)*[.)]?|[IVXLC]+[.)])\s+")
+
+# Checked in order; the first matching title keyword decides the type
+_SECTION_KEYWORDS: Tuple[Tuple[SectionType, re.Pattern], ...] = tuple(
+    (section_type, re.compile(rf"\b(?:{pattern})\b", re.IGNORECASE))
+    for section_type, pattern in (
+        (SectionType.REFERENCES, r"references|sources|bibliography|citations|works cited"),
+        (SectionType.EXECUTIVE_SUMMARY, r"executive summary|summary|overview|abstract"),
+        (SectionType.METHODOLOGY, r"methodology|methods|approach|research process"),
+        (SectionType.INTRODUCTION, r"introduction|background|context|scope"),
+        (SectionType.KEY_FINDINGS, r"findings|results|insights"),
+        (SectionType.CONCLUSIONS, r"conclusions?|implications|recommendations|outlook"),
+        (SectionType.INDUSTRY_ANALYSIS, r"industry|market|competitive|analysis"),
+    )
+)
+
+# Title of the section holding text between the report title and first heading
+PREAMBLE_TITLE = "Overview"
+
+
+def classify_section(title: str) -> SectionType:
+    """Map a section heading to its ``SectionType`` (``OTHER`` if unknown)."""
+    for section_type, pattern in _SECTION_KEYWORDS:
+        if pattern.search(title):
+            return section_type
+    return SectionType.OTHER
+
+
+def extract_urls(text: str) -> List[str]:
+    """
+    Return the distinct URLs in markdown text, in order of appearance.
+
+    Trailing punctuation and unbalanced closing parentheses (from
+    ``[text](url)`` links and prose) are not part of the URL.
+    """
+    urls: List[str] = []
+    for url in _URL.findall(text):
+        url = url.rstrip(".,;:!?*")
+        while url.endswith(")") and url.count(")") > url.count("("):
+            url = url[:-1].rstrip(".,;:!?*")
+        urls.append(url)
+    return list(dict.fromkeys(urls))
+
+
+def _clean_heading(text: str) -> str:
+    """Strip emphasis, numbering and trailing colons from a heading."""
+    text = text.strip().strip("*_").strip()
+    return _NUMBERING.sub("", text).rstrip(":").strip()
+
+
+def _headings(lines: List[str]) -> List[Tuple[int, int, str]]:
+    """Return ``(line index, level, text)`` of headings outside code fences."""
+    headings = []
+    in_fence = False
+    for index, line in enumerate(lines):
+        if _FENCE.match(line):
+            in_fence = not in_fence
+            continue
+        if in_fence:
+            continue
+        match = _HEADING.match(line)
+        if match:
+            headings.append((index, len(match.group(1)), match.group(2)))
+    return headings
+
+
+def _body(lines: List[str]) -> str:
+    """Join section lines, dropping surrounding blanks and rules."""
+    text = "\n".join(lines).strip()
+    while text.endswith("---"):
+        text = text[:-3].rstrip()
+    while text.startswith("---"):
+        text = text[3:].lstrip()
+    return text
+
+
+def parse_report(
+    markdown: str, topic: str, metadata: Optional[ReportMetadata] = None
+) -> ResearchReport:
+    """
+    Split a markdown report into typed sections.
+
+    The first level-1 heading is the report title. Sections start at each
+    level-2 heading (or level-1, if the report has no level-2 headings);
+    deeper headings stay inside their section. Text between the title and
+    the first section becomes an ``OTHER`` section.
+
+    Args:
+        markdown: The writer's report.
+        topic: The research topic.
+        metadata: Report metadata; built from the title and topic if omitted.
+
+    Returns:
+        A report with ``sections`` populated and ``raw_content`` set to
+        ``markdown``.
+    """
+    lines = markdown.splitlines()
+    headings = _headings(lines)
+
+    title: Optional[str] = None
+    if headings and headings[0][1] == 1:
+        title_line, _, title_text = headings.pop(0)
+        title = _clean_heading(title_text)
+        start = title_line + 1
+    else:
+        start = 0
+
+    section_level = 2 if any(level == 2 for _, level, _ in headings) else 1
+    boundaries = [(index, text) for index, level, text in headings if level == section_level]
+
+    sections: List[ReportSection] = []
+
+    def add(section_type: SectionType, section_title: str, body: List[str]) -> None:
+        content = _body(body)
+        if content or section_type != SectionType.OTHER:
+            sections.append(
+                ReportSection(
+                    section_type=section_type,
+                    title=section_title,
+                    content=content,
+                    order=len(sections),
+                )
+            )
+
+    first = boundaries[0][0] if boundaries else len(lines)
+    add(SectionType.OTHER, PREAMBLE_TITLE, lines[start:first])
+    for position, (index, text) in enumerate(boundaries):
+        end = boundaries[position + 1][0] if position + 1 < len(boundaries) else len(lines)
+        section_title = _clean_heading(text)
+        add(classify_section(section_title), section_title, lines[index + 1:end])
+
+    return ResearchReport(
+        metadata=metadata or ReportMetadata(
+            title=title or f"Research Report: {topic}",
+            topic=topic,
+        ),
+        sections=sections,
+        raw_content=markdown,
+    )
@@ -1,16 +1,26 @@
 """Research Bot - Multi-Agent Research System."""
 
 import argparse
+import contextlib
 import logging
 import os
+import signal
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, cast
 
 # Ensure output is not buffered
 os.environ["PYTHONUNBUFFERED"] = "1"
 
-from research_bot.config.settings import Settings
-from research_bot.services.research_service import ResearchService
+# Settings and ResearchService are imported inside main() after argument
+# parsing: they pull in pydantic-settings, CrewAI, the LLM stack and the tool
+# clients, which --help and usage errors should not have to load.
+if TYPE_CHECKING:
+    from research_bot.config.settings import Settings
+    from research_bot.distributed.store import KeyValueStore, RedisLike
+    from research_bot.services.job_queue import QueueBackend
+    from research_bot.services.research_service import ResearchService
+    from research_bot.services.scheduler import JobScheduler
 
 BANNER = """
 ╔══════════════════════════════════════════════════════════════╗
@@ -39,8 +49,628 @@ def setup_logging(level: str) -> None:
     )
 
 
+def load_settings() -> "Settings":
+    """Load settings from the environment, exiting with help on failure."""
+    from research_bot.config.settings import Settings
+
+    try:
+        settings = Settings()
+    except Exception as e:
+        print(f"❌ Error loading settings: {e}")
+        print("\n📋 Make sure you have a .env file with:")
+        print("   TAVILY_API_KEY=your-key")
+        print("   SCRAPE_DO_API_KEY=your-key")
+        print("   GOOGLE_API_KEY=your-key")
+        sys.exit(1)
+
+    # Set API keys in environment for CrewAI/Gemini
+    os.environ["GOOGLE_API_KEY"] = settings.google_api_key
+    return settings
+
+
+def build_service(
+    settings: "Settings",
+    record_dir: str | None = None,
+    replay_dir: str | None = None,
+    replay_latency: str = "none",
+) -> "ResearchService":
+    """Create the research service, optionally recording or replaying fixtures."""
+    from research_bot.services.research_service import (
+        DefaultToolProvider,
+        ResearchService,
+        create_llm,
+    )
+
+    if replay_dir:
+        from research_bot.replay import (
+            FixtureStore,
+            ReplayLLM,
+            ReplayToolProvider,
+            parse_latency,
+        )
+
+        store = FixtureStore(replay_dir)
+        latency = parse_latency(replay_latency)
+        return ResearchService(
+            settings,
+            tool_provider=ReplayToolProvider(store, latency=latency),
+            llm=ReplayLLM(store, latency=latency),
+        )
+
+    if record_dir:
+        from research_bot.replay import FixtureStore, RecordingLLM, RecordingToolProvider
+
+        store = FixtureStore(record_dir)
+        return ResearchService(
+            settings,
+            tool_provider=RecordingToolProvider(DefaultToolProvider(settings), store),
+            llm=RecordingLLM(create_llm(settings), store),
+        )
+
+    return ResearchService(settings)
+
+
+def setting_or_default(name: str) -> Any:
+    """Read one setting, falling back to its default when API keys are missing."""
+    from research_bot.config.settings import Settings
+
+    try:
+        return getattr(Settings(), name)
+    except Exception:
+        pass
+    # Placeholders for the required API keys, so environment overrides still apply
+    placeholders = {
+        field: "unset" for field, info in Settings.model_fields.items() if info.is_required()
+    }
+    try:
+        return getattr(Settings(**placeholders), name)
+    except Exception:
+        return Settings.model_fields[name].default
+
+
+def open_shared_store() -> "KeyValueStore":
+    """The deployment's shared store from settings, without requiring API keys."""
+    from research_bot.distributed.store import create_store
+
+    return create_store(
+        setting_or_default("shared_store"),
+        setting_or_default("shared_store_path"),
+        setting_or_default("redis_url"),
+    )
+
+
+def open_job_queue(
+    path: Optional[str] = None,
+    store: Optional["KeyValueStore"] = None,
+    scheduler: Optional["JobScheduler"] = None,
+) -> "QueueBackend":
+    """
+    The deployment's job queue from settings, without requiring API keys.
+
+    Args:
+        path: SQLite queue database; overrides the settings (and the redis backend).
+        store: Shared store for the redis backend (opened from settings if omitted).
+        scheduler: Picks the job each claim takes (workers only).
+    """
+    from research_bot.services.job_queue import JobQueue
+
+    lease_seconds = setting_or_default("job_lease_seconds")
+    max_attempts = setting_or_default("job_max_attempts")
+    if path or setting_or_default("shared_store").strip().lower() != "redis":
+        return JobQueue(
+            path or setting_or_default("job_queue_path"),
+            lease_seconds=lease_seconds,
+            max_attempts=max_attempts,
+            scheduler=scheduler,
+        )
+
+    from research_bot.distributed.queue import RedisJobQueue
+
+    # The redis backend's store is a Redis client (or LocalRedis)
+    return RedisJobQueue(
+        cast("RedisLike", store or open_shared_store()),
+        lease_seconds=lease_seconds,
+        max_attempts=max_attempts,
+        scheduler=scheduler,
+    )
+
+
+def run_worker(argv: List[str]) -> None:
+    """Run a long-lived worker that executes queued research jobs."""
+    parser = argparse.ArgumentParser(
+        prog="research-bot worker",
+        description="Process queued research jobs with warm clients and caches",
+    )
+    parser.add_argument(
+        "--queue",
+        help="SQLite job queue database (default: SHARED_STORE's queue, JOB_QUEUE_PATH for sqlite)",
+    )
+    parser.add_argument("--node-id", help="Worker id in job leases and metrics (default: NODE_ID)")
+    parser.add_argument("--output-dir", help="Report directory (default: WORKER_OUTPUT_DIR)")
+    parser.add_argument(
+        "--concurrency", "-c",
+        type=int,
+        help="Jobs to run at once (default: WORKER_CONCURRENCY)",
+    )
+    parser.add_argument(
+        "--drain",
+        action="store_true",
+        help="Exit once the queue is empty",
+    )
+    parser.add_argument(
+        "--verbose", "-v",
+        action="store_true",
+        help="Enable debug logging",
+    )
+    args = parser.parse_args(argv)
+
+    settings = load_settings()
+    setup_logging("DEBUG" if args.verbose else settings.log_level)
+
+    from research_bot.distributed.metrics import ClusterMetrics, default_node_id
+    from research_bot.services.research_service import ResearchService
+    from research_bot.services.scheduler import JobScheduler, SchedulingPolicy
+    from research_bot.services.worker import ResearchWorker
+
+    store = open_shared_store()
+    service = ResearchService(settings, shared_store=store)
+    scheduler = JobScheduler(
+        SchedulingPolicy.from_settings(settings), headroom=service.provider_headroom
+    )
+    worker = ResearchWorker(
+        service,
+        open_job_queue(args.queue, store, scheduler),
+        output_dir=args.output_dir or settings.worker_output_dir,
+        concurrency=args.concurrency or settings.worker_concurrency,
+        poll_interval=settings.worker_poll_interval,
+        worker_id=args.node_id or settings.node_id or default_node_id(),
+        heartbeat_interval=settings.job_lease_seconds / 3,
+        metrics=ClusterMetrics(store, node_timeout_seconds=settings.job_lease_seconds),
+    )
+    signal.signal(signal.SIGTERM, lambda *_: worker.stop())
+
+    try:
+        processed = worker.run(drain=args.drain)
+    finally:
+        service.close()
+    print(f"✅ Worker stopped after {processed} job(s)")
+
+
+def run_server(argv: List[str]) -> None:
+    """Serve the HTTP API backed by one shared research service."""
+    parser = argparse.ArgumentParser(
+        prog="research-bot serve",
+        description="Run the research job HTTP API",
+    )
+    parser.add_argument("--host", help="Bind address (default: API_HOST)")
+    parser.add_argument("--port", type=int, help="Port (default: API_PORT)")
+    parser.add_argument(
+        "--concurrency", "-c",
+        type=int,
+        help="Pipelines to run at once (default: API_CONCURRENCY)",
+    )
+    parser.add_argument(
+        "--verbose", "-v",
+        action="store_true",
+        help="Enable debug logging",
+    )
+    args = parser.parse_args(argv)
+
+    settings = load_settings()
+    setup_logging("DEBUG" if args.verbose else settings.log_level)
+
+    import asyncio
+
+    from research_bot.api import JobManager, ResearchAPIServer
+    from research_bot.services.research_service import ResearchService
+    from research_bot.services.scheduler import JobScheduler, SchedulingPolicy
+
+    service = ResearchService(settings)
+    manager = JobManager(
+        service,
+        output_dir=settings.api_output_dir,
+        concurrency=args.concurrency or settings.api_concurrency,
+        max_pending=settings.api_max_pending,
+        scheduler=JobScheduler(
+            SchedulingPolicy.from_settings(settings), headroom=service.provider_headroom
+        ),
+    )
+    server = ResearchAPIServer(
+        manager,
+        host=args.host or settings.api_host,
+        port=args.port or settings.api_port,
+    )
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        print("\n⚠️ Shutting down, waiting for running jobs...")
+    finally:
+        manager.shutdown()
+        service.close()
+
+
+def submit_job(argv: List[str]) -> None:
+    """Add a research job to the queue."""
+    from research_bot.models.job import JobPriority
+
+    parser = argparse.ArgumentParser(
+        prog="research-bot submit",
+        description="Queue a research topic for a worker",
+    )
+    parser.add_argument("topic", help="The research topic or question")
+    parser.add_argument("--output", "-o", help="Report path (default: <output-dir>/<job-id>.md)")
+    parser.add_argument(
+        "--priority", "-p",
+        choices=[priority.value for priority in JobPriority],
+        default=JobPriority.STANDARD.value,
+        help="Scheduling class (default: standard)",
+    )
+    parser.add_argument("--tenant", default="default", help="Team or client the job runs for")
+    parser.add_argument("--queue", help="SQLite job queue database (default: from settings)")
+    args = parser.parse_args(argv)
+
+    job = open_job_queue(args.queue).submit(
+        args.topic,
+        output_file=args.output,
+        priority=JobPriority(args.priority),
+        tenant=args.tenant,
+    )
+    print(job.id)
+
+
+def list_jobs(argv: List[str]) -> None:
+    """Print queued, running and finished jobs."""
+    from research_bot.models.job import JobStatus
+
+    parser = argparse.ArgumentParser(
+        prog="research-bot jobs",
+        description="Show research job status",
+    )
+    parser.add_argument("--queue", help="SQLite job queue database (default: from settings)")
+    parser.add_argument(
+        "--status",
+        choices=[status.value for status in JobStatus],
+        help="Only show jobs with this status",
+    )
+    parser.add_argument("--limit", type=int, default=20, help="Jobs to show (default: 20)")
+    parser.add_argument(
+        "--waits",
+        action="store_true",
+        help="Show queue wait times per priority class over the last 1000 jobs instead",
+    )
+    args = parser.parse_args(argv)
+
+    queue = open_job_queue(args.queue)
+    if args.waits:
+        from research_bot.services.scheduler import wait_summary
+
+        print(
+            f"{'class':<12} {'started':>7} {'p50 s':>8} {'p90 s':>8} {'p99 s':>8} "
+            f"{'queued':>7} {'oldest s':>9}"
+        )
+        for waits in wait_summary(queue.list_jobs(limit=1000)):
+            print(
+                f"{waits.priority.value:<12} {waits.started:>7} {waits.wait_seconds.p50:>8.1f} "
+                f"{waits.wait_seconds.p90:>8.1f} {waits.wait_seconds.p99:>8.1f} "
+                f"{waits.queued:>7} {waits.oldest_queued_seconds:>9.0f}"
+            )
+        return
+
+    status = JobStatus(args.status) if args.status else None
+    for job in queue.list_jobs(status=status, limit=args.limit):
+        duration = f"{job.duration_seconds:.0f}s" if job.duration_seconds is not None else "-"
+        detail = job.error or job.output_file or ""
+        print(
+            f"{job.id}  {job.status.value:<9}  {job.priority.value:<11}  {duration:>6}  "
+            f"{job.topic[:50]:<50}  {detail}"
+        )
+
+
+def show_stats(argv: List[str]) -> None:
+    """Print latency, token and cost percentiles from the run history."""
+    parser = argparse.ArgumentParser(
+        prog="research-bot stats",
+        description="Summarize recorded research runs",
+    )
+    parser.add_argument("--db", help="Run history database (default: RUN_HISTORY_PATH)")
+    parser.add_argument("--days", type=float, help="Only include runs from the last N days")
+    parser.add_argument(
+        "--recent",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Also list the N most recent runs",
+    )
+    parser.add_argument("--json", action="store_true", help="Print the summary as JSON")
+    args = parser.parse_args(argv)
+
+    import dataclasses
+    import json
+    from datetime import datetime, timedelta
+
+    from research_bot.services.run_store import RunStore, RunSummary
+
+    path = args.db or setting_or_default("run_history_path")
+    if not path or not Path(path).exists():
+        print(f"No run history at {path or '(disabled)'}")
+        sys.exit(1)
+
+    store = RunStore(path)
+    since = datetime.now() - timedelta(days=args.days) if args.days else None
+    runs = store.list_runs(since=since)
+    summary = RunSummary.of(runs)
+
+    if args.json:
+        print(json.dumps(dataclasses.asdict(summary), indent=2))
+        return
+
+    window = f"last {args.days:g} day(s)" if args.days else "all time"
+    print(f"Runs: {summary.runs} ({summary.failed} failed), {window}")
+    if not summary.runs:
+        return
+
+    print(f"\n{'metric':<22} {'p50':>10} {'p90':>10} {'p99':>10} {'mean':>10}")
+    rows = [("duration (s)", summary.duration_seconds)]
+    rows.extend((f"  {phase} (s)", dist) for phase, dist in summary.phase_seconds.items())
+    rows.extend([
+        ("tokens", summary.total_tokens),
+        ("cost (USD)", summary.cost_usd),
+        ("tool calls", summary.tool_calls),
+    ])
+    for label, dist in rows:
+        print(
+            f"{label:<22} {dist.p50:>10.4g} {dist.p90:>10.4g} {dist.p99:>10.4g} "
+            f"{dist.mean:>10.4g}"
+        )
+
+    hit_rate = f"{summary.cache_hit_rate:.0%}" if summary.cache_hit_rate is not None else "-"
+    print(f"\nTotal cost: ${summary.total_cost_usd:.4f}   Cache hit rate: {hit_rate}")
+    if summary.deadline_runs:
+        print(
+            f"Deadlines: {summary.deadline_misses} of {summary.deadline_runs} run(s) "
+            f"overran, {summary.degraded_phases} phase(s) degraded"
+        )
+    if summary.prefetches_issued:
+        print(
+            f"Prefetch: {summary.prefetches_issued} page(s) fetched ahead, "
+            f"{summary.prefetches_used} used, {summary.prefetches_wasted} wasted, "
+            f"{summary.prefetch_saved_seconds:.1f}s of fetching overlapped"
+        )
+
+    if args.recent:
+        print()
+        for run in runs[: args.recent]:
+            print(
+                f"{run.id}  {run.started_at:%Y-%m-%d %H:%M}  {run.status.value:<9}  "
+                f"{run.duration_seconds:>7.1f}s  {run.tokens.total_tokens:>8} tok  "
+                f"${run.cost_usd:.4f}  {run.topic[:40]}"
+            )
+
+
+def show_cluster(argv: List[str]) -> None:
+    """Print throughput and load of the worker nodes sharing the store."""
+    parser = argparse.ArgumentParser(
+        prog="research-bot cluster",
+        description="Show job throughput and load across worker nodes",
+    )
+    parser.add_argument(
+        "--minutes",
+        type=int,
+        default=15,
+        help="Window the jobs/minute rate averages over (default: 15)",
+    )
+    args = parser.parse_args(argv)
+
+    from research_bot.distributed.metrics import ClusterMetrics
+
+    metrics = ClusterMetrics(
+        open_shared_store(),
+        node_timeout_seconds=setting_or_default("job_lease_seconds"),
+    )
+    summary = metrics.summary(window_minutes=args.minutes)
+    live = sum(1 for node in summary.nodes if node.alive)
+    print(
+        f"Nodes: {live} live of {len(summary.nodes)}   "
+        f"Throughput: {summary.jobs_per_minute:.2f} jobs/min (last {args.minutes} min)   "
+        f"Slots in use: {summary.utilization:.0%}"
+    )
+    print(
+        f"Jobs: {summary.succeeded} succeeded, {summary.failed} failed, "
+        f"{summary.requeued} requeued"
+    )
+    if summary.nodes:
+        print(
+            f"\n{'node':<32} {'state':<6} {'seen':>7} {'running':>9} {'ok':>6} "
+            f"{'failed':>7} {'busy s':>9}"
+        )
+    for node in summary.nodes:
+        state = "live" if node.alive else "lost"
+        print(
+            f"{node.node_id[:32]:<32} {state:<6} {node.seen_seconds_ago:>6.0f}s "
+            f"{node.running:>4}/{node.concurrency:<4} {node.succeeded:>6} {node.failed:>7} "
+            f"{node.busy_seconds:>9.0f}"
+        )
+
+
+def show_url_health(argv: List[str]) -> None:
+    """Print URLs known to fail and per-domain fetch statistics."""
+    parser = argparse.ArgumentParser(
+        prog="research-bot health",
+        description="Show rejected URLs and per-domain page fetch health",
+    )
+    parser.add_argument("--db", help="URL health database (default: URL_HEALTH_PATH)")
+    parser.add_argument("--limit", type=int, default=20, help="Rows per table (default: 20)")
+    args = parser.parse_args(argv)
+
+    from datetime import datetime
+
+    from research_bot.tools.url_health import UrlHealth
+
+    path = args.db or setting_or_default("url_health_path")
+    if not path or not Path(path).exists():
+        print(f"No URL health database at {path or '(disabled)'}")
+        sys.exit(1)
+
+    health = UrlHealth(path, slow_seconds=setting_or_default("slow_domain_seconds"))
+    rejected = health.rejected()
+    print(f"Rejected URLs: {len(rejected)}")
+    for failure in rejected[: args.limit]:
+        until = datetime.fromtimestamp(failure.expires_at or 0.0)
+        print(f"  until {until:%Y-%m-%d %H:%M}  {failure.reason:<40} {failure.url}")
+
+    domains = health.domains()
+    print(f"\nDomains: {len(domains)}")
+    if domains:
+        print(f"  {'domain':<40} {'fetches':>8} {'success':>8} {'latency s':>10}")
+    for stats in domains[: args.limit]:
+        print(
+            f"  {stats.domain[:40]:<40} {stats.samples:>8} "
+            f"{stats.success_rate:>8.0%} {stats.latency_seconds:>10.1f}"
+        )
+
+
+def export_reports(argv: List[str]) -> None:
+    """Convert existing markdown reports into other formats."""
+    parser = argparse.ArgumentParser(
+        prog="research-bot export",
+        description="Parse markdown reports once and write them in other formats",
+    )
+    parser.add_argument("reports", nargs="+", help="Markdown report files")
+    parser.add_argument(
+        "--formats",
+        default="json,html,index",
+        help="Comma-separated formats: md, json, html, index (default: json,html,index)",
+    )
+    parser.add_argument("--topic", help="Research topic (default: the file name)")
+    args = parser.parse_args(argv)
+
+    from research_bot.export import ExportPipeline, parse_report
+
+    try:
+        pipeline = ExportPipeline(args.formats)
+    except ValueError as e:
+        parser.error(str(e))
+
+    failed = False
+    for name in args.reports:
+        path = Path(name)
+        try:
+            markdown = path.read_text(encoding="utf-8")
+        except OSError as e:
+            print(f"{path}: {e}", file=sys.stderr)
+            failed = True
+            continue
+        report = parse_report(markdown, args.topic or path.stem)
+        written = pipeline.export(report, path)
+        files = ", ".join(str(p) for p in written.values())
+        print(f"{path}: {len(report.sections)} sections -> {files}")
+    if failed:
+        sys.exit(1)
+
+
+def verify_citations(argv: List[str]) -> None:
+    """Check the URLs cited in existing reports."""
+    parser = argparse.ArgumentParser(
+        prog="research-bot citations",
+        description=(
+            "Cross-check cited URLs against the sources each run fetched and "
+            "check the rest live; writes <report>.citations.json"
+        ),
+    )
+    parser.add_argument("reports", nargs="+", help="Markdown report files")
+    parser.add_argument(
+        "--db", help="Run history database with run sources (default: RUN_HISTORY_PATH)"
+    )
+    parser.add_argument(
+        "--concurrency", "-c",
+        type=int,
+        help="URLs checked at once (default: CITATION_CHECK_CONCURRENCY)",
+    )
+    parser.add_argument(
+        "--per-host",
+        type=float,
+        help="Requests per second per host, 0 for no limit (default: CITATION_REQUESTS_PER_HOST)",
+    )
+    parser.add_argument(
+        "--strict",
+        action="store_true",
+        help="Exit non-zero if any citation is broken, unreachable or invalid",
+    )
+    args = parser.parse_args(argv)
+
+    from research_bot.services.citations import CitationVerifier, UrlChecker
+    from research_bot.services.run_store import RunStore
+
+    db = args.db or setting_or_default("run_history_path")
+    store = RunStore(db) if db and Path(db).exists() else None
+
+    batch = []
+    failed = False
+    for name in args.reports:
+        path = Path(name)
+        try:
+            markdown = path.read_text(encoding="utf-8")
+        except OSError as e:
+            print(f"{path}: {e}", file=sys.stderr)
+            failed = True
+            continue
+        run = store.find_by_output_file(path) if store is not None else None
+        batch.append((path, markdown, run.sources if run is not None else []))
+
+    checker = UrlChecker(
+        concurrency=args.concurrency or setting_or_default("citation_check_concurrency"),
+        requests_per_host=(
+            args.per_host if args.per_host is not None
+            else setting_or_default("citation_requests_per_host")
+        ),
+        timeout=setting_or_default("citation_timeout_seconds"),
+    )
+    reports = CitationVerifier(checker).verify_batch(
+        [(path.stem, markdown, sources) for path, markdown, sources in batch]
+    )
+
+    unverified = 0
+    for (path, _, sources), report in zip(batch, reports):
+        output = path.with_suffix(".citations.json")
+        output.write_text(report.model_dump_json(indent=2), encoding="utf-8")
+        counts = (
+            ", ".join(f"{count} {status}" for status, count in report.counts.items()) or "no URLs"
+        )
+        origin = "" if sources else " (no run sources)"
+        print(f"{path}: {counts}{origin} -> {output}")
+        for citation in report.unverified:
+            detail = citation.http_status or citation.error or ""
+            print(f"    {citation.status.value:<11} {detail}  {citation.url}")
+        unverified += len(report.unverified)
+    if failed or (args.strict and unverified):
+        sys.exit(1)
+
+
+# Subcommands dispatched before the default "research a topic" parser; a
+# topic spelled like one is researched with "run <topic>" or "-- <topic>"
+RUN_COMMAND = "run"
+COMMANDS: Dict[str, Callable[[List[str]], None]] = {
+    "worker": run_worker,
+    "serve": run_server,
+    "submit": submit_job,
+    "jobs": list_jobs,
+    "cluster": show_cluster,
+    "stats": show_stats,
+    "health": show_url_health,
+    "export": export_reports,
+    "citations": verify_citations,
+}
+
+
 def main() -> None:
     """Main entry point."""
+    argv = sys.argv[1:]
+    if argv and argv[0] == RUN_COMMAND:
+        argv = argv[1:]
+    elif argv and argv[0] in COMMANDS:
+        COMMANDS[argv[0]](argv[1:])
+        return
+
     parser = argparse.ArgumentParser(
         description="Research Bot - Multi-Agent AI Research System",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -49,11 +679,41 @@ Examples:
   research-bot "Impact of AI on healthcare in 2025"
   research-bot "Quantum computing market analysis" -o quantum_report.md
   research-bot "Electric vehicle trends" --verbose
+  research-bot "Electric vehicle trends" --deadline 5m
+  research-bot "Electric vehicle trends" --profile fast
+  research-bot "Electric vehicle trends" --formats md,json,html,index
+  research-bot "Electric vehicle trends" --record fixtures/ev
+  research-bot "Electric vehicle trends" --replay fixtures/ev --replay-latency recorded
+  research-bot "Electric vehicle trends" --replay fixtures/ev --profile-dir profiles/ev
+
+Topics named like a subcommand (run, worker, serve, submit, jobs, cluster,
+stats, health, export, citations):
+  research-bot run stats
+  research-bot -- "export"
+
+Worker mode:
+  research-bot submit "Renewable energy outlook"
+  research-bot worker --concurrency 4
+  research-bot jobs --status failed
+  research-bot submit "Market map" --priority batch --tenant nightly
+  research-bot jobs --waits
+  research-bot cluster
+
+HTTP API:
+  research-bot serve --port 8000
+
+Run history:
+  research-bot stats --days 7 --recent 10
+  research-bot health
+
+Existing reports:
+  research-bot export reports/*.md --formats json,html,index
+  research-bot citations reports/*.md --strict
         """,
     )
     parser.add_argument(
         "topic",
-        help="The research topic or question",
+        help="The research topic or question (see below for topics named like a subcommand)",
     )
     parser.add_argument(
         "--output", "-o",
@@ -70,22 +730,105 @@ Examples:
         action="store_true",
         help="Minimal output (no banner)",
     )
+    fixtures = parser.add_mutually_exclusive_group()
+    fixtures.add_argument(
+        "--record",
+        metavar="DIR",
+        help="Record tool results and LLM completions to DIR",
+    )
+    fixtures.add_argument(
+        "--replay",
+        metavar="DIR",
+        help="Replay fixtures from DIR instead of calling APIs (no keys needed)",
+    )
+    parser.add_argument(
+        "--deadline",
+        metavar="DURATION",
+        help="Time limit for the run, e.g. 300, 90s, 5m (default: DEFAULT_DEADLINE_SECONDS)",
+    )
+    parser.add_argument(
+        "--profile",
+        metavar="NAME",
+        help="Pipeline profile: fast, standard or deep (default: PIPELINE_PROFILE)",
+    )
+    parser.add_argument(
+        "--formats",
+        metavar="LIST",
+        help="Report formats to write: md, json, html, index (default: REPORT_FORMATS)",
+    )
+    parser.add_argument(
+        "--replay-latency",
+        default="none",
+        metavar="SPEC",
+        help="Injected replay delay: none, recorded[:scale], fixed:S, lognormal:MEDIAN[:SIGMA]",
+    )
+    parser.add_argument(
+        "--profile-dir",
+        metavar="DIR",
+        help="Write per-phase CPU profiles and flamegraph stacks to DIR",
+    )
+    parser.add_argument(
+        "--profile-mode",
+        choices=("sample", "deterministic"),
+        default="sample",
+        help="Stack sampling only, or also a cProfile per phase (default: sample)",
+    )
+    parser.add_argument(
+        "--profile-interval",
+        type=float,
+        default=5.0,
+        metavar="MS",
+        help="Milliseconds between stack samples (default: 5)",
+    )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
-    # Load settings
-    try:
-        settings = Settings()
-    except Exception as e:
-        print(f"❌ Error loading settings: {e}")
-        print("\n📋 Make sure you have a .env file with:")
-        print("   TAVILY_API_KEY=your-key")
-        print("   SCRAPE_DO_API_KEY=your-key")
-        print("   GOOGLE_API_KEY=your-key")
-        sys.exit(1)
+    deadline = None
+    if args.deadline:
+        from research_bot.services.deadline import parse_duration
 
-    # Set API keys in environment for CrewAI/Gemini
-    os.environ["GOOGLE_API_KEY"] = settings.google_api_key
+        try:
+            deadline = parse_duration(args.deadline)
+        except ValueError as e:
+            parser.error(str(e))
+
+    formats = None
+    if args.formats:
+        from research_bot.export.exporters import parse_formats
+
+        try:
+            formats = parse_formats(args.formats)
+        except ValueError as e:
+            parser.error(str(e))
+
+    if args.profile:
+        from research_bot.config.profiles import get_profile
+
+        try:
+            get_profile(args.profile)
+        except ValueError as e:
+            parser.error(str(e))
+
+    profiler = None
+    if args.profile_dir:
+        from research_bot.services.profiling import PipelineProfiler
+
+        try:
+            profiler = PipelineProfiler(
+                args.profile_dir,
+                mode=args.profile_mode,
+                interval_seconds=args.profile_interval / 1000,
+            )
+        except ValueError as e:
+            parser.error(str(e))
+
+    if args.replay:
+        # Replay never calls the APIs; placeholders satisfy required settings
+        for key in ("TAVILY_API_KEY", "SCRAPE_DO_API_KEY", "GOOGLE_API_KEY"):
+            os.environ.setdefault(key, "replay")
+
+    # Load settings
+    settings = load_settings()
 
     # Setup logging
     log_level = "DEBUG" if args.verbose else settings.log_level
@@ -96,9 +839,23 @@ Examples:
         print(BANNER)
 
     # Execute research
+    service: Optional["ResearchService"] = None
     try:
-        service = ResearchService(settings)
-        report = service.execute_research(args.topic, output_file=args.output)
+        service = build_service(
+            settings,
+            record_dir=args.record,
+            replay_dir=args.replay,
+            replay_latency=args.replay_latency,
+        )
+        with profiler or contextlib.nullcontext():
+            report = service.execute_research(
+                args.topic,
+                output_file=args.output,
+                on_progress=profiler.on_progress if profiler else None,
+                deadline=deadline,
+                formats=formats,
+                profile=args.profile,
+            )
 
         # Show success
         output_path = Path(args.output)
@@ -109,6 +866,8 @@ Examples:
         print(preview)
         print("-" * 40)
         print(f"\n✅ Full report saved to: {output_path.absolute()}")
+        if profiler is not None:
+            print(f"🔥 Profile written to: {profiler.output_dir.absolute()}")
 
     except KeyboardInterrupt:
         print("\n\n⚠️ Research interrupted by user.")
@@ -117,6 +876,10 @@ Examples:
         logging.getLogger(__name__).exception("Research failed")
         print(f"\n❌ Error: {e}")
         sys.exit(1)
+    finally:
+        # Don't let in-flight prefetches keep a finished run alive
+        if service is not None:
+            service.close()
 
 
 if __name__ == "__main__":
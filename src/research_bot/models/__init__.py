@@ -5,11 +5,39 @@ from research_bot.models.research import (
     ResearchFinding,
     ResearchPhase,
     ResearchResult,
+    PhaseStatus,
+    PhaseUpdate,
 )
 from research_bot.models.report import (
     ReportSection,
     ReportMetadata,
+    ReportIndex,
     ResearchReport,
+    SectionType,
+)
+from research_bot.models.job import (
+    JobPriority,
+    JobStatus,
+    ResearchJob,
+)
+from research_bot.models.citation import (
+    Citation,
+    CitationReport,
+    CitationStatus,
+)
+from research_bot.models.plan import (
+    PlannedQuery,
+    QueryPlan,
+    SourceType,
+)
+from research_bot.models.run import (
+    PhaseBudget,
+    PhaseTiming,
+    PrefetchUsage,
+    RunRecord,
+    RunStatus,
+    TokenUsage,
+    ToolUsage,
 )
 
 __all__ = [
@@ -17,7 +45,27 @@ __all__ = [
     "ResearchFinding",
     "ResearchPhase",
     "ResearchResult",
+    "PhaseStatus",
+    "PhaseUpdate",
     "ReportSection",
     "ReportMetadata",
+    "ReportIndex",
+    "SectionType",
     "ResearchReport",
+    "JobPriority",
+    "JobStatus",
+    "ResearchJob",
+    "Citation",
+    "CitationReport",
+    "CitationStatus",
+    "PlannedQuery",
+    "QueryPlan",
+    "SourceType",
+    "PhaseBudget",
+    "PhaseTiming",
+    "PrefetchUsage",
+    "RunRecord",
+    "RunStatus",
+    "TokenUsage",
+    "ToolUsage",
 ]
@@ -0,0 +1,59 @@
+"""Citation verification data models."""
+
+from datetime import datetime
+from enum import Enum
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class CitationStatus(str, Enum):
+    """Enum for the outcome of checking one cited URL."""
+
+    SOURCED = "sourced"  # Appeared in the run's tool results; no request made
+    OK = "ok"  # Responded with a success or redirect status
+    BLOCKED = "blocked"  # Exists but refused the check (401/403/429)
+    BROKEN = "broken"  # Responded with another error status
+    UNREACHABLE = "unreachable"  # Connection error or timeout
+    INVALID = "invalid"  # Not a well-formed http(s) URL
+
+    @property
+    def is_verified(self) -> bool:
+        """Whether the citation is backed by a source or a live page."""
+        return self in (CitationStatus.SOURCED, CitationStatus.OK, CitationStatus.BLOCKED)
+
+
+class Citation(BaseModel):
+    """Model for one cited URL and how it was verified."""
+
+    url: str = Field(..., description="Cited URL")
+    status: CitationStatus = Field(..., description="Verification outcome")
+    http_status: Optional[int] = Field(None, description="Final HTTP status, if requested")
+    error: Optional[str] = Field(None, description="Request error, if any")
+
+    class Config:
+        frozen = True
+
+
+class CitationReport(BaseModel):
+    """Model for the citation check of one report."""
+
+    report_id: str = Field(..., description="Report identifier (output file stem)")
+    checked_at: datetime = Field(default_factory=datetime.now)
+    citations: List[Citation] = Field(default_factory=list)
+
+    class Config:
+        frozen = True
+
+    @property
+    def counts(self) -> Dict[str, int]:
+        """Number of citations per status."""
+        counts: Dict[str, int] = {}
+        for citation in self.citations:
+            counts[citation.status.value] = counts.get(citation.status.value, 0) + 1
+        return counts
+
+    @property
+    def unverified(self) -> List[Citation]:
+        """Citations that are neither sourced nor reachable."""
+        return [citation for citation in self.citations if not citation.status.is_verified]
@@ -0,0 +1,74 @@
+"""Research job data models."""
+
+from datetime import datetime
+from enum import Enum
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class JobStatus(str, Enum):
+    """Enum for research job lifecycle states."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+    @property
+    def is_terminal(self) -> bool:
+        """Whether the job has finished (successfully or not)."""
+        return self in (JobStatus.SUCCEEDED, JobStatus.FAILED)
+
+
+class JobPriority(str, Enum):
+    """Scheduling class of a research job, most urgent first."""
+
+    INTERACTIVE = "interactive"
+    STANDARD = "standard"
+    BATCH = "batch"
+
+    @property
+    def rank(self) -> int:
+        """0 for the most urgent class."""
+        return list(JobPriority).index(self)
+
+
+class ResearchJob(BaseModel):
+    """Model for a queued research job."""
+
+    id: str = Field(..., description="Unique job identifier")
+    topic: str = Field(..., description="The research topic")
+    status: JobStatus = Field(default=JobStatus.QUEUED)
+    priority: JobPriority = Field(default=JobPriority.STANDARD)
+    tenant: str = Field(
+        default="default", min_length=1, description="Team or client the job runs for"
+    )
+    output_file: Optional[str] = Field(None, description="Path of the written report")
+    error: Optional[str] = Field(None, description="Failure message, if any")
+    report_length: Optional[int] = Field(None, ge=0, description="Report size in characters")
+    created_at: datetime = Field(default_factory=datetime.now)
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    worker_id: Optional[str] = Field(None, description="Node holding (or last holding) the job")
+    attempts: int = Field(default=0, ge=0, description="Times the job was claimed")
+    lease_expires_at: Optional[datetime] = Field(
+        None, description="When a running job is requeued unless its worker heartbeats"
+    )
+
+    class Config:
+        frozen = True
+
+    @property
+    def duration_seconds(self) -> Optional[float]:
+        """Execution time in seconds, once the job has finished."""
+        if self.started_at and self.finished_at:
+            return (self.finished_at - self.started_at).total_seconds()
+        return None
+
+    @property
+    def wait_seconds(self) -> Optional[float]:
+        """Time spent queued before the (last) claim, once the job has started."""
+        if self.started_at:
+            return max(0.0, (self.started_at - self.created_at).total_seconds())
+        return None
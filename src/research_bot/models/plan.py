@@ -0,0 +1,41 @@
+"""Structured research plan models (plan-then-execute mode)."""
+
+from enum import Enum
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+class SourceType(str, Enum):
+    """Enum for the kind of source a planned query targets."""
+
+    ACADEMIC = "academic"
+    INDUSTRY = "industry"
+    NEWS = "news"
+    GOVERNMENT = "government"
+    GENERAL = "general"
+
+
+class PlannedQuery(BaseModel):
+    """Model for one web search of a query plan."""
+
+    query: str = Field(..., min_length=3, description="Web search query")
+    source_type: SourceType = Field(
+        default=SourceType.GENERAL,
+        description="Kind of source the query should surface",
+    )
+    purpose: str = Field(default="", description="Research question the query answers")
+
+    class Config:
+        frozen = True
+
+
+class QueryPlan(BaseModel):
+    """Model for the planner's structured output: what to search before research starts."""
+
+    questions: List[str] = Field(default_factory=list, description="Key research questions")
+    subtopics: List[str] = Field(default_factory=list, description="Priority subtopics")
+    queries: List[PlannedQuery] = Field(..., min_length=1, description="Searches to run")
+
+    class Config:
+        frozen = True
@@ -17,6 +17,7 @@ class SectionType(str, Enum):
     INDUSTRY_ANALYSIS = "industry_analysis"
     CONCLUSIONS = "conclusions"
     REFERENCES = "references"
+    OTHER = "other"
 
 
 class ReportSection(BaseModel):
@@ -44,6 +45,33 @@ class ReportMetadata(BaseModel):
         frozen = True
 
 
+class ReportIndexSection(BaseModel):
+    """Model for one section entry in a report index."""
+
+    type: SectionType = Field(..., description="Type of section")
+    title: str = Field(..., description="Section title")
+    chars: int = Field(..., ge=0, description="Section length in characters")
+
+    class Config:
+        frozen = True
+
+
+class ReportIndex(BaseModel):
+    """Compact, search-index friendly description of a report."""
+
+    id: str = Field(..., description="Report identifier (output file stem)")
+    title: str = Field(..., description="Report title")
+    topic: str = Field(..., description="Research topic")
+    generated_at: datetime = Field(..., description="When the report was generated")
+    summary: str = Field(default="", description="Plain-text executive summary excerpt")
+    sections: List[ReportIndexSection] = Field(default_factory=list)
+    sources: List[str] = Field(default_factory=list, description="Cited URLs")
+    word_count: int = Field(default=0, ge=0)
+
+    class Config:
+        frozen = True
+
+
 class ResearchReport(BaseModel):
     """Model for complete research report."""
 
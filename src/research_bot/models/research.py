@@ -17,6 +17,30 @@ class ResearchPhase(str, Enum):
     REPORT = "report"
 
 
+class PhaseStatus(str, Enum):
+    """Enum for phase progress transitions."""
+
+    STARTED = "started"
+    COMPLETED = "completed"
+
+
+class PhaseUpdate(BaseModel):
+    """Model for a progress notification emitted while a pipeline runs."""
+
+    phase: ResearchPhase = Field(..., description="Pipeline phase")
+    status: PhaseStatus = Field(..., description="Transition that occurred")
+    timestamp: datetime = Field(default_factory=datetime.now)
+    elapsed_seconds: Optional[float] = Field(
+        None,
+        ge=0.0,
+        description="Phase duration, set when the phase completes",
+    )
+    summary: Optional[str] = Field(None, description="Short summary of the phase output")
+
+    class Config:
+        frozen = True
+
+
 class ResearchSource(BaseModel):
     """Model for a research source/citation."""
 
@@ -0,0 +1,157 @@
+"""Run history data models."""
+
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+from research_bot.models.research import ResearchPhase
+
+
+class RunStatus(str, Enum):
+    """Enum for the outcome of a pipeline run."""
+
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class PhaseTiming(BaseModel):
+    """Model for the wall-clock time spent in one pipeline phase."""
+
+    phase: ResearchPhase = Field(..., description="Pipeline phase")
+    elapsed_seconds: float = Field(..., ge=0.0, description="Phase duration")
+
+    class Config:
+        frozen = True
+
+
+class PhaseBudget(BaseModel):
+    """Model for a phase's time budget under a run deadline and its actual use."""
+
+    phase: ResearchPhase = Field(..., description="Pipeline phase")
+    budget_seconds: float = Field(..., ge=0.0, description="Time allocated at phase start")
+    nominal_seconds: float = Field(..., ge=0.0, description="Share of the full deadline")
+    used_seconds: Optional[float] = Field(
+        None,
+        ge=0.0,
+        description="Time actually spent, once the phase completed",
+    )
+    degraded: bool = Field(
+        default=False,
+        description="Whether the phase ran with less than its nominal share",
+    )
+
+    class Config:
+        frozen = True
+
+    @property
+    def over_budget(self) -> bool:
+        """Whether the phase took longer than its allocated budget."""
+        return self.used_seconds is not None and self.used_seconds > self.budget_seconds
+
+
+class TokenUsage(BaseModel):
+    """Model for LLM token consumption of a run."""
+
+    prompt_tokens: int = Field(default=0, ge=0)
+    completion_tokens: int = Field(default=0, ge=0)
+    cached_prompt_tokens: int = Field(default=0, ge=0)
+    total_tokens: int = Field(default=0, ge=0)
+    requests: int = Field(default=0, ge=0, description="Successful LLM calls")
+
+    class Config:
+        frozen = True
+
+
+class ToolUsage(BaseModel):
+    """Model for how one tool was used during a run."""
+
+    tool: str = Field(..., description="Tool name")
+    calls: int = Field(default=0, ge=0)
+    errors: int = Field(default=0, ge=0, description="Calls that raised or returned an error")
+    cache_hits: int = Field(default=0, ge=0)
+    cache_misses: int = Field(default=0, ge=0)
+    fallbacks: int = Field(
+        default=0,
+        ge=0,
+        description=(
+            "Calls answered by a fallback (stale cache, direct fetch) while the provider failed"
+        ),
+    )
+    total_seconds: float = Field(default=0.0, ge=0.0, description="Time spent in the tool")
+
+    class Config:
+        frozen = True
+
+    @property
+    def cache_hit_rate(self) -> Optional[float]:
+        """Fraction of cache lookups that hit, or None without lookups."""
+        lookups = self.cache_hits + self.cache_misses
+        return self.cache_hits / lookups if lookups else None
+
+
+class PrefetchUsage(BaseModel):
+    """Model for the speculative page fetches of a run."""
+
+    issued: int = Field(default=0, ge=0, description="Prefetches that ran")
+    used: int = Field(default=0, ge=0, description="Prefetched pages the agents requested")
+    wasted: int = Field(default=0, ge=0, description="Fetched pages nobody requested")
+    failed: int = Field(default=0, ge=0)
+    cancelled: int = Field(default=0, ge=0, description="Dropped before they started")
+    saved_seconds: float = Field(
+        default=0.0,
+        ge=0.0,
+        description="Fetch time that ran ahead of the agents' requests",
+    )
+
+    class Config:
+        frozen = True
+
+
+class RunRecord(BaseModel):
+    """Model for one recorded ``execute_research`` call."""
+
+    id: str = Field(..., description="Unique run identifier")
+    topic: str = Field(..., description="The research topic")
+    status: RunStatus = Field(..., description="Run outcome")
+    error: Optional[str] = Field(None, description="Failure message, if any")
+    output_file: Optional[str] = Field(None, description="Path of the written report")
+    report_length: Optional[int] = Field(None, ge=0, description="Report size in characters")
+    started_at: datetime = Field(..., description="When the run started")
+    duration_seconds: float = Field(..., ge=0.0, description="Total wall-clock time")
+    settings: Dict[str, Any] = Field(
+        default_factory=dict,
+        description="Non-secret settings the run used",
+    )
+    phases: List[PhaseTiming] = Field(default_factory=list)
+    deadline_seconds: Optional[float] = Field(None, gt=0.0, description="Run deadline, if any")
+    budgets: List[PhaseBudget] = Field(
+        default_factory=list,
+        description="Per-phase budgets and actual use under the deadline",
+    )
+    tokens: TokenUsage = Field(default_factory=TokenUsage)
+    cost_usd: float = Field(default=0.0, ge=0.0, description="Estimated LLM cost")
+    tools: List[ToolUsage] = Field(default_factory=list)
+    prefetch: PrefetchUsage = Field(default_factory=PrefetchUsage)
+    sources: List[str] = Field(default_factory=list, description="URLs seen by the agents")
+
+    class Config:
+        frozen = True
+
+    @property
+    def missed_deadline(self) -> bool:
+        """Whether the run had a deadline and took longer."""
+        return self.deadline_seconds is not None and self.duration_seconds > self.deadline_seconds
+
+    @property
+    def tool_calls(self) -> int:
+        """Total number of tool calls."""
+        return sum(usage.calls for usage in self.tools)
+
+    @property
+    def cache_hit_rate(self) -> Optional[float]:
+        """Cache hit rate across all tools, or None without lookups."""
+        hits = sum(usage.cache_hits for usage in self.tools)
+        lookups = hits + sum(usage.cache_misses for usage in self.tools)
+        return hits / lookups if lookups else None
@@ -0,0 +1,40 @@
+"""
+Record/replay backends for running the pipeline without network access.
+
+Record once against the live APIs, then replay the fixtures on any machine
+(including air-gapped ones) with optional injected latency to benchmark
+pipeline overhead repeatably.
+"""
+
+from research_bot.replay.latency import (
+    FixedLatency,
+    LatencyModel,
+    LogNormalLatency,
+    NoLatency,
+    RecordedLatency,
+    parse_latency,
+)
+from research_bot.replay.llm import RecordingLLM, ReplayLLM
+from research_bot.replay.store import FixtureStore
+from research_bot.replay.tools import (
+    RecordingTool,
+    RecordingToolProvider,
+    ReplayTool,
+    ReplayToolProvider,
+)
+
+__all__ = [
+    "FixtureStore",
+    "LatencyModel",
+    "NoLatency",
+    "FixedLatency",
+    "RecordedLatency",
+    "LogNormalLatency",
+    "parse_latency",
+    "RecordingLLM",
+    "ReplayLLM",
+    "RecordingTool",
+    "RecordingToolProvider",
+    "ReplayTool",
+    "ReplayToolProvider",
+]
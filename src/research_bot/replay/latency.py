@@ -0,0 +1,89 @@
+"""Latency models injected by replaying tools and LLMs."""
+
+import random
+import threading
+from abc import ABC, abstractmethod
+from typing import Optional
+
+
+class LatencyModel(ABC):
+    """Strategy deciding how long a replayed call should take."""
+
+    @abstractmethod
+    def sample(self, recorded_seconds: Optional[float]) -> float:
+        """
+        Return the delay in seconds for one replayed call.
+
+        Args:
+            recorded_seconds: Duration observed when the fixture was recorded.
+        """
+        ...
+
+
+class NoLatency(LatencyModel):
+    """Replay instantly - measures pure pipeline overhead."""
+
+    def sample(self, recorded_seconds: Optional[float]) -> float:
+        return 0.0
+
+
+class FixedLatency(LatencyModel):
+    """Replay every call with the same delay."""
+
+    def __init__(self, seconds: float) -> None:
+        self._seconds = seconds
+
+    def sample(self, recorded_seconds: Optional[float]) -> float:
+        return self._seconds
+
+
+class RecordedLatency(LatencyModel):
+    """Replay with the originally observed duration, optionally scaled."""
+
+    def __init__(self, scale: float = 1.0) -> None:
+        self._scale = scale
+
+    def sample(self, recorded_seconds: Optional[float]) -> float:
+        return (recorded_seconds or 0.0) * self._scale
+
+
+class LogNormalLatency(LatencyModel):
+    """
+    Replay with log-normally distributed delays.
+
+    A reasonable shape for network APIs: most calls near the median with a
+    long tail controlled by ``sigma``.
+    """
+
+    def __init__(
+        self, median_seconds: float, sigma: float = 0.5, seed: Optional[int] = None
+    ) -> None:
+        self._median = median_seconds
+        self._sigma = sigma
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def sample(self, recorded_seconds: Optional[float]) -> float:
+        with self._lock:
+            return self._median * self._random.lognormvariate(0.0, self._sigma)
+
+
+def parse_latency(spec: str) -> LatencyModel:
+    """
+    Build a latency model from a CLI spec.
+
+    Accepted forms: ``none``, ``recorded``, ``recorded:0.5`` (scale),
+    ``fixed:0.2`` (seconds), ``lognormal:1.5`` or ``lognormal:1.5:0.8``
+    (median seconds and sigma).
+    """
+    name, _, args = spec.partition(":")
+    values = [float(value) for value in args.split(":") if value]
+    if name == "none":
+        return NoLatency()
+    if name == "recorded":
+        return RecordedLatency(*values[:1])
+    if name == "fixed" and values:
+        return FixedLatency(values[0])
+    if name == "lognormal" and values:
+        return LogNormalLatency(*values[:2])
+    raise ValueError(f"Unknown latency spec: {spec!r}")
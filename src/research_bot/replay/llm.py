@@ -0,0 +1,190 @@
+"""Record/replay LLMs for offline benchmarking."""
+
+import threading
+import time
+from contextlib import nullcontext
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel
+
+from research_bot.replay.latency import LatencyModel, NoLatency
+from research_bot.replay.store import FixtureStore
+
+try:
+    from crewai.llms.base_llm import BaseLLM
+except ImportError:  # older CrewAI releases have no BaseLLM; subclass LLM itself
+    from crewai import LLM as BaseLLM  # noqa: N811 (one base name for both releases)
+
+try:
+    from crewai.llms.base_llm import llm_call_context
+except ImportError:  # releases without call scopes emit events unscoped
+    llm_call_context = nullcontext
+
+LLM_KIND = "llm"
+
+# Replayed calls report usage estimated from text length
+CHARS_PER_TOKEN = 4
+
+
+def _estimate_tokens(text: str) -> int:
+    """Rough token count of a prompt or completion."""
+    return max(1, len(text) // CHARS_PER_TOKEN)
+
+
+def _llm_request(messages: Any) -> Dict[str, Any]:
+    """Describe an LLM call by its role/content message sequence."""
+    if isinstance(messages, str):
+        return {"messages": [{"role": "user", "content": messages}]}
+    return {
+        "messages": [
+            {"role": message.get("role"), "content": message.get("content")}
+            for message in messages
+        ]
+    }
+
+
+class RecordingLLM(BaseLLM):
+    """Wraps a live LLM and records every completion to a fixture store."""
+
+    _inner: Any
+    _store: FixtureStore
+
+    def __init__(self, inner: Any, store: FixtureStore) -> None:
+        super().__init__(model=inner.model)
+        self._inner = inner
+        self._store = store
+
+    def call(self, messages: Any, *args: Any, **kwargs: Any) -> Any:
+        # CrewAI sets stop words on the agent's LLM; forward them to the real one
+        if getattr(self, "stop", None):
+            self._inner.stop = self.stop
+
+        started = time.perf_counter()
+        completion = self._inner.call(messages, *args, **kwargs)
+        recorded = completion.model_dump_json() if isinstance(completion, BaseModel) else completion
+        self._store.put(
+            LLM_KIND,
+            _llm_request(messages),
+            {"completion": recorded, "elapsed_seconds": time.perf_counter() - started},
+        )
+        return completion
+
+    def supports_function_calling(self) -> bool:
+        return bool(self._inner.supports_function_calling())
+
+    def supports_stop_words(self) -> bool:
+        return bool(self._inner.supports_stop_words())
+
+    def get_context_window_size(self) -> int:
+        return int(self._inner.get_context_window_size())
+
+    def get_token_usage_summary(self) -> Any:
+        return self._inner.get_token_usage_summary()
+
+
+class ReplayLLM(BaseLLM):
+    """
+    Serves recorded completions instead of calling a model.
+
+    Requests are matched by message content (dates masked). When no exact
+    match exists the next completion in recording order is returned, wrapping
+    around, so a fixture set can drive any number of runs.
+    """
+
+    _store: FixtureStore
+    _latency: LatencyModel
+    _fallback_completion: Optional[str]
+    _order: List[str]
+    _cursor: int
+    _lock: threading.Lock
+
+    def __init__(
+        self,
+        store: FixtureStore,
+        latency: Optional[LatencyModel] = None,
+        fallback_completion: Optional[str] = None,
+        model: str = "replay",
+    ) -> None:
+        """
+        Initialize replaying LLM.
+
+        Args:
+            store: Fixture store to replay from.
+            latency: Delay model applied to each completion (default: none).
+            fallback_completion: Returned when the store has no completions.
+            model: Model name reported to CrewAI.
+        """
+        super().__init__(model=model)
+        self._store = store
+        self._latency = latency or NoLatency()
+        self._fallback_completion = fallback_completion
+        self._order = store.recorded_order(LLM_KIND)
+        self._cursor = 0
+        self._lock = threading.Lock()
+
+    def _next_recorded(self) -> Optional[Dict[str, Any]]:
+        """Return the next completion in recording order."""
+        with self._lock:
+            if not self._order:
+                return None
+            key = self._order[self._cursor % len(self._order)]
+            self._cursor += 1
+        return self._store.get_by_key(LLM_KIND, key)
+
+    def call(self, messages: Any, *args: Any, **kwargs: Any) -> Any:
+        # Started and completed events share one call scope, as for a live LLM
+        with llm_call_context():
+            self._emit_started(messages, kwargs)
+            recorded = self._store.get(LLM_KIND, _llm_request(messages)) or self._next_recorded()
+            if recorded is None:
+                if self._fallback_completion is None:
+                    raise RuntimeError(f"No recorded LLM completions in {self._store.root}")
+                recorded = {"completion": self._fallback_completion}
+
+            delay = self._latency.sample(recorded.get("elapsed_seconds"))
+            if delay > 0:
+                time.sleep(delay)
+
+            completion = recorded["completion"]
+            self._report_usage(messages, completion, kwargs)
+        response_model = kwargs.get("response_model")
+        if response_model is not None:
+            return response_model.model_validate_json(completion)
+        return completion
+
+    def _emit_started(self, messages: Any, kwargs: Dict[str, Any]) -> None:
+        """Emit the call started event that opens the call's event scope."""
+        emit = getattr(self, "_emit_call_started_event", None)
+        if emit is None:
+            return
+        emit(
+            messages=messages,
+            from_task=kwargs.get("from_task"),
+            from_agent=kwargs.get("from_agent"),
+        )
+
+    def _report_usage(self, messages: Any, completion: str, kwargs: Dict[str, Any]) -> None:
+        """Emit a completion event with estimated usage, like a live LLM would."""
+        emit = getattr(self, "_emit_call_completed_event", None)
+        if emit is None:
+            return
+        from crewai.events.types.llm_events import LLMCallType
+
+        prompt = "".join(str(m["content"] or "") for m in _llm_request(messages)["messages"])
+        prompt_tokens = _estimate_tokens(prompt)
+        completion_tokens = _estimate_tokens(completion)
+        emit(
+            response=completion,
+            call_type=LLMCallType.LLM_CALL,
+            from_task=kwargs.get("from_task"),
+            from_agent=kwargs.get("from_agent"),
+            messages=messages,
+            usage={
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            },
+        )
+
+    def supports_function_calling(self) -> bool:
+        return False
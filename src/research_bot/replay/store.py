@@ -0,0 +1,99 @@
+"""On-disk fixture store for recorded tool results and LLM completions."""
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# Task prompts embed today's date; mask it so fixtures replay on any day
+_DATE_PATTERN = re.compile(r"\b\d{4}-\d{2}-\d{2}\b")
+
+
+def fixture_key(payload: Any) -> str:
+    """Return a stable hash of a JSON-serializable request description."""
+    canonical = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+    canonical = _DATE_PATTERN.sub("<date>", canonical)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:32]
+
+
+class FixtureStore:
+    """
+    Directory of JSON fixtures grouped by kind.
+
+    Layout::
+
+        <root>/<kind>/<key>.json   one recorded response per request
+        <root>/<kind>/_order.jsonl keys in recording order
+
+    The order log lets replayers fall back to "next recorded response" when a
+    request does not match exactly (e.g. an LLM prompt that embeds a
+    timestamp or a non-deterministic tool result).
+    """
+
+    def __init__(self, root: str | Path) -> None:
+        self._root = Path(root)
+        self._lock = threading.Lock()
+
+    @property
+    def root(self) -> Path:
+        """Fixture directory."""
+        return self._root
+
+    def _kind_dir(self, kind: str) -> Path:
+        return self._root / kind
+
+    def put(self, kind: str, request: Any, response: Dict[str, Any]) -> str:
+        """
+        Record a response.
+
+        Args:
+            kind: Fixture group (e.g. ``"tools"`` or ``"llm"``).
+            request: JSON-serializable description of the request.
+            response: JSON-serializable recorded response.
+
+        Returns:
+            The fixture key.
+        """
+        key = fixture_key(request)
+        directory = self._kind_dir(kind)
+        directory.mkdir(parents=True, exist_ok=True)
+        document = json.dumps(
+            {"request": request, "response": response},
+            ensure_ascii=False,
+            indent=2,
+            default=str,
+        )
+
+        # Atomic write so concurrent readers never see partial fixtures
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            handle.write(document)
+        os.replace(temp_path, directory / f"{key}.json")
+
+        with self._lock, open(directory / "_order.jsonl", "a", encoding="utf-8") as log:
+            log.write(json.dumps(key) + "\n")
+        return key
+
+    def get(self, kind: str, request: Any) -> Optional[Dict[str, Any]]:
+        """Return the recorded response for a request, or None."""
+        return self.get_by_key(kind, fixture_key(request))
+
+    def get_by_key(self, kind: str, key: str) -> Optional[Dict[str, Any]]:
+        """Return the recorded response stored under ``key``, or None."""
+        path = self._kind_dir(kind) / f"{key}.json"
+        if not path.exists():
+            return None
+        document: Dict[str, Any] = json.loads(path.read_text(encoding="utf-8"))
+        return document["response"]
+
+    def recorded_order(self, kind: str) -> List[str]:
+        """Return fixture keys in the order they were recorded."""
+        path = self._kind_dir(kind) / "_order.jsonl"
+        if not path.exists():
+            return []
+        with open(path, encoding="utf-8") as log:
+            return [json.loads(line) for line in log if line.strip()]
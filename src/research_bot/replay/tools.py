@@ -0,0 +1,163 @@
+"""Record/replay tool providers for offline benchmarking."""
+
+import json
+import time
+from typing import Any, Dict, List, Optional, Sequence, Type
+
+from crewai.tools import BaseTool
+from pydantic import BaseModel, ValidationError
+
+from research_bot.replay.latency import LatencyModel, NoLatency
+from research_bot.replay.store import FixtureStore
+from research_bot.tools import ExpandSourceTool, ScrapeTool, TavilySearchTool
+
+TOOLS_KIND = "tools"
+
+
+def _tool_request(
+    name: str, args_schema: Type[BaseModel], kwargs: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Describe a tool call with defaults filled in, so equivalent calls match."""
+    try:
+        args = args_schema(**kwargs).model_dump(mode="json")
+    except ValidationError:
+        args = kwargs
+    return {"tool": name, "args": args}
+
+
+class RecordingTool(BaseTool):
+    """Wraps a live tool and records each result to a fixture store."""
+
+    name: str = "recording_tool"
+    description: str = "Records results of a wrapped tool."
+
+    _inner: BaseTool
+    _store: FixtureStore
+
+    def __init__(self, inner: BaseTool, store: FixtureStore) -> None:
+        super().__init__(
+            name=inner.name,
+            description=inner.description,
+            args_schema=inner.args_schema,
+        )
+        self._inner = inner
+        self._store = store
+
+    def _run(self, **kwargs: Any) -> str:
+        started = time.perf_counter()
+        result = self._inner._run(**kwargs)
+        self._store.put(
+            TOOLS_KIND,
+            _tool_request(self.name, self.args_schema, kwargs),
+            {"result": result, "elapsed_seconds": time.perf_counter() - started},
+        )
+        return result
+
+
+class ReplayTool(BaseTool):
+    """Serves recorded results for a tool without touching the network."""
+
+    name: str = "replay_tool"
+    description: str = "Replays recorded tool results."
+
+    _store: FixtureStore
+    _latency: LatencyModel
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        args_schema: Type[BaseModel],
+        store: FixtureStore,
+        latency: LatencyModel,
+    ) -> None:
+        super().__init__(name=name, description=description, args_schema=args_schema)
+        self._store = store
+        self._latency = latency
+
+    @classmethod
+    def like(
+        cls,
+        tool_class: Type[BaseTool],
+        store: FixtureStore,
+        latency: LatencyModel,
+    ) -> "ReplayTool":
+        """Create a replay tool presenting the same interface as ``tool_class``."""
+        fields = tool_class.model_fields
+        return cls(
+            name=fields["name"].default,
+            description=fields["description"].default,
+            args_schema=fields["args_schema"].default,
+            store=store,
+            latency=latency,
+        )
+
+    def _run(self, **kwargs: Any) -> str:
+        request = _tool_request(self.name, self.args_schema, kwargs)
+        recorded = self._store.get(TOOLS_KIND, request)
+        if recorded is None:
+            return f"Replay miss: no recorded result for {self.name} {json.dumps(request['args'])}"
+
+        delay = self._latency.sample(recorded.get("elapsed_seconds"))
+        if delay > 0:
+            time.sleep(delay)
+        return str(recorded["result"])
+
+
+class RecordingToolProvider:
+    """Tool provider that records every call made through another provider."""
+
+    def __init__(self, inner: Any, store: FixtureStore) -> None:
+        """
+        Initialize provider.
+
+        Args:
+            inner: Tool provider supplying the live tools.
+            store: Fixture store to record into.
+        """
+        self._inner = inner
+        self._store = store
+
+    def get_tools(self) -> List[BaseTool]:
+        """Return the inner provider's tools wrapped for recording."""
+        return [RecordingTool(tool, self._store) for tool in self._inner.get_tools()]
+
+    def close(self) -> None:
+        """Close the wrapped provider, if it holds resources."""
+        close = getattr(self._inner, "close", None)
+        if callable(close):
+            close()
+
+
+class ReplayToolProvider:
+    """
+    Tool provider serving recorded results - no API keys or network needed.
+
+    Presents the same tool names, descriptions and argument schemas as the
+    live tools, so agents and prompts are identical to a real run.
+    """
+
+    def __init__(
+        self,
+        store: FixtureStore,
+        latency: Optional[LatencyModel] = None,
+        tool_classes: Sequence[Type[BaseTool]] = (TavilySearchTool, ScrapeTool, ExpandSourceTool),
+    ) -> None:
+        """
+        Initialize provider.
+
+        Args:
+            store: Fixture store to replay from.
+            latency: Delay model applied to each replayed call (default: none).
+            tool_classes: Live tool classes whose interfaces are replayed.
+        """
+        self._store = store
+        self._latency = latency or NoLatency()
+        self._tool_classes = list(tool_classes)
+
+    def get_tools(self) -> List[BaseTool]:
+        """Create and return replaying tools."""
+        return [
+            ReplayTool.like(tool_class, self._store, self._latency)
+            for tool_class in self._tool_classes
+        ]
@@ -1,13 +1,41 @@
 """Services module."""
 
-from research_bot.services.research_service import (
-    DefaultToolProvider,
-    ResearchService,
-    ToolProvider,
-)
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from research_bot.services.research_service import (
+        DefaultToolProvider,
+        ResearchService,
+        ToolProvider,
+    )
+    from research_bot.services.run_store import RunStore
+
+# Resolved on first access so lightweight services don't import CrewAI
+_LAZY_EXPORTS = {
+    "ResearchService": "research_bot.services.research_service",
+    "ToolProvider": "research_bot.services.research_service",
+    "DefaultToolProvider": "research_bot.services.research_service",
+    "RunStore": "research_bot.services.run_store",
+}
 
 __all__ = [
     "ResearchService",
     "ToolProvider",
     "DefaultToolProvider",
+    "RunStore",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import public names on first access (PEP 562)."""
+    module_path = _LAZY_EXPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
@@ -0,0 +1,260 @@
+"""Citation verification - cross-check report URLs against run sources and the web."""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+from urllib.parse import urlsplit, urlunsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from research_bot.export.parser import extract_urls
+from research_bot.models.citation import Citation, CitationReport, CitationStatus
+from research_bot.tools.cache import ResultCache
+from research_bot.tools.single_flight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+USER_AGENT = "research-bot-citation-check/1.0"
+
+# Statuses of pages that exist but refuse automated clients
+_BLOCKED_STATUSES = frozenset({401, 403, 429})
+
+# Statuses after which a HEAD request is not conclusive (servers that
+# reject or mishandle HEAD); the check is retried with a streamed GET
+_RETRY_WITH_GET = frozenset({400, 403, 405, 406, 429, 500, 501, 503})
+
+
+def normalize_url(url: str) -> str:
+    """
+    Canonical form of a URL for matching citations against sources.
+
+    Lowercases scheme and host, drops ``www.``, default ports, the fragment
+    and a trailing slash; path and query are kept as written.
+    """
+    try:
+        parts = urlsplit(url.strip())
+    except ValueError:
+        return url.strip()
+    host = (parts.hostname or "").lower()
+    if host.startswith("www."):
+        host = host[4:]
+    if parts.port and (parts.scheme, parts.port) not in (("http", 80), ("https", 443)):
+        host = f"{host}:{parts.port}"
+    return urlunsplit((parts.scheme.lower(), host, parts.path.rstrip("/"), parts.query, ""))
+
+
+class HostRateLimiter:
+    """
+    Spaces requests to the same host at least ``1 / requests_per_second`` apart.
+
+    Slots are reserved under a lock and waited for outside it, so threads
+    checking different hosts never wait on each other.
+    """
+
+    def __init__(
+        self,
+        requests_per_second: float,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self._interval = 1.0 / requests_per_second if requests_per_second > 0 else 0.0
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._next_slot: Dict[str, float] = {}
+
+    def acquire(self, host: str) -> None:
+        """Block until a request to ``host`` may be sent."""
+        if not self._interval:
+            return
+        with self._lock:
+            now = self._clock()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self._interval
+        if slot > now:
+            self._sleep(slot - now)
+
+
+class UrlChecker:
+    """
+    Checks whether URLs resolve, concurrently and with bounded load.
+
+    Uses one pooled HTTP session, a per-host rate limit, a TTL cache of
+    results and in-flight coalescing, so a batch citing the same pages many
+    times requests each page once. Tries a ``HEAD`` request first and falls
+    back to a streamed ``GET`` whose body is never read.
+    """
+
+    def __init__(
+        self,
+        session: Optional[requests.Session] = None,
+        concurrency: int = 16,
+        requests_per_host: float = 2.0,
+        timeout: float = 10.0,
+        cache: Optional[ResultCache[Citation]] = None,
+    ) -> None:
+        """
+        Initialize checker.
+
+        Args:
+            session: Optional HTTP session; a pooled one is created if omitted.
+            concurrency: URLs checked at once.
+            requests_per_host: Requests per second sent to one host (0: unlimited).
+            timeout: Per-request timeout in seconds.
+            cache: Optional result cache (shared across batches).
+        """
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=concurrency, pool_maxsize=concurrency)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            session.headers["User-Agent"] = USER_AGENT
+        self._session = session
+        self._concurrency = max(1, concurrency)
+        self._limiter = HostRateLimiter(requests_per_host)
+        self._timeout = timeout
+        self._cache: ResultCache[Citation] = cache if cache is not None else ResultCache(
+            max_entries=10000,
+            ttl_seconds=86400.0,
+        )
+        self._in_flight: SingleFlight[Citation] = SingleFlight()
+
+    def check(self, url: str) -> Citation:
+        """Return the (possibly cached) check result for one URL."""
+        key = normalize_url(url)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached.model_copy(update={"url": url})
+        result = self._in_flight.do(key, lambda: self._check_uncached(url, key))
+        return result if result.url == url else result.model_copy(update={"url": url})
+
+    def check_many(self, urls: Iterable[str]) -> Dict[str, Citation]:
+        """
+        Check URLs concurrently.
+
+        Returns:
+            URL -> check result, for each distinct URL.
+        """
+        distinct = list(dict.fromkeys(urls))
+        if len(distinct) <= 1:
+            return {url: self.check(url) for url in distinct}
+        with ThreadPoolExecutor(
+            max_workers=min(self._concurrency, len(distinct)),
+            thread_name_prefix="citation-check",
+        ) as pool:
+            return dict(zip(distinct, pool.map(self.check, distinct)))
+
+    def _check_uncached(self, url: str, key: str) -> Citation:
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            return Citation(url=url, status=CitationStatus.INVALID, error="not an http(s) URL")
+
+        try:
+            status = self._request("HEAD", url, parts.hostname)
+            if status in _RETRY_WITH_GET:
+                status = self._request("GET", url, parts.hostname)
+        except requests.RequestException as e:
+            # Not cached: network errors are often transient
+            return Citation(url=url, status=CitationStatus.UNREACHABLE, error=type(e).__name__)
+
+        if status < 400:
+            result_status = CitationStatus.OK
+        elif status in _BLOCKED_STATUSES:
+            result_status = CitationStatus.BLOCKED
+        else:
+            result_status = CitationStatus.BROKEN
+        result = Citation(url=url, status=result_status, http_status=status)
+        self._cache.set(key, result)
+        return result
+
+    def _request(self, method: str, url: str, host: str) -> int:
+        """Send one request and return its final status, never reading the body."""
+        self._limiter.acquire(host)
+        response = self._session.request(
+            method,
+            url,
+            timeout=self._timeout,
+            allow_redirects=True,
+            stream=True,
+        )
+        try:
+            return response.status_code
+        finally:
+            response.close()
+
+
+class CitationVerifier:
+    """
+    Verifies the URLs cited in reports.
+
+    URLs that appeared in a run's tool calls are marked ``SOURCED`` without
+    a request; the rest are checked live. A batch checks the unseen URLs of
+    all its reports in one concurrent pass, so URLs shared between reports
+    are requested once.
+    """
+
+    def __init__(self, checker: UrlChecker) -> None:
+        self._checker = checker
+
+    def verify(self, markdown: str, sources: Sequence[str], report_id: str) -> CitationReport:
+        """
+        Verify the citations of one report.
+
+        Args:
+            markdown: The report text.
+            sources: URLs fetched or returned by tools during the run.
+            report_id: Identifier of the report (its file stem).
+
+        Returns:
+            The citation report.
+        """
+        return self.verify_batch([(report_id, markdown, sources)])[0]
+
+    def verify_batch(
+        self, reports: Sequence[Tuple[str, str, Sequence[str]]]
+    ) -> List[CitationReport]:
+        """
+        Verify the citations of many reports together.
+
+        Args:
+            reports: ``(report_id, markdown, sources)`` per report.
+
+        Returns:
+            One citation report per input, in order.
+        """
+        cited: List[Tuple[str, List[str], Set[str]]] = []
+        unseen: Dict[str, None] = {}
+        for report_id, markdown, sources in reports:
+            urls = extract_urls(markdown)
+            known = {normalize_url(url) for url in sources}
+            cited.append((report_id, urls, known))
+            for url in urls:
+                if normalize_url(url) not in known:
+                    unseen.setdefault(url, None)
+
+        started = time.perf_counter()
+        checked = self._checker.check_many(unseen)
+        logger.debug(
+            "Citations checked",
+            extra={
+                "reports": len(reports),
+                "checked_urls": len(checked),
+                "elapsed_seconds": round(time.perf_counter() - started, 3),
+            },
+        )
+
+        return [
+            CitationReport(
+                report_id=report_id,
+                citations=[
+                    Citation(url=url, status=CitationStatus.SOURCED)
+                    if normalize_url(url) in known
+                    else checked[url]
+                    for url in urls
+                ],
+            )
+            for report_id, urls, known in cited
+        ]
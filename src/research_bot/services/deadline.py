@@ -0,0 +1,294 @@
+"""Deadline-aware execution: per-phase time budgets for a research run."""
+
+import contextvars
+import logging
+import math
+import re
+import threading
+import time
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from crewai import Task
+from crewai.tools import BaseTool
+
+from research_bot.models.research import PhaseStatus, PhaseUpdate, ResearchPhase
+from research_bot.models.run import PhaseBudget
+
+logger = logging.getLogger(__name__)
+
+# Share of the run deadline each phase gets when everything runs on time
+PHASE_WEIGHTS: Dict[ResearchPhase, float] = {
+    ResearchPhase.PLANNING: 0.10,
+    ResearchPhase.RESEARCH: 0.35,
+    ResearchPhase.ANALYSIS: 0.25,
+    ResearchPhase.REVIEW: 0.10,
+    ResearchPhase.REPORT: 0.20,
+}
+
+# Phases starting with less than this share of their nominal budget run
+# degraded (fewer iterations); scheduling jitter stays above it
+DEGRADE_BELOW_RATIO = 0.95
+
+# Degraded phases below this share are also told to be brief
+BRIEF_BELOW_RATIO = 0.75
+
+# Tool calls running at once under a deadline; calls abandoned at a budget
+# expiry keep their thread until they return, so further calls queue
+DEADLINE_TOOL_WORKERS = 8
+
+BUDGET_EXHAUSTED_MESSAGE = (
+    "Budget error: the time budget for this step is used up. Do not call any "
+    "more tools; give your final answer now using the information you have."
+)
+
+_DURATION = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([smh]?)\s*$", re.IGNORECASE)
+_UNIT_SECONDS = {"": 1.0, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+def parse_duration(spec: str) -> float:
+    """
+    Parse a duration such as ``90``, ``90s``, ``5m`` or ``1.5h`` into seconds.
+
+    Raises:
+        ValueError: If the spec is malformed or not positive.
+    """
+    match = _DURATION.match(spec)
+    if match is None:
+        raise ValueError(f"invalid duration {spec!r} (expected e.g. 90, 90s, 5m, 1h)")
+    seconds = float(match.group(1)) * _UNIT_SECONDS[match.group(2).lower()]
+    if seconds <= 0:
+        raise ValueError("duration must be positive")
+    return seconds
+
+
+class DeadlineController:
+    """
+    Spreads a run deadline over the pipeline phases and enforces it.
+
+    Each phase gets the time left on the run deadline, split by the weights
+    of the phases still to come, so time saved early flows to later phases
+    and overruns shrink them. A phase whose budget is smaller than its
+    nominal share degrades: its agent gets proportionally fewer iterations
+    (fewer tool calls and sources) and, when far behind, its task is asked
+    to be brief. When a budget runs out, tool calls short-circuit and the
+    agent's iteration limit is lowered so it produces a final answer on its
+    next step instead of failing the run.
+
+    Create it when the run starts (the deadline counts from construction),
+    ``bind`` the crew's tasks once built and register ``on_progress`` as a
+    ``PhaseTracker`` listener.
+    """
+
+    def __init__(
+        self,
+        deadline_seconds: float,
+        phases: Sequence[ResearchPhase] = tuple(ResearchPhase),
+        weights: Optional[Dict[ResearchPhase, float]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize controller.
+
+        Args:
+            deadline_seconds: Total time allowed for the run.
+            phases: Pipeline phases in execution order.
+            weights: Relative phase shares (default: ``PHASE_WEIGHTS``).
+            clock: Monotonic time source.
+        """
+        self._deadline_seconds = deadline_seconds
+        self._phases = list(phases)
+        self._weights = weights or PHASE_WEIGHTS
+        self._tasks: Dict[ResearchPhase, Task] = {}
+        self._clock = clock
+        self._started_at = clock()
+        self._lock = threading.Lock()
+
+        self._phase: Optional[ResearchPhase] = None
+        self._phase_started_at = 0.0
+        self._phase_budget = 0.0
+        self._timer: Optional[threading.Timer] = None
+        self._budgets: Dict[ResearchPhase, PhaseBudget] = {}
+        self._executor = ThreadPoolExecutor(
+            max_workers=DEADLINE_TOOL_WORKERS, thread_name_prefix="deadline-tool"
+        )
+
+    @property
+    def deadline_seconds(self) -> float:
+        """Total time allowed for the run."""
+        return self._deadline_seconds
+
+    def bind(self, tasks: Sequence[Task]) -> None:
+        """Attach the run's tasks; task ``i`` belongs to ``phases[i]``."""
+        self._tasks = dict(zip(self._phases, tasks))
+
+    def total_remaining(self) -> float:
+        """Seconds left on the run deadline (negative once overrun)."""
+        return self._deadline_seconds - (self._clock() - self._started_at)
+
+    def phase_remaining(self) -> float:
+        """Seconds left in the current phase's budget (negative once overrun)."""
+        with self._lock:
+            if self._phase is None:
+                return self.total_remaining()
+            return self._phase_budget - (self._clock() - self._phase_started_at)
+
+    def budgets(self) -> List[PhaseBudget]:
+        """Budget and actual use of every phase started so far."""
+        with self._lock:
+            return list(self._budgets.values())
+
+    def on_progress(self, update: PhaseUpdate) -> None:
+        """Phase tracker listener: allocate budgets as phases start and finish."""
+        if update.status == PhaseStatus.STARTED:
+            self._start_phase(update.phase)
+        elif update.status == PhaseStatus.COMPLETED:
+            self._finish_phase(update.phase)
+
+    def submit(self, fn: Callable[..., str], /, *args: Any, **kwargs: Any) -> "Future[str]":
+        """Run a tool call on the controller's bounded pool."""
+        return self._executor.submit(fn, *args, **kwargs)
+
+    def close(self) -> None:
+        """Cancel the pending expiry timer and tool calls not yet started."""
+        with self._lock:
+            self._cancel_timer()
+        # Abandoned calls finish in the background; nothing waits for them
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _nominal_budget(self, phase: ResearchPhase) -> float:
+        """Phase share of the whole deadline."""
+        total_weight = sum(self._weights.get(p, 0.0) for p in self._phases) or 1.0
+        return self._deadline_seconds * self._weights.get(phase, 0.0) / total_weight
+
+    def _allocate(self, phase: ResearchPhase) -> float:
+        """Split the remaining run time over this and the following phases."""
+        upcoming = self._phases[self._phases.index(phase):]
+        upcoming_weight = sum(self._weights.get(p, 0.0) for p in upcoming) or 1.0
+        share = self._weights.get(phase, 0.0) / upcoming_weight
+        return max(0.0, self.total_remaining() * share)
+
+    def _start_phase(self, phase: ResearchPhase) -> None:
+        budget = self._allocate(phase)
+        nominal = self._nominal_budget(phase)
+        ratio = budget / nominal if nominal > 0 else 1.0
+        degraded = ratio < DEGRADE_BELOW_RATIO
+        if degraded:
+            self._degrade(phase, ratio, budget)
+
+        with self._lock:
+            self._cancel_timer()
+            self._phase = phase
+            self._phase_started_at = self._clock()
+            self._phase_budget = budget
+            self._budgets[phase] = PhaseBudget(
+                phase=phase,
+                budget_seconds=budget,
+                nominal_seconds=nominal,
+                degraded=degraded,
+            )
+            self._timer = threading.Timer(budget, self._expire, args=(phase,))
+            self._timer.daemon = True
+            self._timer.start()
+
+        logger.debug(
+            "Phase budget allocated",
+            extra={"phase": phase.value, "budget_seconds": budget, "ratio": ratio},
+        )
+
+    def _finish_phase(self, phase: ResearchPhase) -> None:
+        with self._lock:
+            if self._phase != phase:
+                return
+            self._cancel_timer()
+            used = self._clock() - self._phase_started_at
+            self._budgets[phase] = self._budgets[phase].model_copy(
+                update={"used_seconds": used}
+            )
+            self._phase = None
+
+    def _degrade(self, phase: ResearchPhase, ratio: float, budget: float) -> None:
+        """Cut the phase's iterations, and ask for brevity when far behind."""
+        task = self._tasks.get(phase)
+        if task is None or task.agent is None:
+            return
+
+        agent = task.agent
+        agent.max_iter = math.ceil(agent.max_iter * ratio)
+        if ratio < BRIEF_BELOW_RATIO:
+            task.description = (
+                f"{task.description}\n\nTIME BUDGET: about {budget:.0f} seconds remain "
+                f"for this step. Be brief: use at most {agent.max_iter} tool calls, "
+                "cover only the most important points and keep the output short."
+            )
+        logger.info(
+            "Phase degraded to fit deadline",
+            extra={"phase": phase.value, "ratio": ratio, "max_iter": agent.max_iter},
+        )
+
+    def _expire(self, phase: ResearchPhase) -> None:
+        """Timer callback: make the phase's agent wrap up on its next step."""
+        with self._lock:
+            if self._phase != phase:
+                return
+        task = self._tasks.get(phase)
+        agent = task.agent if task is not None else None
+        if agent is None:
+            return
+
+        executor: Any = agent.agent_executor
+        if executor is not None:
+            executor.max_iter = min(executor.max_iter, executor.iterations)
+        agent.max_iter = 0
+        logger.warning("Phase exceeded its time budget", extra={"phase": phase.value})
+
+    def _cancel_timer(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+
+class DeadlineTool(BaseTool):
+    """
+    Wraps a tool so calls never outlive the current phase budget.
+
+    Calls made after the budget ran out return ``BUDGET_EXHAUSTED_MESSAGE``
+    at once. Other calls run on the controller's bounded thread pool and are
+    abandoned when the budget expires first; the abandoned call still
+    completes in the background (so its result can still land in the tool
+    caches). Cache lookups and fallbacks it counts after being abandoned
+    are not reported: an outer ``MeteredTool`` has already recorded the call.
+    """
+
+    name: str = "deadline_tool"
+    description: str = "Enforces a time budget on a wrapped tool."
+
+    _inner: BaseTool
+    _controller: DeadlineController
+
+    def __init__(self, inner: BaseTool, controller: DeadlineController) -> None:
+        super().__init__(
+            name=inner.name,
+            description=inner.description,
+            args_schema=inner.args_schema,
+        )
+        self._inner = inner
+        self._controller = controller
+
+    def _run(self, **kwargs: Any) -> str:
+        remaining = self._controller.phase_remaining()
+        if remaining <= 0:
+            return BUDGET_EXHAUSTED_MESSAGE
+
+        # Propagate context variables (e.g. tool metrics) to the pool thread
+        context = contextvars.copy_context()
+        try:
+            future = self._controller.submit(context.run, self._inner._run, **kwargs)
+        except RuntimeError:  # the run has ended and the pool is shut down
+            return BUDGET_EXHAUSTED_MESSAGE
+        try:
+            return future.result(timeout=remaining)
+        # concurrent.futures.TimeoutError is not the builtin before Python 3.11
+        except (FutureTimeoutError, CancelledError):
+            return BUDGET_EXHAUSTED_MESSAGE
@@ -0,0 +1,230 @@
+"""Source digest - map-reduce summarization of a run's fetched corpus."""
+
+import functools
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+from crewai import LLM
+
+from research_bot.tools.extraction import chunk_text
+
+logger = logging.getLogger(__name__)
+
+# Below this much text, chunking in-process beats shipping it to workers
+PROCESS_POOL_MIN_CHARS = 1_000_000
+
+_MAP_PROMPT = (
+    "Below are excerpts of {count} research source(s) on: {topic}\n\n"
+    "For each source, write a 2-3 sentence summary and list its key facts "
+    "(figures, dates, names, claims) as bullets. Keep every fact attributed: "
+    "end each bullet with the source's URL or name in parentheses. Skip "
+    "navigation text, ads and anything unrelated to the topic.\n\n"
+    "Format per source:\n### <source>\nSummary: ...\n- fact (source)\n\n"
+    "{excerpts}"
+)
+
+_REDUCE_PROMPT = (
+    "Merge these partial research digests on: {topic}\n\n"
+    "Write one digest of at most {words} words: group facts by theme, merge "
+    "duplicates, keep figures, dates and every source attribution, and note "
+    "where sources disagree.\n\n"
+    "{digests}"
+)
+
+
+@dataclass(frozen=True)
+class SourceDocument:
+    """Text of one source fetched during a run."""
+
+    source: str
+    text: str
+
+
+def documents_from_results(results: Sequence[Tuple[str, str, str]]) -> List[SourceDocument]:
+    """
+    Turn a run's tool results into source documents.
+
+    Args:
+        results: ``(tool, arguments, result)`` as kept by ``ToolMetrics``.
+
+    Returns:
+        One document per distinct tool call.
+    """
+    return [
+        SourceDocument(source=f"{tool}({arguments})", text=result)
+        for tool, arguments, result in results
+        if result.strip()
+    ]
+
+
+class MapReduceDigester:
+    """
+    Condenses a large fetched corpus into a compact, attributed digest.
+
+    Map: documents are chunked (in a process pool for large corpora, so the
+    CPU work scales with cores), chunks are packed into batches and every
+    batch is summarized by one LLM call, all batches concurrently.
+    Reduce: the summaries are merged ``merge_fanout`` at a time, level by
+    level (each level concurrently), until they fit ``digest_chars``.
+    Throughput scales with cores for chunking and with ``max_workers`` for
+    API calls.
+    """
+
+    def __init__(
+        self,
+        llm: LLM,
+        chunk_chars: int = 6000,
+        batch_chars: int = 18000,
+        merge_fanout: int = 6,
+        digest_chars: int = 8000,
+        max_workers: int = 8,
+        process_workers: int = 0,
+    ) -> None:
+        """
+        Initialize digester.
+
+        Args:
+            llm: LLM for the summaries and merges.
+            chunk_chars: Maximum characters per document chunk.
+            batch_chars: Characters of chunks summarized per LLM call.
+            merge_fanout: Summaries merged per reduce call.
+            digest_chars: Target size of the final digest.
+            max_workers: LLM calls running at once.
+            process_workers: Chunking processes (0: one per CPU core).
+        """
+        self._llm = llm
+        self._chunk_chars = chunk_chars
+        self._batch_chars = max(batch_chars, chunk_chars)
+        self._merge_fanout = max(2, merge_fanout)
+        self._digest_chars = digest_chars
+        self._max_workers = max(1, max_workers)
+        self._process_workers = process_workers or os.cpu_count() or 1
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+
+    def digest(
+        self, topic: str, documents: Sequence[SourceDocument], agent: Optional[Any] = None
+    ) -> str:
+        """
+        Summarize documents into one digest.
+
+        Args:
+            topic: The research topic.
+            documents: The fetched corpus.
+            agent: Agent the LLM calls are attributed to (for token usage).
+
+        Returns:
+            The digest (empty if nothing could be summarized).
+        """
+        started = time.perf_counter()
+        batches = self._batches(self._chunk(documents))
+        summaries = self._run_concurrently(
+            [functools.partial(self._summarize, topic, batch, agent) for batch in batches]
+        )
+        parts = [summary for summary in summaries if summary]
+
+        levels = 0
+        fanout = self._merge_fanout
+        while len(parts) > 1 and sum(len(part) for part in parts) > self._digest_chars:
+            groups = [parts[i:i + fanout] for i in range(0, len(parts), fanout)]
+            parts = self._run_concurrently(
+                [functools.partial(self._merge, topic, group, agent) for group in groups]
+            )
+            levels += 1
+
+        digest = "\n\n".join(parts)
+        logger.info(
+            "Source digest built",
+            extra={
+                "documents": len(documents),
+                "batches": len(batches),
+                "summaries": len(summaries) - summaries.count(None),
+                "merge_levels": levels,
+                "digest_chars": len(digest),
+                "elapsed_seconds": round(time.perf_counter() - started, 2),
+            },
+        )
+        return digest
+
+    def _chunk(self, documents: Sequence[SourceDocument]) -> List[Tuple[str, str]]:
+        """``(source, chunk)`` pairs, chunked in worker processes for large corpora."""
+        split = functools.partial(chunk_text, max_chars=self._chunk_chars)
+        texts = [document.text for document in documents]
+        if sum(len(text) for text in texts) >= PROCESS_POOL_MIN_CHARS and self._process_workers > 1:
+            chunked = list(self._processes().map(split, texts, chunksize=max(1, len(texts) // 32)))
+        else:
+            chunked = [split(text) for text in texts]
+
+        pairs: List[Tuple[str, str]] = []
+        for document, chunks in zip(documents, chunked):
+            pairs.extend(
+                (
+                    document.source
+                    if len(chunks) == 1
+                    else f"{document.source} [part {n}/{len(chunks)}]",
+                    chunk,
+                )
+                for n, chunk in enumerate(chunks, 1)
+            )
+        return pairs
+
+    def _processes(self) -> Executor:
+        """The chunking process pool, started on first use and kept for later runs."""
+        with self._pool_lock:
+            if self._process_pool is None:
+                # Spawned, not forked: the parent runs threads (crews, pools)
+                self._process_pool = ProcessPoolExecutor(
+                    max_workers=self._process_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._process_pool
+
+    def _batches(self, chunks: List[Tuple[str, str]]) -> List[List[Tuple[str, str]]]:
+        """Pack chunks into batches of about ``batch_chars`` characters."""
+        batches: List[List[Tuple[str, str]]] = []
+        size = 0
+        for source, chunk in chunks:
+            if not batches or size + len(chunk) > self._batch_chars:
+                batches.append([])
+                size = 0
+            batches[-1].append((source, chunk))
+            size += len(chunk)
+        return batches
+
+    def _run_concurrently(self, calls: List[Callable[[], Optional[str]]]) -> List[Optional[str]]:
+        if len(calls) <= 1:
+            return [call() for call in calls]
+        with ThreadPoolExecutor(
+            max_workers=min(self._max_workers, len(calls)),
+            thread_name_prefix="digest",
+        ) as pool:
+            return list(pool.map(lambda call: call(), calls))
+
+    def _complete(self, prompt: str, agent: Optional[Any]) -> Optional[str]:
+        try:
+            messages = [{"role": "user", "content": prompt}]
+            return str(self._llm.call(messages, from_agent=agent)).strip()
+        except Exception:
+            logger.exception("Digest LLM call failed")
+            return None
+
+    def _summarize(
+        self, topic: str, batch: List[Tuple[str, str]], agent: Optional[Any]
+    ) -> Optional[str]:
+        excerpts = "\n\n".join(f"=== SOURCE: {source}\n{chunk}" for source, chunk in batch)
+        prompt = _MAP_PROMPT.format(count=len(batch), topic=topic, excerpts=excerpts)
+        return self._complete(prompt, agent)
+
+    def _merge(self, topic: str, group: List[str], agent: Optional[Any]) -> str:
+        if len(group) == 1:
+            return group[0]
+        digests = "\n\n".join(f"=== DIGEST {n}\n{text}" for n, text in enumerate(group, 1))
+        prompt = _REDUCE_PROMPT.format(topic=topic, words=self._digest_chars // 6, digests=digests)
+        # A failed merge keeps its inputs; the next level still reduces their count
+        return self._complete(prompt, agent) or "\n\n".join(group)
@@ -0,0 +1,404 @@
+"""SQLite-backed job queue for worker mode."""
+
+import logging
+import sqlite3
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Iterator, List, Optional, Protocol
+
+from research_bot.models.job import JobPriority, JobStatus, ResearchJob
+from research_bot.services.scheduler import JobScheduler
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    topic TEXT NOT NULL,
+    status TEXT NOT NULL,
+    priority TEXT NOT NULL DEFAULT 'standard',
+    tenant TEXT NOT NULL DEFAULT 'default',
+    output_file TEXT,
+    error TEXT,
+    report_length INTEGER,
+    created_at TEXT NOT NULL,
+    started_at TEXT,
+    finished_at TEXT,
+    worker_id TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    lease_expires_at TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_status_created ON jobs (status, created_at);
+"""
+
+# Columns added after the first release, for databases created before them
+_ADDED_COLUMNS = {
+    "worker_id": "TEXT",
+    "attempts": "INTEGER NOT NULL DEFAULT 0",
+    "lease_expires_at": "TEXT",
+    "priority": "TEXT NOT NULL DEFAULT 'standard'",
+    "tenant": "TEXT NOT NULL DEFAULT 'default'",
+}
+
+# Created once the columns above exist
+_SCHEDULING_INDEX = (
+    "CREATE INDEX IF NOT EXISTS idx_jobs_status_group "
+    "ON jobs (status, priority, tenant, created_at)"
+)
+
+# Oldest queued job of each class and tenant: the only ones that can win a claim
+_QUEUE_HEADS = """
+SELECT * FROM (
+    SELECT *, ROW_NUMBER() OVER (
+        PARTITION BY priority, tenant ORDER BY created_at, rowid
+    ) AS position
+    FROM jobs WHERE status = ?
+) WHERE position = 1
+"""
+
+# Error of jobs whose worker stopped heartbeating too often
+LEASE_EXPIRED_ERROR = "Worker lost (lease expired) on every attempt"
+
+
+class QueueBackend(Protocol):
+    """Job queue shared by the producers and workers of a deployment."""
+
+    @property
+    def location(self) -> str:
+        """Where the queue lives (for logs)."""
+        ...
+
+    def submit(
+        self,
+        topic: str,
+        output_file: Optional[str] = None,
+        priority: JobPriority = JobPriority.STANDARD,
+        tenant: str = "default",
+    ) -> ResearchJob:
+        """Enqueue a research job."""
+        ...
+
+    def claim(self, worker_id: Optional[str] = None) -> Optional[ResearchJob]:
+        """Take the job the scheduler picks and lease it to a worker."""
+        ...
+
+    def heartbeat(self, job_id: str, worker_id: str) -> bool:
+        """Extend a job's lease; False if the worker no longer holds it."""
+        ...
+
+    def requeue_expired(self) -> int:
+        """Requeue (or fail) running jobs whose lease expired."""
+        ...
+
+    def complete(self, job_id: str, worker_id: str, output_file: str, report_length: int) -> bool:
+        """Mark a job as succeeded; False if the worker no longer holds it."""
+        ...
+
+    def fail(self, job_id: str, worker_id: str, error: str) -> bool:
+        """Mark a job as failed; False if the worker no longer holds it."""
+        ...
+
+    def get(self, job_id: str) -> Optional[ResearchJob]:
+        """Return a job by id, or None if unknown."""
+        ...
+
+    def list_jobs(self, status: Optional[JobStatus] = None, limit: int = 50) -> List[ResearchJob]:
+        """Return the most recent jobs, newest first."""
+        ...
+
+
+class JobQueue:
+    """
+    Durable queue of research jobs stored in a SQLite database.
+
+    Safe to share between processes: producers call ``submit()`` while one or
+    more workers ``claim()`` jobs. Claiming runs in an immediate transaction,
+    so each job is handed to exactly one worker. Which queued job a claim
+    takes is up to the ``JobScheduler`` (by class, tenant and age); jobs
+    of one class and tenant are always claimed oldest first.
+
+    A claimed job is leased to its worker for ``lease_seconds``; the worker
+    extends the lease with ``heartbeat()``. ``requeue_expired()`` puts jobs
+    of workers that stopped heartbeating (crashed, killed, partitioned)
+    back in the queue, or fails them after ``max_attempts`` claims.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        lease_seconds: float = 60.0,
+        max_attempts: int = 3,
+        scheduler: Optional[JobScheduler] = None,
+    ) -> None:
+        """
+        Initialize the queue, creating (or upgrading) the database if needed.
+
+        Args:
+            path: Location of the SQLite database file.
+            lease_seconds: How long a claimed job stays leased without a heartbeat.
+            max_attempts: Claims of a job before a lost lease fails it.
+            scheduler: Picks the job each claim takes (default: by class and age).
+        """
+        self._path = Path(path)
+        self._lease_seconds = lease_seconds
+        self._max_attempts = max(1, max_attempts)
+        self._scheduler = scheduler or JobScheduler()
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connection() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            columns = {row["name"] for row in conn.execute("PRAGMA table_info(jobs)")}
+            for name, definition in _ADDED_COLUMNS.items():
+                if name not in columns:
+                    conn.execute(f"ALTER TABLE jobs ADD COLUMN {name} {definition}")
+            conn.execute(_SCHEDULING_INDEX)
+
+    @property
+    def path(self) -> Path:
+        """Location of the SQLite database file."""
+        return self._path
+
+    @property
+    def location(self) -> str:
+        """Location of the SQLite database file."""
+        return str(self._path)
+
+    def _lease_expiry(self) -> str:
+        return (datetime.now() + timedelta(seconds=self._lease_seconds)).isoformat()
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        """Open a short-lived autocommit connection."""
+        conn = sqlite3.connect(self._path, timeout=30.0, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _to_job(row: sqlite3.Row) -> ResearchJob:
+        """Convert a database row to a job model."""
+        return ResearchJob(**dict(row))
+
+    def submit(
+        self,
+        topic: str,
+        output_file: Optional[str] = None,
+        priority: JobPriority = JobPriority.STANDARD,
+        tenant: str = "default",
+    ) -> ResearchJob:
+        """
+        Enqueue a research job.
+
+        Args:
+            topic: The research topic.
+            output_file: Optional report path; workers pick one if omitted.
+            priority: Scheduling class of the job.
+            tenant: Team or client the job runs for (fair share, limits).
+
+        Returns:
+            The queued job.
+        """
+        job = ResearchJob(
+            id=uuid.uuid4().hex[:12],
+            topic=topic,
+            output_file=output_file,
+            priority=priority,
+            tenant=tenant,
+        )
+        with self._connection() as conn:
+            conn.execute(
+                "INSERT INTO jobs (id, topic, status, priority, tenant, output_file, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    job.id,
+                    job.topic,
+                    job.status.value,
+                    job.priority.value,
+                    job.tenant,
+                    job.output_file,
+                    job.created_at.isoformat(),
+                ),
+            )
+        return job
+
+    def claim(self, worker_id: Optional[str] = None) -> Optional[ResearchJob]:
+        """
+        Atomically take the job the scheduler picks, mark it running and lease it.
+
+        Args:
+            worker_id: Id of the claiming worker (needed for heartbeats).
+
+        Returns:
+            The claimed job, or None if the queue is empty or every queued
+            job has to wait (tenant limits, provider budgets).
+        """
+        with self._connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                heads = [
+                    self._to_job(row)
+                    for row in conn.execute(_QUEUE_HEADS, (JobStatus.QUEUED.value,))
+                ]
+                running = {
+                    row["tenant"]: row["jobs"]
+                    for row in conn.execute(
+                        "SELECT tenant, COUNT(*) AS jobs FROM jobs "
+                        "WHERE status = ? GROUP BY tenant",
+                        (JobStatus.RUNNING.value,),
+                    )
+                }
+                selected = self._scheduler.select(heads, running)
+                if selected is None:
+                    conn.execute("COMMIT")
+                    return None
+                conn.execute(
+                    "UPDATE jobs SET status = ?, started_at = ?, worker_id = ?, "
+                    "attempts = attempts + 1, lease_expires_at = ? WHERE id = ?",
+                    (
+                        JobStatus.RUNNING.value,
+                        datetime.now().isoformat(),
+                        worker_id,
+                        self._lease_expiry(),
+                        selected.id,
+                    ),
+                )
+                claimed = conn.execute("SELECT * FROM jobs WHERE id = ?", (selected.id,)).fetchone()
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        return self._to_job(claimed)
+
+    def heartbeat(self, job_id: str, worker_id: str) -> bool:
+        """
+        Extend the lease of a running job.
+
+        Returns:
+            False if the job is no longer running under this worker (its
+            lease expired and it was requeued, or it finished).
+        """
+        with self._connection() as conn:
+            updated = conn.execute(
+                "UPDATE jobs SET lease_expires_at = ? "
+                "WHERE id = ? AND worker_id = ? AND status = ?",
+                (self._lease_expiry(), job_id, worker_id, JobStatus.RUNNING.value),
+            ).rowcount
+        return updated > 0
+
+    def requeue_expired(self) -> int:
+        """
+        Requeue running jobs whose lease expired.
+
+        Jobs that already used ``max_attempts`` claims are failed instead,
+        so a job that crashes its worker cannot take down the whole fleet.
+
+        Returns:
+            Number of jobs requeued.
+        """
+        now = datetime.now().isoformat()
+        expired = "status = ? AND lease_expires_at IS NOT NULL AND lease_expires_at < ?"
+        with self._connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                requeued = conn.execute(
+                    "UPDATE jobs SET status = ?, lease_expires_at = NULL "
+                    f"WHERE {expired} AND attempts < ?",
+                    (JobStatus.QUEUED.value, JobStatus.RUNNING.value, now, self._max_attempts),
+                ).rowcount
+                failed = conn.execute(
+                    "UPDATE jobs SET status = ?, error = ?, finished_at = ?, "
+                    f"lease_expires_at = NULL WHERE {expired}",
+                    (
+                        JobStatus.FAILED.value,
+                        LEASE_EXPIRED_ERROR,
+                        now,
+                        JobStatus.RUNNING.value,
+                        now,
+                    ),
+                ).rowcount
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        if requeued or failed:
+            logger.warning(
+                "Requeued jobs of lost workers", extra={"requeued": requeued, "failed": failed}
+            )
+        return requeued
+
+    def _finish(self, job_id: str, worker_id: str, status: JobStatus, **fields: Any) -> bool:
+        """Move a job held by ``worker_id`` to a terminal state and store result fields."""
+        assignments = ", ".join(f"{name} = ?" for name in fields)
+        with self._connection() as conn:
+            updated = conn.execute(
+                f"UPDATE jobs SET status = ?, finished_at = ?, lease_expires_at = NULL, "
+                f"{assignments} WHERE id = ? AND worker_id = ? AND status = ?",
+                (
+                    status.value,
+                    datetime.now().isoformat(),
+                    *fields.values(),
+                    job_id,
+                    worker_id,
+                    JobStatus.RUNNING.value,
+                ),
+            ).rowcount
+        return updated > 0
+
+    def complete(self, job_id: str, worker_id: str, output_file: str, report_length: int) -> bool:
+        """
+        Mark a job as succeeded.
+
+        Returns:
+            False if the job is no longer running under this worker (its
+            lease expired and another worker may own it); nothing is changed.
+        """
+        return self._finish(
+            job_id,
+            worker_id,
+            JobStatus.SUCCEEDED,
+            output_file=output_file,
+            report_length=report_length,
+        )
+
+    def fail(self, job_id: str, worker_id: str, error: str) -> bool:
+        """
+        Mark a job as failed.
+
+        Returns:
+            False if the job is no longer running under this worker; nothing
+            is changed.
+        """
+        return self._finish(job_id, worker_id, JobStatus.FAILED, error=error)
+
+    def get(self, job_id: str) -> Optional[ResearchJob]:
+        """Return a job by id, or None if unknown."""
+        with self._connection() as conn:
+            row = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._to_job(row) if row else None
+
+    def list_jobs(
+        self,
+        status: Optional[JobStatus] = None,
+        limit: int = 50,
+    ) -> List[ResearchJob]:
+        """
+        Return the most recent jobs, newest first.
+
+        Args:
+            status: Optional status filter.
+            limit: Maximum number of jobs to return.
+        """
+        query = "SELECT * FROM jobs"
+        params: List[Any] = []
+        if status is not None:
+            query += " WHERE status = ?"
+            params.append(status.value)
+        query += " ORDER BY created_at DESC, rowid DESC LIMIT ?"
+        params.append(limit)
+        with self._connection() as conn:
+            rows = conn.execute(query, params).fetchall()
+        return [self._to_job(row) for row in rows]
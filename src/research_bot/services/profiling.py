@@ -0,0 +1,331 @@
+"""Per-phase CPU profiles of research runs, for flamegraphs."""
+
+import cProfile
+import logging
+import os
+import sys
+import sysconfig
+import threading
+from collections import Counter
+from pathlib import Path
+from types import CodeType, FrameType, TracebackType
+from typing import Dict, List, Optional, Tuple, Type
+
+from research_bot.models.research import PhaseStatus, PhaseUpdate
+from research_bot.tools.metrics import running_tools
+
+logger = logging.getLogger(__name__)
+
+PROFILE_MODES = ("sample", "deterministic")
+
+# Segments outside the pipeline phases: crew setup before the first phase,
+# report writing and exports after the last one
+SETUP_SEGMENT = "setup"
+FINISH_SEGMENT = "finish"
+
+# Leaf frames in these modules are waiting, not computing
+_NETWORK_MODULES = ("socket.py", "ssl.py", "selectors.py", "http/client.py")
+_WAIT_MODULES = ("threading.py", "queue.py", "concurrent/futures/")
+# Third-party packages reported on their own in the summary
+_PACKAGES = ("pydantic", "crewai", "litellm", "httpx", "openai", "research_bot")
+_TOP_FRAMES = 15
+
+_SITE_PACKAGES = f"{os.sep}site-packages{os.sep}"
+_STDLIB = sysconfig.get_paths()["stdlib"] + os.sep
+
+Stack = Tuple[str, ...]
+
+
+def _short_path(filename: str) -> str:
+    """A file path relative to site-packages or the stdlib."""
+    if _SITE_PACKAGES in filename:
+        return filename.rsplit(_SITE_PACKAGES, 1)[1].replace(os.sep, "/")
+    if filename.startswith(_STDLIB):
+        return filename[len(_STDLIB):].replace(os.sep, "/")
+    marker = f"{os.sep}research_bot{os.sep}"
+    if marker in filename:
+        return "research_bot/" + filename.rsplit(marker, 1)[1].replace(os.sep, "/")
+    return os.path.basename(filename)
+
+
+def _is_idle(stack: Stack) -> bool:
+    """Whether a stack is a pool worker waiting for work or an idle event loop."""
+    leaf = stack[-1]
+    if leaf.startswith("_worker (concurrent/futures/thread.py"):
+        return True
+    return (
+        leaf.startswith("select (selectors.py")
+        and len(stack) >= 2
+        and stack[-2].startswith("_run_once (asyncio/base_events.py")
+    )
+
+
+def _category(frame: str) -> str:
+    """Summary category of a leaf frame."""
+    location = frame[frame.rfind("(") + 1:]
+    if location.startswith(_NETWORK_MODULES):
+        return "network wait"
+    if location.startswith(_WAIT_MODULES):
+        return "lock/queue wait"
+    for package in _PACKAGES:
+        if location.startswith(f"{package}/"):
+            return package
+    return "other"
+
+
+class PipelineProfiler:
+    """
+    Profiles a research run and splits the profile by pipeline phase.
+
+    A sampler thread records the Python stack of every thread at a fixed
+    interval (wall-clock, so time blocked on the network shows up too),
+    tagged with the thread and the metered tool it is running. Pass
+    ``on_progress`` to ``execute_research`` so samples are attributed to
+    the phase in progress. On exit, writes to ``output_dir``:
+
+    - ``NN-<segment>.collapsed``: folded stacks per segment (``setup``,
+      each phase, ``finish``), one ``frame;frame;... count`` line per stack,
+      as read by flamegraph.pl, speedscope or inferno;
+    - ``run.collapsed``: the whole run, rooted by segment;
+    - ``summary.txt``: samples per segment, time by category (network and
+      lock waits, pydantic, crewai, ...) and the hottest frames;
+    - ``NN-<segment>.prof`` in ``deterministic`` mode: a cProfile of the
+      thread running the pipeline per segment (``pstats``/snakeviz).
+
+    Nothing is hooked in while no profiler runs; tool calls only keep a
+    thread-to-tool map for the sampler.
+    """
+
+    def __init__(
+        self,
+        output_dir: str | Path,
+        mode: str = "sample",
+        interval_seconds: float = 0.005,
+    ) -> None:
+        """
+        Initialize profiler.
+
+        Args:
+            output_dir: Directory for the profile files (created if needed).
+            mode: ``sample`` (stack sampling only) or ``deterministic``
+                (also a cProfile per segment; slows the pipeline thread).
+            interval_seconds: Time between stack samples.
+
+        Raises:
+            ValueError: If the mode is unknown or the interval not positive.
+        """
+        if mode not in PROFILE_MODES:
+            raise ValueError(
+                f"Unknown profile mode {mode!r} (expected: {', '.join(PROFILE_MODES)})"
+            )
+        if interval_seconds <= 0:
+            raise ValueError("interval_seconds must be positive")
+        self._output_dir = Path(output_dir)
+        self._mode = mode
+        self._interval_seconds = interval_seconds
+        self._segment = SETUP_SEGMENT
+        self._samples: Dict[str, Counter] = {SETUP_SEGMENT: Counter()}
+        self._profiles: Dict[str, cProfile.Profile] = {}
+        self._active: Optional[cProfile.Profile] = None
+        self._labels: Dict[CodeType, str] = {}
+        self._thread_names: Dict[int, str] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._sampler: Optional[threading.Thread] = None
+
+    @property
+    def output_dir(self) -> Path:
+        """Directory the profile files are written to."""
+        return self._output_dir
+
+    def __enter__(self) -> "PipelineProfiler":
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        """Start profiling in the ``setup`` segment."""
+        if self._sampler is not None:
+            raise RuntimeError("profiler already started")
+        self._switch(SETUP_SEGMENT)
+        self._sampler = threading.Thread(
+            target=self._sample_loop, name="research-bot-profiler", daemon=True
+        )
+        self._sampler.start()
+
+    def stop(self) -> List[Path]:
+        """
+        Stop profiling and write the profile files.
+
+        Returns:
+            Paths of the files written.
+        """
+        if self._sampler is None:
+            return []
+        self._stop.set()
+        self._sampler.join()
+        self._sampler = None
+        if self._active is not None:
+            self._active.disable()
+            self._active = None
+        try:
+            return self._write()
+        except OSError:
+            logger.warning(
+                "Could not write profile", extra={"dir": str(self._output_dir)}, exc_info=True
+            )
+            return []
+
+    def on_progress(self, update: PhaseUpdate) -> None:
+        """Progress listener: attribute samples to the phase in progress."""
+        if update.status == PhaseStatus.STARTED:
+            self._switch(update.phase.value)
+        elif update.status == PhaseStatus.COMPLETED:
+            self._switch(FINISH_SEGMENT)
+
+    def _switch(self, segment: str) -> None:
+        with self._lock:
+            self._segment = segment
+            self._samples.setdefault(segment, Counter())
+        if self._mode != "deterministic":
+            return
+        # Called from the pipeline thread, so the cProfile follows it
+        if self._active is not None:
+            self._active.disable()
+        self._active = self._profiles.setdefault(segment, cProfile.Profile())
+        self._active.enable()
+
+    def _sample_loop(self) -> None:
+        own = threading.get_ident()
+        while not self._stop.wait(self._interval_seconds):
+            tools = running_tools()
+            stacks: List[Stack] = []
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own:
+                    continue
+                stack = self._stack(frame)
+                if not stack or _is_idle(stack):
+                    continue
+                prefix = [f"thread:{self._thread_name(thread_id)}"]
+                tool = tools.get(thread_id)
+                if tool is not None:
+                    prefix.append(f"tool:{tool}")
+                stacks.append((*prefix, *stack))
+            with self._lock:
+                self._samples[self._segment].update(stacks)
+
+    def _stack(self, frame: Optional[FrameType]) -> Stack:
+        """Frame labels from the outermost frame to ``frame``."""
+        labels: List[str] = []
+        while frame is not None:
+            code = frame.f_code
+            label = self._labels.get(code)
+            if label is None:
+                label = f"{code.co_name} ({_short_path(code.co_filename)}:{code.co_firstlineno})"
+                label = self._labels[code] = label.replace(";", ":")
+            labels.append(label)
+            frame = frame.f_back
+        labels.reverse()
+        return tuple(labels)
+
+    def _thread_name(self, thread_id: int) -> str:
+        name = self._thread_names.get(thread_id)
+        if name is None:
+            self._thread_names = {
+                thread.ident: thread.name.replace(";", ":")
+                for thread in threading.enumerate()
+                if thread.ident is not None
+            }
+            name = self._thread_names.get(thread_id, str(thread_id))
+        return name
+
+    def _ordered_segments(self) -> List[str]:
+        """Segments in run order: setup, the phases, finish."""
+        segments = [name for name in self._samples if name not in (SETUP_SEGMENT, FINISH_SEGMENT)]
+        return [
+            name
+            for name in (SETUP_SEGMENT, *segments, FINISH_SEGMENT)
+            if name in self._samples and (self._samples[name] or name in self._profiles)
+        ]
+
+    def _write(self) -> List[Path]:
+        self._output_dir.mkdir(parents=True, exist_ok=True)
+        # Segment files of an earlier run in the same directory would mix in
+        for pattern in ("[0-9][0-9]-*.collapsed", "[0-9][0-9]-*.prof"):
+            for stale in self._output_dir.glob(pattern):
+                stale.unlink()
+        written: List[Path] = []
+        run: Counter = Counter()
+        with self._lock:
+            segments = self._ordered_segments()
+            samples = {name: Counter(self._samples[name]) for name in segments}
+
+        for index, segment in enumerate(segments, start=1):
+            stem = f"{index:02d}-{segment}"
+            path = self._output_dir / f"{stem}.collapsed"
+            path.write_text(_collapsed(samples[segment]), encoding="utf-8")
+            written.append(path)
+            for stack, count in samples[segment].items():
+                run[(f"segment:{segment}", *stack)] += count
+            profile = self._profiles.get(segment)
+            if profile is not None:
+                path = self._output_dir / f"{stem}.prof"
+                profile.dump_stats(str(path))
+                written.append(path)
+
+        path = self._output_dir / "run.collapsed"
+        path.write_text(_collapsed(run), encoding="utf-8")
+        written.append(path)
+        path = self._output_dir / "summary.txt"
+        path.write_text(self._summary(segments, samples), encoding="utf-8")
+        written.append(path)
+        logger.info(
+            "Profile written",
+            extra={"dir": str(self._output_dir), "samples": sum(run.values()), "mode": self._mode},
+        )
+        return written
+
+    def _summary(self, segments: List[str], samples: Dict[str, Counter]) -> str:
+        total = sum(sum(counter.values()) for counter in samples.values())
+        interval_ms = self._interval_seconds * 1000
+        lines = [
+            f"Samples: {total} thread stacks every {interval_ms:g} ms (wall-clock, all threads)",
+            "",
+            "Samples per segment:",
+        ]
+        for segment in segments:
+            lines.append(f"  {segment:<24} {sum(samples[segment].values()):>8}")
+
+        categories: Counter = Counter()
+        self_frames: Counter = Counter()
+        cumulative: Counter = Counter()
+        for counter in samples.values():
+            for stack, count in counter.items():
+                frames = [frame for frame in stack if not frame.startswith(("thread:", "tool:"))]
+                if not frames:
+                    continue
+                categories[_category(frames[-1])] += count
+                self_frames[frames[-1]] += count
+                for frame in set(frames):
+                    cumulative[frame] += count
+
+        lines.extend(["", "Time by category (leaf frame):"])
+        for category, count in categories.most_common():
+            lines.append(f"  {category:<24} {count:>8} {count / total:>7.1%}")
+        for title, counter in (("self", self_frames), ("cumulative", cumulative)):
+            lines.extend(["", f"Top frames ({title}):"])
+            for frame, count in counter.most_common(_TOP_FRAMES):
+                lines.append(f"  {count:>8} {count / total:>7.1%}  {frame}")
+        return "\n".join(lines) + "\n"
+
+
+def _collapsed(samples: Counter) -> str:
+    """Folded stack lines, heaviest first."""
+    return "".join(f"{';'.join(stack)} {count}\n" for stack, count in samples.most_common())
@@ -0,0 +1,90 @@
+"""Phase progress tracking for the sequential research pipeline."""
+
+import logging
+import time
+from typing import Any, Callable, List, Optional, Sequence
+
+from research_bot.models.research import PhaseStatus, PhaseUpdate, ResearchPhase
+
+logger = logging.getLogger(__name__)
+
+ProgressCallback = Callable[[PhaseUpdate], None]
+
+
+class PhaseTracker:
+    """
+    Follows a sequential crew through its phases.
+
+    The crew runs one task per phase in order, so each completed task marks
+    the end of the current phase and the start of the next. Wire
+    ``task_completed`` to the crew's task callback and call ``start()`` right
+    before kickoff.
+    """
+
+    def __init__(
+        self,
+        phases: Sequence[ResearchPhase],
+        listeners: Sequence[ProgressCallback] = (),
+    ) -> None:
+        """
+        Initialize tracker.
+
+        Args:
+            phases: Pipeline phases in execution order (one per task).
+            listeners: Callbacks notified of every phase transition.
+        """
+        self._phases = list(phases)
+        self._listeners: List[ProgressCallback] = list(listeners)
+        self._index = 0
+        self._phase_started_at: Optional[float] = None
+
+    @property
+    def current_phase(self) -> Optional[ResearchPhase]:
+        """Phase currently executing, or None before start/after the last phase."""
+        if self._phase_started_at is None or self._index >= len(self._phases):
+            return None
+        return self._phases[self._index]
+
+    def add_listener(self, listener: ProgressCallback) -> None:
+        """Register another progress callback."""
+        self._listeners.append(listener)
+
+    def start(self) -> None:
+        """Mark the first phase as started."""
+        self._index = 0
+        self._start_current()
+
+    def task_completed(self, output: Any) -> None:
+        """Crew task callback: complete the current phase and start the next."""
+        phase = self.current_phase
+        if phase is None:
+            return
+
+        elapsed = time.perf_counter() - (self._phase_started_at or time.perf_counter())
+        summary = getattr(output, "summary", None)
+        self._emit(
+            PhaseUpdate(
+                phase=phase,
+                status=PhaseStatus.COMPLETED,
+                elapsed_seconds=elapsed,
+                summary=str(summary) if summary else None,
+            )
+        )
+        self._index += 1
+        self._start_current()
+
+    def _start_current(self) -> None:
+        """Emit a start event for the phase at the current index."""
+        if self._index >= len(self._phases):
+            self._phase_started_at = None
+            return
+        self._phase_started_at = time.perf_counter()
+        self._emit(PhaseUpdate(phase=self._phases[self._index], status=PhaseStatus.STARTED))
+
+    def _emit(self, update: PhaseUpdate) -> None:
+        """Notify listeners; a failing listener never breaks the pipeline."""
+        for listener in self._listeners:
+            try:
+                listener(update)
+            except Exception:
+                logger.exception("Progress listener failed")
@@ -0,0 +1,247 @@
+"""SQLite-backed history of research runs."""
+
+import os
+import sqlite3
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+from research_bot.models.run import RunRecord, RunStatus
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id TEXT PRIMARY KEY,
+    topic TEXT NOT NULL,
+    status TEXT NOT NULL,
+    error TEXT,
+    output_file TEXT,
+    report_length INTEGER,
+    started_at TEXT NOT NULL,
+    duration_seconds REAL NOT NULL,
+    total_tokens INTEGER NOT NULL,
+    cost_usd REAL NOT NULL,
+    tool_calls INTEGER NOT NULL,
+    record TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_runs_started ON runs (started_at);
+"""
+
+
+def percentile(values: Sequence[float], fraction: float) -> float:
+    """Nearest-rank percentile; 0.0 for no values."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+
+@dataclass
+class Distribution:
+    """p50/p90/p99 and mean of one metric."""
+
+    p50: float = 0.0
+    p90: float = 0.0
+    p99: float = 0.0
+    mean: float = 0.0
+
+    @classmethod
+    def of(cls, values: Sequence[float]) -> "Distribution":
+        """Summarize a list of samples."""
+        if not values:
+            return cls()
+        return cls(
+            p50=percentile(values, 0.50),
+            p90=percentile(values, 0.90),
+            p99=percentile(values, 0.99),
+            mean=sum(values) / len(values),
+        )
+
+
+@dataclass
+class RunSummary:
+    """Aggregate statistics over a set of runs."""
+
+    runs: int = 0
+    failed: int = 0
+    duration_seconds: Distribution = field(default_factory=Distribution)
+    total_tokens: Distribution = field(default_factory=Distribution)
+    cost_usd: Distribution = field(default_factory=Distribution)
+    tool_calls: Distribution = field(default_factory=Distribution)
+    total_cost_usd: float = 0.0
+    cache_hit_rate: Optional[float] = None
+    phase_seconds: Dict[str, Distribution] = field(default_factory=dict)
+    deadline_runs: int = 0
+    deadline_misses: int = 0
+    degraded_phases: int = 0
+    prefetches_issued: int = 0
+    prefetches_used: int = 0
+    prefetches_wasted: int = 0
+    prefetch_saved_seconds: float = 0.0
+
+    @classmethod
+    def of(cls, runs: Sequence[RunRecord]) -> "RunSummary":
+        """
+        Aggregate runs.
+
+        Latency percentiles cover successful runs only, so fast failures do
+        not hide slow successes; cost and tokens cover every run.
+        """
+        succeeded = [run for run in runs if run.status == RunStatus.SUCCEEDED]
+
+        phases: Dict[str, List[float]] = {}
+        for run in succeeded:
+            for timing in run.phases:
+                phases.setdefault(timing.phase.value, []).append(timing.elapsed_seconds)
+
+        hits = sum(usage.cache_hits for run in runs for usage in run.tools)
+        lookups = hits + sum(usage.cache_misses for run in runs for usage in run.tools)
+
+        return cls(
+            runs=len(runs),
+            failed=len(runs) - len(succeeded),
+            duration_seconds=Distribution.of([run.duration_seconds for run in succeeded]),
+            total_tokens=Distribution.of([run.tokens.total_tokens for run in runs]),
+            cost_usd=Distribution.of([run.cost_usd for run in runs]),
+            tool_calls=Distribution.of([run.tool_calls for run in runs]),
+            total_cost_usd=sum(run.cost_usd for run in runs),
+            cache_hit_rate=hits / lookups if lookups else None,
+            phase_seconds={name: Distribution.of(values) for name, values in phases.items()},
+            deadline_runs=sum(1 for run in runs if run.deadline_seconds is not None),
+            deadline_misses=sum(1 for run in runs if run.missed_deadline),
+            degraded_phases=sum(1 for run in runs for budget in run.budgets if budget.degraded),
+            prefetches_issued=sum(run.prefetch.issued for run in runs),
+            prefetches_used=sum(run.prefetch.used for run in runs),
+            prefetches_wasted=sum(run.prefetch.wasted for run in runs),
+            prefetch_saved_seconds=sum(run.prefetch.saved_seconds for run in runs),
+        )
+
+
+class RunStore:
+    """
+    Durable history of pipeline runs in a SQLite database.
+
+    Headline metrics are stored as columns for cheap filtering; the full
+    ``RunRecord`` (phases, tools, sources, settings) is kept as JSON.
+    Safe to share between processes.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """
+        Initialize the store, creating the database if needed.
+
+        Args:
+            path: Location of the SQLite database file.
+        """
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connection() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+
+    @property
+    def path(self) -> Path:
+        """Location of the SQLite database file."""
+        return self._path
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        """Open a short-lived autocommit connection."""
+        conn = sqlite3.connect(self._path, timeout=30.0, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def record(self, run: RunRecord) -> None:
+        """Store a finished run."""
+        with self._connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO runs (id, topic, status, error, output_file, "
+                "report_length, started_at, duration_seconds, total_tokens, cost_usd, "
+                "tool_calls, record) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    run.id,
+                    run.topic,
+                    run.status.value,
+                    run.error,
+                    run.output_file,
+                    run.report_length,
+                    run.started_at.isoformat(),
+                    run.duration_seconds,
+                    run.tokens.total_tokens,
+                    run.cost_usd,
+                    run.tool_calls,
+                    run.model_dump_json(),
+                ),
+            )
+
+    def get(self, run_id: str) -> Optional[RunRecord]:
+        """Return a run by id, or None if unknown."""
+        with self._connection() as conn:
+            row = conn.execute("SELECT record FROM runs WHERE id = ?", (run_id,)).fetchone()
+        return RunRecord.model_validate_json(row["record"]) if row else None
+
+    def find_by_output_file(self, output_file: str | Path) -> Optional[RunRecord]:
+        """
+        Return the latest run that wrote a report, or None if unknown.
+
+        Matches the path as given, its absolute form and its form relative
+        to the working directory, since runs record the path they were given.
+        """
+        path = Path(output_file)
+        resolved = path.resolve()
+        candidates = list(dict.fromkeys([
+            str(output_file),
+            str(path),
+            str(resolved),
+            os.path.relpath(resolved),
+        ]))
+        placeholders = ", ".join("?" for _ in candidates)
+        with self._connection() as conn:
+            row = conn.execute(
+                f"SELECT record FROM runs WHERE output_file IN ({placeholders}) "
+                "ORDER BY started_at DESC LIMIT 1",
+                candidates,
+            ).fetchone()
+        return RunRecord.model_validate_json(row["record"]) if row else None
+
+    def list_runs(
+        self,
+        since: Optional[datetime] = None,
+        status: Optional[RunStatus] = None,
+        limit: Optional[int] = None,
+    ) -> List[RunRecord]:
+        """
+        Return recorded runs, newest first.
+
+        Args:
+            since: Only runs started at or after this time.
+            status: Optional status filter.
+            limit: Maximum number of runs to return.
+        """
+        query = "SELECT record FROM runs"
+        conditions: List[str] = []
+        params: List[Any] = []
+        if since is not None:
+            conditions.append("started_at >= ?")
+            params.append(since.isoformat())
+        if status is not None:
+            conditions.append("status = ?")
+            params.append(status.value)
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY started_at DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        with self._connection() as conn:
+            rows = conn.execute(query, params).fetchall()
+        return [RunRecord.model_validate_json(row["record"]) for row in rows]
+
+    def summarize(self, since: Optional[datetime] = None) -> RunSummary:
+        """Aggregate latency, token, cost and cache statistics."""
+        return RunSummary.of(self.list_runs(since=since))
@@ -0,0 +1,206 @@
+"""Priority and fair-share scheduling of queued research jobs."""
+
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from research_bot.models.job import JobPriority, JobStatus, ResearchJob
+from research_bot.services.run_store import Distribution
+
+if TYPE_CHECKING:
+    from research_bot.config.settings import Settings
+
+logger = logging.getLogger(__name__)
+
+# Share of the tightest provider budget a class needs left to be dispatched
+DEFAULT_HEADROOM_RESERVES: Dict[JobPriority, float] = {
+    JobPriority.INTERACTIVE: 0.0,
+    JobPriority.STANDARD: 0.2,
+    JobPriority.BATCH: 0.5,
+}
+
+
+@dataclass(frozen=True)
+class SchedulingPolicy:
+    """How queued jobs compete for worker slots."""
+
+    # Queueing time that promotes a job one class (0: no aging)
+    aging_seconds: float = 300.0
+    # Running jobs per tenant (0: no limit), and per-tenant overrides
+    tenant_max_running: int = 0
+    tenant_limits: Dict[str, int] = field(default_factory=dict)
+    # Relative share of slots per tenant (default 1.0)
+    tenant_weights: Dict[str, float] = field(default_factory=dict)
+    headroom_reserves: Dict[JobPriority, float] = field(
+        default_factory=lambda: dict(DEFAULT_HEADROOM_RESERVES)
+    )
+
+    def __post_init__(self) -> None:
+        if self.aging_seconds < 0:
+            raise ValueError("aging_seconds must not be negative")
+        if self.tenant_max_running < 0 or any(limit < 0 for limit in self.tenant_limits.values()):
+            raise ValueError("tenant limits must not be negative")
+        if any(weight <= 0 for weight in self.tenant_weights.values()):
+            raise ValueError("tenant weights must be positive")
+        if any(not 0.0 <= reserve <= 1.0 for reserve in self.headroom_reserves.values()):
+            raise ValueError("headroom reserves must be between 0 and 1")
+
+    @classmethod
+    def from_settings(cls, settings: "Settings") -> "SchedulingPolicy":
+        """Build the policy configured in settings."""
+        return cls(
+            aging_seconds=settings.job_aging_seconds,
+            tenant_max_running=settings.tenant_max_running,
+            tenant_limits=dict(settings.tenant_limits),
+            tenant_weights=dict(settings.tenant_weights),
+            headroom_reserves={
+                JobPriority.INTERACTIVE: 0.0,
+                JobPriority.STANDARD: settings.standard_headroom_reserve,
+                JobPriority.BATCH: settings.batch_headroom_reserve,
+            },
+        )
+
+    def tenant_limit(self, tenant: str) -> int:
+        """Running jobs allowed for a tenant (0: no limit)."""
+        return self.tenant_limits.get(tenant, self.tenant_max_running)
+
+    def tenant_weight(self, tenant: str) -> float:
+        """Relative share of slots of a tenant."""
+        return self.tenant_weights.get(tenant, 1.0)
+
+
+class JobScheduler:
+    """
+    Picks the queued job a free worker slot runs next.
+
+    Jobs compete by class: interactive before standard before batch.
+    Every ``aging_seconds`` a job waits promotes it one class, so a batch
+    job waits at most twice that long behind a stream of interactive ones.
+    Within a class, the tenant with the fewest running jobs for its weight
+    goes first (fair share), then the oldest job. Tenants at their running
+    limit are skipped. When a provider's request budget runs low (see
+    ``RateBudget``), classes whose headroom reserve is not met wait, so
+    the remaining requests go to interactive jobs.
+
+    Stateless between calls: running counts come from the queue, so every
+    worker of a deployment applies the same policy.
+    """
+
+    def __init__(
+        self,
+        policy: Optional[SchedulingPolicy] = None,
+        headroom: Optional[Callable[[], Mapping[str, float]]] = None,
+    ) -> None:
+        """
+        Initialize scheduler.
+
+        Args:
+            policy: Scheduling policy (default: classes and aging only).
+            headroom: Optional source of each provider's remaining request
+                budget, as shares from 0.0 to 1.0.
+        """
+        self._policy = policy or SchedulingPolicy()
+        self._headroom = headroom
+
+    @property
+    def policy(self) -> SchedulingPolicy:
+        """The scheduling policy."""
+        return self._policy
+
+    def effective_priority(self, job: ResearchJob, now: Optional[datetime] = None) -> JobPriority:
+        """A job's class after aging."""
+        if self._policy.aging_seconds <= 0:
+            return job.priority
+        waited = ((now or datetime.now()) - job.created_at).total_seconds()
+        promotions = int(max(0.0, waited) // self._policy.aging_seconds)
+        return list(JobPriority)[max(0, job.priority.rank - promotions)]
+
+    def provider_headroom(self) -> float:
+        """Remaining budget of the tightest provider (1.0 if none is tracked)."""
+        if self._headroom is None:
+            return 1.0
+        try:
+            return min(self._headroom().values(), default=1.0)
+        except Exception:
+            logger.warning("Provider headroom unavailable", exc_info=True)
+            return 1.0
+
+    def select(
+        self,
+        candidates: Iterable[ResearchJob],
+        running_by_tenant: Mapping[str, int],
+        now: Optional[datetime] = None,
+    ) -> Optional[ResearchJob]:
+        """
+        Choose the next job to run.
+
+        Args:
+            candidates: Queued jobs to choose from; the oldest job of each
+                class and tenant is enough, later ones never win.
+            running_by_tenant: Running jobs per tenant, across all workers.
+            now: Current time (default: now).
+
+        Returns:
+            The job to run, or None if every candidate has to wait.
+        """
+        now = now or datetime.now()
+        headroom = self.provider_headroom()
+        best: Optional[ResearchJob] = None
+        best_key: Optional[Tuple[int, float, datetime]] = None
+        for job in candidates:
+            running = running_by_tenant.get(job.tenant, 0)
+            limit = self._policy.tenant_limit(job.tenant)
+            if limit and running >= limit:
+                continue
+            priority = self.effective_priority(job, now)
+            if headroom < self._policy.headroom_reserves.get(priority, 0.0):
+                continue
+            key = (priority.rank, running / self._policy.tenant_weight(job.tenant), job.created_at)
+            if best_key is None or key < best_key:
+                best, best_key = job, key
+        return best
+
+
+@dataclass(frozen=True)
+class ClassWaits:
+    """Queue wait times of one priority class."""
+
+    priority: JobPriority
+    # Jobs that started, and how long they were queued
+    started: int
+    wait_seconds: Distribution
+    # Jobs still queued, and how long the oldest has waited so far
+    queued: int
+    oldest_queued_seconds: float
+
+
+def wait_summary(jobs: Iterable[ResearchJob], now: Optional[datetime] = None) -> List[ClassWaits]:
+    """
+    Summarize queue wait times per priority class.
+
+    Args:
+        jobs: Jobs to summarize (e.g. the most recent ones of a queue).
+        now: Current time, for the age of queued jobs (default: now).
+
+    Returns:
+        One entry per class, most urgent first.
+    """
+    now = now or datetime.now()
+    waits: Dict[JobPriority, List[float]] = {priority: [] for priority in JobPriority}
+    queued: Dict[JobPriority, List[float]] = {priority: [] for priority in JobPriority}
+    for job in jobs:
+        if job.status == JobStatus.QUEUED:
+            queued[job.priority].append(max(0.0, (now - job.created_at).total_seconds()))
+        elif job.wait_seconds is not None:
+            waits[job.priority].append(job.wait_seconds)
+    return [
+        ClassWaits(
+            priority=priority,
+            started=len(waits[priority]),
+            wait_seconds=Distribution.of(waits[priority]),
+            queued=len(queued[priority]),
+            oldest_queued_seconds=max(queued[priority], default=0.0),
+        )
+        for priority in JobPriority
+    ]
@@ -0,0 +1,232 @@
+"""Section drafter - writes report sections as concurrent LLM calls."""
+
+import logging
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from crewai import LLM
+
+from research_bot.export.parser import extract_urls
+from research_bot.models.report import ReportMetadata, ReportSection, ResearchReport, SectionType
+
+logger = logging.getLogger(__name__)
+
+_LEADING_HEADING = re.compile(r"^\s*#{1,6}\s+[^\n]*\n+")
+_MARKDOWN_LINK = re.compile(r"\[([^\]]+)\]\((https?://[^)\s]+)\)")
+
+
+@dataclass(frozen=True)
+class SectionBrief:
+    """What to write for one report section."""
+
+    title: str
+    instructions: str
+
+
+# Sections drafted by the LLM, in report order. References are assembled
+# from the drafts' citations instead, so they cost no generation.
+SECTION_BRIEFS: Dict[SectionType, SectionBrief] = {
+    SectionType.EXECUTIVE_SUMMARY: SectionBrief(
+        "Executive Summary",
+        "Summarize the key findings, their significance and the main "
+        "conclusions in 2-3 paragraphs for a busy executive.",
+    ),
+    SectionType.INTRODUCTION: SectionBrief(
+        "Introduction",
+        "Introduce the topic: context, why it matters now and the scope of this report.",
+    ),
+    SectionType.METHODOLOGY: SectionBrief(
+        "Methodology",
+        "Describe briefly how the research was conducted: the research plan, "
+        "the kinds of sources consulted and how findings were reviewed.",
+    ),
+    SectionType.KEY_FINDINGS: SectionBrief(
+        "Key Findings",
+        "Present the detailed findings organized by theme (use ### subheadings), "
+        "with facts, figures and a citation for every claim.",
+    ),
+    SectionType.INDUSTRY_ANALYSIS: SectionBrief(
+        "Industry Analysis",
+        "Give the market perspective: trends, notable implementations and case "
+        "studies, and business implications.",
+    ),
+    SectionType.CONCLUSIONS: SectionBrief(
+        "Conclusions and Implications",
+        "Draw the conclusions, their implications and the open questions or "
+        "recommended next steps.",
+    ),
+}
+
+REFERENCES_TITLE = "References"
+
+
+class SectionDrafter:
+    """
+    Drafts report sections concurrently from the reviewed research.
+
+    Every section is one direct LLM call on the same material, so the report
+    phase takes about as long as its longest section instead of one long
+    generation of the whole report. The material comes first in each prompt
+    and is identical across sections, which lets providers with prompt
+    caching reuse it. Drafts are assembled into ``ResearchReport.sections``
+    and a references section is built from the URLs they cite.
+    """
+
+    def __init__(
+        self,
+        llm: LLM,
+        briefs: Optional[Dict[SectionType, SectionBrief]] = None,
+        max_workers: int = 6,
+    ) -> None:
+        """
+        Initialize drafter.
+
+        Args:
+            llm: LLM the sections are written with.
+            briefs: Sections to draft, in report order (default: ``SECTION_BRIEFS``).
+            max_workers: Sections drafted at once.
+        """
+        self._llm = llm
+        self._briefs = dict(briefs or SECTION_BRIEFS)
+        self._max_workers = max(1, max_workers)
+
+    def draft(
+        self,
+        topic: str,
+        material: Sequence[Tuple[str, str]],
+        agent: Optional[Any] = None,
+    ) -> ResearchReport:
+        """
+        Write every section and assemble the report.
+
+        Args:
+            topic: The research topic.
+            material: ``(title, text)`` of each earlier phase's output
+                (plan, research, analysis, review).
+            agent: Agent the LLM calls are attributed to (for token usage).
+
+        Returns:
+            The report with typed sections; sections whose call failed are
+            left out.
+
+        Raises:
+            RuntimeError: If no section could be drafted.
+        """
+        started = time.perf_counter()
+        context = self._context(topic, material)
+        briefs = list(self._briefs.items())
+
+        with ThreadPoolExecutor(
+            max_workers=min(self._max_workers, len(briefs)),
+            thread_name_prefix="section-drafter",
+        ) as pool:
+            futures = [
+                pool.submit(self._draft_section, context, brief, agent)
+                for _, brief in briefs
+            ]
+            drafts = [future.result() for future in futures]
+
+        sections: List[ReportSection] = []
+        for (section_type, brief), content in zip(briefs, drafts):
+            if content is not None:
+                sections.append(
+                    ReportSection(
+                        section_type=section_type,
+                        title=brief.title,
+                        content=content,
+                        order=len(sections),
+                    )
+                )
+        if not sections:
+            raise RuntimeError("No report section could be drafted")
+
+        references = self._references([section.content for section in sections], material)
+        if references:
+            sections.append(
+                ReportSection(
+                    section_type=SectionType.REFERENCES,
+                    title=REFERENCES_TITLE,
+                    content=references,
+                    order=len(sections),
+                )
+            )
+
+        logger.info(
+            "Report sections drafted",
+            extra={
+                "sections": len(sections),
+                "failed": len(briefs) - sum(draft is not None for draft in drafts),
+                "elapsed_seconds": round(time.perf_counter() - started, 2),
+            },
+        )
+        return ResearchReport(
+            metadata=ReportMetadata(title=f"Research Report: {topic}", topic=topic),
+            sections=sections,
+        )
+
+    @staticmethod
+    def _context(topic: str, material: Sequence[Tuple[str, str]]) -> str:
+        """Shared prompt prefix: topic, date and the earlier phases' output."""
+        parts = [
+            f"RESEARCH TOPIC: {topic}",
+            f"TODAY'S DATE: {datetime.now():%Y-%m-%d}",
+            "RESEARCH MATERIAL (plan, findings, analysis and quality review):",
+        ]
+        parts.extend(f"## {title}\n\n{text.strip()}" for title, text in material if text.strip())
+        return "\n\n".join(parts)
+
+    def _draft_section(
+        self, context: str, brief: SectionBrief, agent: Optional[Any]
+    ) -> Optional[str]:
+        """Write one section; None if the call failed."""
+        messages = [
+            {
+                "role": "system",
+                "content": (
+                    "You are a professional technical writer producing one section of an "
+                    "executive-quality research report. Write in markdown, use only the "
+                    "research material provided, and cite sources inline as markdown "
+                    "links [source title](URL) using URLs that appear in the material."
+                ),
+            },
+            {
+                "role": "user",
+                "content": (
+                    f"{context}\n\n---\n\n"
+                    f"Write the \"{brief.title}\" section of the report. {brief.instructions}\n"
+                    "Output only the section body, without the section heading."
+                ),
+            },
+        ]
+        try:
+            content = str(self._llm.call(messages, from_agent=agent)).strip()
+        except Exception:
+            logger.exception("Section draft failed", extra={"section": brief.title})
+            return None
+        # Models often repeat the heading they were told to leave out
+        return _LEADING_HEADING.sub("", content, count=1).strip() or None
+
+    @staticmethod
+    def _references(drafts: Sequence[str], material: Sequence[Tuple[str, str]]) -> str:
+        """
+        List the cited sources as markdown links.
+
+        Uses the link text the drafts gave each URL; URLs cited without a
+        title are listed bare. Without citations in the drafts, the sources
+        in the material are listed instead.
+        """
+        titles: Dict[str, str] = {}
+        for draft in drafts:
+            for title, url in _MARKDOWN_LINK.findall(draft):
+                titles.setdefault(url, title)
+        urls = extract_urls("\n".join(drafts)) or extract_urls(
+            "\n".join(text for _, text in material)
+        )
+        return "\n".join(
+            f"{number}. [{titles[url]}]({url})" if url in titles else f"{number}. {url}"
+            for number, url in enumerate(urls, 1)
+        )
@@ -0,0 +1,101 @@
+"""Per-run LLM token accounting."""
+
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Sequence
+
+from crewai.events import LLMCallCompletedEvent, crewai_event_bus
+from crewai.types.usage_metrics import UsageMetrics
+
+from research_bot.models.run import TokenUsage
+
+logger = logging.getLogger(__name__)
+
+# Seconds to wait for queued event handlers when a run finishes
+FLUSH_TIMEOUT_SECONDS = 5.0
+
+
+class TokenCounter:
+    """Thread-safe token totals for one run."""
+
+    def __init__(self) -> None:
+        self._metrics = UsageMetrics()
+        self._lock = threading.Lock()
+
+    def add(self, usage: Dict[str, Any]) -> None:
+        """Add a provider usage dict (any key convention CrewAI accepts)."""
+        metrics = UsageMetrics.from_provider_dict(usage)
+        if metrics is None:
+            return
+        with self._lock:
+            self._metrics.add_usage_metrics(metrics)
+
+    def usage(self) -> TokenUsage:
+        """Return the totals so far."""
+        with self._lock:
+            return TokenUsage(
+                prompt_tokens=self._metrics.prompt_tokens,
+                completion_tokens=self._metrics.completion_tokens,
+                cached_prompt_tokens=self._metrics.cached_prompt_tokens,
+                total_tokens=self._metrics.total_tokens,
+                requests=self._metrics.successful_requests,
+            )
+
+
+# Agent id -> counter of the run the agent belongs to. The LLM instance is
+# shared by every agent and run, so its own cumulative counters cannot be
+# attributed to a single run; completion events carry the calling agent.
+_counters: Dict[str, TokenCounter] = {}
+_counters_lock = threading.Lock()
+_handler_registered = False
+
+
+def _on_llm_call_completed(source: Any, event: LLMCallCompletedEvent) -> None:
+    """Event bus handler: credit usage to the calling agent's run."""
+    if not event.usage or not event.agent_id:
+        return
+    with _counters_lock:
+        counter = _counters.get(event.agent_id)
+    if counter is not None:
+        counter.add(event.usage)
+
+
+def _ensure_handler() -> None:
+    """Register the event handler once per process."""
+    global _handler_registered
+    with _counters_lock:
+        if _handler_registered:
+            return
+        crewai_event_bus.on(LLMCallCompletedEvent)(_on_llm_call_completed)
+        _handler_registered = True
+
+
+@contextmanager
+def track_token_usage(agents: Sequence[Any], counter: TokenCounter) -> Iterator[TokenCounter]:
+    """
+    Count tokens of LLM calls made by ``agents`` while the block runs.
+
+    Pending event handlers are flushed on exit, so ``counter`` holds the
+    complete totals once the block has exited.
+
+    Args:
+        agents: The run's agents (each needs a unique ``id``).
+        counter: Counter to credit.
+
+    Yields:
+        ``counter``.
+    """
+    _ensure_handler()
+    agent_ids = [str(agent.id) for agent in agents]
+    with _counters_lock:
+        for agent_id in agent_ids:
+            _counters[agent_id] = counter
+    try:
+        yield counter
+    finally:
+        if not crewai_event_bus.flush(timeout=FLUSH_TIMEOUT_SECONDS):
+            logger.warning("Token usage may be incomplete: event handlers still pending")
+        with _counters_lock:
+            for agent_id in agent_ids:
+                _counters.pop(agent_id, None)
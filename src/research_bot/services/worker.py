@@ -0,0 +1,219 @@
+"""Long-running worker that executes queued research jobs."""
+
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, Set
+
+from research_bot.models.job import JobStatus, ResearchJob
+from research_bot.services.job_queue import QueueBackend
+
+if TYPE_CHECKING:
+    from research_bot.distributed.metrics import ClusterMetrics
+    from research_bot.services.research_service import ResearchService
+
+logger = logging.getLogger(__name__)
+
+
+class ResearchWorker:
+    """
+    Pulls jobs from a ``JobQueue`` and runs them on one shared service.
+
+    The ``ResearchService`` (and with it the LLM client, tool clients, HTTP
+    connection pool and result caches) is created once and reused for every
+    job, so per-job cost is only the pipeline itself. Up to ``concurrency``
+    jobs run at the same time.
+
+    Any number of workers, on any number of nodes, can share one queue.
+    Each worker claims jobs under its ``worker_id`` and, every
+    ``heartbeat_interval``, extends the leases of its running jobs,
+    requeues jobs whose workers stopped heartbeating and reports its load
+    to the optional cluster metrics.
+    """
+
+    def __init__(
+        self,
+        service: "ResearchService",
+        queue: QueueBackend,
+        output_dir: str | Path = "reports",
+        concurrency: int = 2,
+        poll_interval: float = 2.0,
+        worker_id: str = "worker",
+        heartbeat_interval: float = 20.0,
+        metrics: Optional["ClusterMetrics"] = None,
+    ) -> None:
+        """
+        Initialize the worker.
+
+        Args:
+            service: Warm research service shared by all jobs.
+            queue: Queue to pull jobs from and record status in.
+            output_dir: Directory for reports of jobs without an explicit path.
+            concurrency: Maximum number of jobs executing at once.
+            poll_interval: Seconds to wait between polls of an empty queue.
+            worker_id: Id the worker holds job leases under (unique per node).
+            heartbeat_interval: Seconds between lease renewals; keep it well
+                below the queue's lease time.
+            metrics: Optional cluster metrics to report jobs and load to.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self._service = service
+        self._queue = queue
+        self._output_dir = Path(output_dir)
+        self._concurrency = concurrency
+        self._poll_interval = poll_interval
+        self._worker_id = worker_id
+        self._heartbeat_interval = heartbeat_interval
+        self._metrics = metrics
+        self._stop = threading.Event()
+        self._active: Set[str] = set()
+        self._active_lock = threading.Lock()
+
+    def stop(self) -> None:
+        """Stop claiming new jobs; running jobs are allowed to finish."""
+        self._stop.set()
+
+    def _heartbeat(self) -> None:
+        """Renew leases, requeue jobs of lost workers and report load."""
+        with self._active_lock:
+            active = list(self._active)
+        for job_id in active:
+            try:
+                if not self._queue.heartbeat(job_id, self._worker_id):
+                    logger.warning(
+                        "Job lease lost", extra={"job_id": job_id, "worker_id": self._worker_id}
+                    )
+            except Exception:
+                logger.exception("Heartbeat failed", extra={"job_id": job_id})
+        try:
+            requeued = self._queue.requeue_expired()
+        except Exception:
+            logger.exception("Requeue of expired jobs failed")
+            requeued = 0
+        if self._metrics is not None:
+            self._metrics.record_requeued(requeued)
+            self._metrics.node_heartbeat(
+                self._worker_id, running=len(active), concurrency=self._concurrency
+            )
+
+    def _heartbeat_loop(self, done: threading.Event) -> None:
+        """Heartbeat until the worker has stopped and its jobs have finished."""
+        while not done.wait(self._heartbeat_interval):
+            self._heartbeat()
+
+    def run(self, drain: bool = False) -> int:
+        """
+        Process jobs until stopped.
+
+        Args:
+            drain: Exit once the queue is empty and all jobs have finished.
+
+        Returns:
+            Number of jobs processed.
+        """
+        self._output_dir.mkdir(parents=True, exist_ok=True)
+        processed = 0
+        running: Set[Future[None]] = set()
+
+        logger.info(
+            "Worker started",
+            extra={
+                "queue": self._queue.location,
+                "worker_id": self._worker_id,
+                "concurrency": self._concurrency,
+            },
+        )
+        self._heartbeat()
+        heartbeats_done = threading.Event()
+        heartbeats = threading.Thread(
+            target=self._heartbeat_loop,
+            args=(heartbeats_done,),
+            name="worker-heartbeat",
+            daemon=True,
+        )
+        heartbeats.start()
+        with ThreadPoolExecutor(
+            max_workers=self._concurrency,
+            thread_name_prefix="research-job",
+        ) as executor:
+            try:
+                while not self._stop.is_set():
+                    running = {future for future in running if not future.done()}
+                    if len(running) >= self._concurrency:
+                        wait(running, timeout=self._poll_interval, return_when=FIRST_COMPLETED)
+                        continue
+
+                    job = self._queue.claim(self._worker_id)
+                    if job is None:
+                        # Queued jobs the scheduler holds back still count
+                        if (
+                            drain
+                            and not running
+                            and not self._queue.list_jobs(JobStatus.QUEUED, limit=1)
+                        ):
+                            break
+                        self._stop.wait(self._poll_interval)
+                        continue
+
+                    with self._active_lock:
+                        self._active.add(job.id)
+                    running.add(executor.submit(self._execute, job))
+                    processed += 1
+            except KeyboardInterrupt:
+                logger.info("Worker interrupted, waiting for %d running job(s)", len(running))
+                self._stop.set()
+
+        heartbeats_done.set()
+        heartbeats.join()
+        if self._metrics is not None:
+            self._metrics.node_heartbeat(self._worker_id, running=0, concurrency=self._concurrency)
+        logger.info("Worker stopped", extra={"processed": processed})
+        return processed
+
+    def _output_path(self, job: ResearchJob) -> str:
+        """Return the report path for a job."""
+        return job.output_file or str(self._output_dir / f"{job.id}.md")
+
+    def _execute(self, job: ResearchJob) -> None:
+        """Run one job and record its outcome in the queue."""
+        try:
+            self._run_job(job)
+        finally:
+            with self._active_lock:
+                self._active.discard(job.id)
+
+    def _lost_lease(self, job: ResearchJob) -> None:
+        """Drop the outcome of a job whose lease expired while it ran."""
+        logger.warning(
+            "Job lease lost before it finished; outcome dropped",
+            extra={"job_id": job.id, "worker_id": self._worker_id},
+        )
+
+    def _run_job(self, job: ResearchJob) -> None:
+        output_file = self._output_path(job)
+        logger.info(
+            "Job started", extra={"job_id": job.id, "topic": job.topic, "attempt": job.attempts}
+        )
+        started = time.perf_counter()
+        try:
+            report = self._service.execute_research(job.topic, output_file=output_file)
+        except Exception as e:
+            logger.exception("Job failed", extra={"job_id": job.id})
+            if not self._queue.fail(job.id, self._worker_id, str(e)):
+                self._lost_lease(job)
+                return
+            if self._metrics is not None:
+                self._metrics.record_job(self._worker_id, False, time.perf_counter() - started)
+            return
+
+        if not self._queue.complete(
+            job.id, self._worker_id, output_file=output_file, report_length=len(report)
+        ):
+            self._lost_lease(job)
+            return
+        if self._metrics is not None:
+            self._metrics.record_job(self._worker_id, True, time.perf_counter() - started)
+        logger.info("Job succeeded", extra={"job_id": job.id, "output_file": output_file})
@@ -1,7 +1,7 @@
 """Task factories module."""
 
 from research_bot.tasks.base import TaskFactory
-from research_bot.tasks.planning import PlanningTaskFactory
+from research_bot.tasks.planning import PlanningTaskFactory, QueryPlanTaskFactory
 from research_bot.tasks.research import ResearchTaskFactory
 from research_bot.tasks.analysis import AnalysisTaskFactory
 from research_bot.tasks.review import ReviewTaskFactory
@@ -10,6 +10,7 @@ from research_bot.tasks.report import ReportTaskFactory
 __all__ = [
     "TaskFactory",
     "PlanningTaskFactory",
+    "QueryPlanTaskFactory",
     "ResearchTaskFactory",
     "AnalysisTaskFactory",
     "ReviewTaskFactory",
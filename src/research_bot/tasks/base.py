@@ -2,9 +2,10 @@
 
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Type
 
 from crewai import Agent, Task
+from pydantic import BaseModel
 
 
 class TaskFactory(ABC):
@@ -49,6 +50,11 @@ class TaskFactory(ABC):
         """Optional output file path. Override to specify."""
         return None
 
+    @property
+    def output_pydantic(self) -> Optional[Type[BaseModel]]:
+        """Optional model the output is parsed into. Override to specify."""
+        return None
+
     def _format_description(self) -> str:
         """Format description with topic and date."""
         return self.description_template.format(
@@ -83,4 +89,7 @@ class TaskFactory(ABC):
         if self.output_file:
             task_kwargs["output_file"] = self.output_file
 
+        if self.output_pydantic is not None:
+            task_kwargs["output_pydantic"] = self.output_pydantic
+
         return Task(**task_kwargs)
@@ -1,5 +1,10 @@
-"""Planning task factory."""
+"""Planning task factories."""
 
+from typing import Optional, Type
+
+from pydantic import BaseModel
+
+from research_bot.models.plan import QueryPlan, SourceType
 from research_bot.tasks.base import TaskFactory
 
 
@@ -28,3 +33,53 @@ class PlanningTaskFactory(TaskFactory):
             "- Priority subtopics\n"
             "- Recommended source types"
         )
+
+
+class QueryPlanTaskFactory(PlanningTaskFactory):
+    """
+    Factory for planning tasks that return a structured ``QueryPlan``.
+
+    Used in plan-then-execute mode: the plan's searches are run in bulk
+    before the research agents start, instead of one agent step at a time.
+    """
+
+    def __init__(self, topic: str, max_queries: int = 8) -> None:
+        """
+        Initialize factory.
+
+        Args:
+            topic: The research topic.
+            max_queries: Maximum number of searches the plan may contain.
+        """
+        super().__init__(topic)
+        self._max_queries = max_queries
+
+    @property
+    def description_template(self) -> str:
+        source_types = ", ".join(source_type.value for source_type in SourceType)
+        return (
+            "Analyze this research topic and plan the web searches for it:\n\n"
+            "TOPIC: {topic}\n"
+            "TODAY'S DATE: {date}\n\n"
+            "1. List the 3-5 key questions that need to be answered.\n"
+            "2. List the priority subtopics to investigate.\n"
+            f"3. Write up to {self._max_queries} web search queries that together "
+            "cover the questions and subtopics. Make each query specific and "
+            "distinct; do not repeat the topic verbatim in every query.\n"
+            f"4. Give each query the type of source it should surface ({source_types}) "
+            "and the question it answers.\n\n"
+            "All queries are run at once before research starts, so the plan must "
+            "not depend on earlier results. Prefer the most recent information "
+            "available as of {date}."
+        )
+
+    @property
+    def expected_output(self) -> str:
+        return (
+            "A query plan with key research questions, priority subtopics and "
+            f"at most {self._max_queries} queries, each with a source type and purpose"
+        )
+
+    @property
+    def output_pydantic(self) -> Optional[Type[BaseModel]]:
+        return QueryPlan
@@ -1,5 +1,6 @@
 """Report writing task factory."""
 
+import os
 from typing import Optional
 
 from research_bot.tasks.base import TaskFactory
@@ -39,4 +40,9 @@ class ReportTaskFactory(TaskFactory):
 
     @property
     def output_file(self) -> Optional[str]:
+        # CrewAI strips the leading slash of an absolute path and would write
+        # a stray copy under the working directory; the research service
+        # writes absolute paths itself once the crew has finished
+        if os.path.isabs(self._output_file):
+            return None
         return self._output_file
@@ -1,6 +1,36 @@
 """Research tools module."""
 
-from research_bot.tools.tavily_search import TavilySearchTool
-from research_bot.tools.scrape_tool import ScrapeTool
+import importlib
+from typing import TYPE_CHECKING, Any, List
 
-__all__ = ["TavilySearchTool", "ScrapeTool"]
+if TYPE_CHECKING:
+    from research_bot.tools.expand_source import ExpandSourceTool
+    from research_bot.tools.scrape_tool import ScrapeTool
+    from research_bot.tools.single_flight import SingleFlight
+    from research_bot.tools.sources import SourceStore
+    from research_bot.tools.tavily_search import TavilySearchTool
+
+# Resolved on first access so helpers don't import CrewAI or Tavily
+_LAZY_EXPORTS = {
+    "TavilySearchTool": "research_bot.tools.tavily_search",
+    "ScrapeTool": "research_bot.tools.scrape_tool",
+    "ExpandSourceTool": "research_bot.tools.expand_source",
+    "SingleFlight": "research_bot.tools.single_flight",
+    "SourceStore": "research_bot.tools.sources",
+}
+
+__all__ = ["TavilySearchTool", "ScrapeTool", "ExpandSourceTool", "SingleFlight", "SourceStore"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import public names on first access (PEP 562)."""
+    module_path = _LAZY_EXPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
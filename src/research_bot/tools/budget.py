@@ -0,0 +1,68 @@
+"""Per-run tool call budget (the source budget of a pipeline profile)."""
+
+import threading
+from typing import Any
+
+from crewai.tools import BaseTool
+
+SOURCE_BUDGET_EXHAUSTED_MESSAGE = (
+    "Budget error: this run's source budget is used up. Do not call any more "
+    "tools; give your final answer now using the information you have."
+)
+
+
+class ToolCallBudget:
+    """Thread-safe count of the tool calls a run may still make."""
+
+    def __init__(self, max_calls: int) -> None:
+        """
+        Initialize budget.
+
+        Args:
+            max_calls: Tool calls allowed in the run.
+        """
+        self._remaining = max_calls
+        self._lock = threading.Lock()
+
+    @property
+    def remaining(self) -> int:
+        """Tool calls left."""
+        with self._lock:
+            return self._remaining
+
+    def take(self) -> bool:
+        """Claim one call; False once the budget is used up."""
+        with self._lock:
+            if self._remaining <= 0:
+                return False
+            self._remaining -= 1
+            return True
+
+
+class BudgetedTool(BaseTool):
+    """
+    Wraps a tool so a run's tools share one ``ToolCallBudget``.
+
+    Calls beyond the budget return ``SOURCE_BUDGET_EXHAUSTED_MESSAGE`` at
+    once, which tells the agent to answer with what it has.
+    """
+
+    name: str = "budgeted_tool"
+    description: str = "Enforces a call budget on a wrapped tool."
+
+    _inner: BaseTool
+    _budget: ToolCallBudget
+
+    def __init__(self, inner: BaseTool, budget: ToolCallBudget) -> None:
+        super().__init__(
+            name=inner.name,
+            description=inner.description,
+            args_schema=inner.args_schema,
+        )
+        self._inner = inner
+        self._budget = budget
+
+    def _run(self, **kwargs: Any) -> str:
+        if not self._budget.take():
+            return SOURCE_BUDGET_EXHAUSTED_MESSAGE
+        return self._inner._run(**kwargs)
@@ -0,0 +1,221 @@
+"""Per-provider circuit breakers for research tools."""
+
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+from typing import Callable, Deque, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class CircuitState(str, Enum):
+    """Enum for circuit breaker states."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a provider whose circuit is open."""
+
+
+@dataclass(frozen=True)
+class BreakerStats:
+    """Snapshot of a circuit breaker."""
+
+    name: str
+    state: CircuitState
+    failure_rate: float
+    window_calls: int
+    rejected: int
+    opened: int
+
+
+class CircuitBreaker:
+    """
+    Fails fast while a provider is unhealthy.
+
+    Closed: calls go through and their outcomes fill a rolling window; once
+    the window holds ``min_calls`` outcomes and the failure rate reaches
+    ``failure_rate``, the circuit opens. Open: calls are rejected at once
+    with ``CircuitOpenError`` for ``open_seconds``. Half-open: up to
+    ``half_open_probes`` calls probe the provider; a success closes the
+    circuit (with a fresh window), a failure opens it again.
+
+    One breaker is shared by every tool and run using the provider, so a
+    degraded provider costs one window of timeouts, not one per agent.
+    Thread-safe.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        window: int = 20,
+        min_calls: int = 5,
+        failure_rate: float = 0.5,
+        open_seconds: float = 30.0,
+        half_open_probes: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize breaker.
+
+        Args:
+            name: Provider name (for logs and stats).
+            window: Recent call outcomes the failure rate is computed over.
+            min_calls: Outcomes needed before the circuit may open.
+            failure_rate: Failure share that opens the circuit.
+            open_seconds: How long calls are rejected before probing.
+            half_open_probes: Concurrent probe calls while half-open.
+            clock: Monotonic time source.
+        """
+        self._name = name
+        self._outcomes: Deque[bool] = deque(maxlen=max(1, window))
+        self._min_calls = max(1, min_calls)
+        self._failure_rate = failure_rate
+        self._open_seconds = open_seconds
+        self._half_open_probes = max(1, half_open_probes)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._probes = 0
+        self._rejected = 0
+        self._opened = 0
+
+    @property
+    def name(self) -> str:
+        """Provider name."""
+        return self._name
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state (an open circuit past its timeout reads as half-open)."""
+        with self._lock:
+            if self._state == CircuitState.OPEN and self._open_expired():
+                return CircuitState.HALF_OPEN
+            return self._state
+
+    @property
+    def stats(self) -> BreakerStats:
+        """Current state and counters."""
+        state = self.state
+        with self._lock:
+            return BreakerStats(
+                name=self._name,
+                state=state,
+                failure_rate=self._current_failure_rate(),
+                window_calls=len(self._outcomes),
+                rejected=self._rejected,
+                opened=self._opened,
+            )
+
+    def call(
+        self, fn: Callable[[], T], is_failure: Callable[[Exception], bool] = lambda e: True
+    ) -> T:
+        """
+        Run ``fn`` through the breaker.
+
+        Args:
+            fn: The provider call.
+            is_failure: Whether an exception counts against the provider
+                (e.g. not for a 404 of the requested page).
+
+        Returns:
+            What ``fn`` returned.
+
+        Raises:
+            CircuitOpenError: If the circuit is open (``fn`` is not called).
+            Whatever ``fn`` raised.
+        """
+        probe = self._acquire()
+        success: Optional[bool] = None
+        try:
+            result = fn()
+            success = True
+            return result
+        except Exception as e:
+            success = not is_failure(e)
+            raise
+        finally:
+            if success is None:
+                # Interrupted (KeyboardInterrupt, SystemExit): says nothing
+                # about the provider, but the probe slot must be freed
+                self._release(probe)
+            else:
+                self._record(success, probe)
+
+    def _acquire(self) -> bool:
+        """Admit a call; returns whether it is a half-open probe."""
+        with self._lock:
+            if self._state == CircuitState.OPEN:
+                if not self._open_expired():
+                    self._rejected += 1
+                    raise CircuitOpenError(f"{self._name} circuit is open")
+                self._state = CircuitState.HALF_OPEN
+                self._probes = 0
+            if self._state == CircuitState.HALF_OPEN:
+                if self._probes >= self._half_open_probes:
+                    self._rejected += 1
+                    raise CircuitOpenError(f"{self._name} circuit is half-open, probe in flight")
+                self._probes += 1
+                return True
+            return False
+
+    def _release(self, probe: bool) -> None:
+        """Free a probe slot without recording an outcome."""
+        if probe:
+            with self._lock:
+                self._probes = max(0, self._probes - 1)
+
+    def _record(self, success: bool, probe: bool) -> None:
+        """Add a call outcome and move between states."""
+        transition: Optional[CircuitState] = None
+        with self._lock:
+            if probe:
+                self._probes -= 1
+                if self._state == CircuitState.HALF_OPEN:
+                    transition = CircuitState.CLOSED if success else CircuitState.OPEN
+            elif self._state == CircuitState.CLOSED:
+                self._outcomes.append(success)
+                if (
+                    len(self._outcomes) >= self._min_calls
+                    and self._current_failure_rate() >= self._failure_rate
+                ):
+                    transition = CircuitState.OPEN
+
+            if transition == CircuitState.OPEN:
+                self._state = CircuitState.OPEN
+                self._opened_at = self._clock()
+                self._opened += 1
+            elif transition == CircuitState.CLOSED:
+                self._state = CircuitState.CLOSED
+                self._outcomes.clear()
+            failure_rate = self._current_failure_rate()
+
+        if transition == CircuitState.OPEN:
+            logger.warning(
+                "Circuit opened",
+                extra={
+                    "provider": self._name,
+                    "failure_rate": round(failure_rate, 2),
+                    "open_seconds": self._open_seconds,
+                    "probe": probe,
+                },
+            )
+        elif transition == CircuitState.CLOSED:
+            logger.info("Circuit closed", extra={"provider": self._name})
+
+    def _open_expired(self) -> bool:
+        return self._clock() - self._opened_at >= self._open_seconds
+
+    def _current_failure_rate(self) -> float:
+        if not self._outcomes:
+            return 0.0
+        return self._outcomes.count(False) / len(self._outcomes)
@@ -0,0 +1,68 @@
+"""Tool that expands compact search result ids into full content."""
+
+import re
+from typing import Type
+
+from crewai.tools import BaseTool
+from pydantic import BaseModel, Field
+
+from research_bot.tools.sources import SourceStore
+
+# Agents often copy ids as listed, in brackets: "[S1], [S4]" or "[S1][S4]"
+_ID_SEPARATOR = re.compile(r"[\s,;\[\]]+")
+
+# Upper bound on text returned per source, keeps one expansion from
+# flooding the prompt
+MAX_EXPANDED_CHARS = 4000
+
+
+class ExpandSourceInput(BaseModel):
+    """Input schema for source expansion."""
+
+    source_ids: str = Field(
+        ...,
+        description="Comma-separated source ids from search results, e.g. 'S1, S4'",
+    )
+
+
+class ExpandSourceTool(BaseTool):
+    """Tool for reading the full text of search results by id."""
+
+    name: str = "expand_search_result"
+    description: str = (
+        "Get the full text of search results by their ids (e.g. 'S1, S4'). "
+        "Search results only show a title, URL and key sentence; use this to "
+        "read the complete snippet before relying on a source."
+    )
+    args_schema: Type[BaseModel] = ExpandSourceInput
+
+    _sources: SourceStore
+
+    def __init__(self, sources: SourceStore) -> None:
+        """
+        Initialize the tool.
+
+        Args:
+            sources: Run-local store the search tool writes to.
+        """
+        super().__init__()
+        self._sources = sources
+
+    def _run(self, source_ids: str) -> str:
+        """Return the stored content for each requested id."""
+        ids = [source_id for source_id in _ID_SEPARATOR.split(source_ids) if source_id]
+        if not ids:
+            return "Expand error: no source ids given."
+
+        blocks = []
+        for source_id in ids:
+            source = self._sources.get(source_id)
+            if source is None:
+                blocks.append(f"[{source_id}] Unknown source id.")
+                continue
+            blocks.append(
+                f"[{source.source_id}] {source.title}\n"
+                f"URL: {source.url}\n"
+                f"{source.content[:MAX_EXPANDED_CHARS] or 'No content available'}"
+            )
+        return "\n\n".join(blocks)
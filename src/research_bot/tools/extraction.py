@@ -0,0 +1,314 @@
+"""Page text extraction, clean-up and size budgets shared by the research tools."""
+
+import codecs
+import io
+import tempfile
+import threading
+import urllib.parse
+from contextlib import ExitStack
+from html.parser import HTMLParser
+from typing import BinaryIO, Iterable, List, Optional, Tuple
+
+# Characters of page text handed to an agent per page
+MAX_PAGE_CHARS = 10000
+
+# Bytes of a response body read at most, whatever the page size
+MAX_PAGE_BYTES = 2 * 1024 * 1024
+
+# Bytes read from the network per step when streaming a page
+READ_CHUNK_BYTES = 16 * 1024
+
+# A PDF can only be parsed whole (its page index is at the end), so it gets
+# a byte cap of its own; pages are extracted until the text budget is met
+MAX_PDF_BYTES = 20 * 1024 * 1024
+MAX_PDF_PAGES = 50
+
+# PDF bodies beyond this size are spooled to a temporary file
+_PDF_SPOOL_BYTES = 1024 * 1024
+_PDF_MAGIC = b"%PDF-"
+_PDF_CONTENT_TYPES = ("application/pdf", "application/x-pdf")
+
+# PDFium is not thread-safe; prefetches and agents extract concurrently
+_pdfium_lock = threading.Lock()
+
+# Elements whose content is never page text
+_SKIPPED_TAGS = frozenset({"head", "script", "style", "noscript", "template", "svg", "iframe"})
+
+# Elements that start a new line of text
+_BLOCK_TAGS = frozenset({
+    "address", "article", "aside", "blockquote", "br", "dd", "div", "dl", "dt",
+    "figcaption", "footer", "h1", "h2", "h3", "h4", "h5", "h6", "header", "hr",
+    "li", "main", "nav", "ol", "p", "pre", "section", "table", "td", "th", "tr", "ul",
+})
+
+
+def clean_text(text: str, max_chars: int = MAX_PAGE_CHARS) -> str:
+    """
+    Normalize extracted page text and cut it to ``max_chars``.
+
+    Collapses runs of spaces and blank lines (common in text extracted from
+    HTML) so the budget is spent on content, and cuts at a word boundary.
+
+    Args:
+        text: Extracted page text.
+        max_chars: Maximum length of the result.
+
+    Returns:
+        The cleaned text.
+    """
+    # Clean a bounded prefix: whitespace collapse only shortens the text
+    lines: List[str] = []
+    blank = False
+    for line in text[: max_chars * 2].splitlines():
+        line = " ".join(line.split())
+        if line:
+            lines.append(line)
+            blank = False
+        elif lines and not blank:
+            lines.append("")
+            blank = True
+    text = "\n".join(lines).strip()
+    if len(text) <= max_chars:
+        return text
+    cut = text.rfind(" ", 0, max_chars)
+    return text[: cut if cut > max_chars // 2 else max_chars].rstrip()
+
+
+class _TextCollector(HTMLParser):
+    """Incremental HTML-to-text parser that keeps only visible text."""
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.parts: List[str] = []
+        self.text_chars = 0
+        self._skip_depth = 0
+
+    def handle_starttag(self, tag: str, attrs: List) -> None:
+        if tag in _SKIPPED_TAGS:
+            self._skip_depth += 1
+        elif tag in _BLOCK_TAGS and not self._skip_depth:
+            self.parts.append("\n")
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in _SKIPPED_TAGS:
+            self._skip_depth = max(0, self._skip_depth - 1)
+        elif tag in _BLOCK_TAGS and not self._skip_depth:
+            self.parts.append("\n")
+
+    def handle_data(self, data: str) -> None:
+        if not self._skip_depth and not data.isspace():
+            self.parts.append(data)
+            self.text_chars += len(data)
+
+
+def extract_text(
+    chunks: Iterable[bytes],
+    encoding: Optional[str] = None,
+    html: bool = True,
+    max_chars: int = MAX_PAGE_CHARS,
+    max_bytes: int = MAX_PAGE_BYTES,
+) -> str:
+    """
+    Extract page text from a stream of body chunks with bounded memory.
+
+    Chunks are decoded incrementally and, for HTML, parsed as they arrive;
+    reading stops as soon as enough text is gathered or ``max_bytes`` were
+    consumed, so the size of the page does not matter.
+
+    Args:
+        chunks: Response body chunks (e.g. ``response.iter_content``).
+        encoding: Body encoding (default: UTF-8); undecodable bytes are replaced.
+        html: Whether to extract visible text from HTML markup.
+        max_chars: Characters of text to return at most.
+        max_bytes: Bytes to read at most.
+
+    Returns:
+        Cleaned page text, at most ``max_chars`` long.
+    """
+    try:
+        decoder = codecs.getincrementaldecoder(encoding or "utf-8")(errors="replace")
+    except LookupError:
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+    collector = _TextCollector() if html else None
+    parts: List[str] = []
+    text_chars = 0
+    # Raw text still holds whitespace that clean-up removes, so gather extra
+    wanted = max_chars * 2 if collector is None else max_chars
+
+    read = 0
+    for chunk in chunks:
+        chunk = chunk[: max_bytes - read]
+        read += len(chunk)
+        text = decoder.decode(chunk, final=read >= max_bytes)
+        if collector is not None:
+            collector.feed(text)
+            text_chars = collector.text_chars
+        else:
+            parts.append(text)
+            text_chars += len(text)
+        if text_chars >= wanted or read >= max_bytes:
+            break
+
+    if collector is not None:
+        collector.close()
+        parts = collector.parts
+    return clean_text("".join(parts), max_chars)
+
+
+class DocumentError(Exception):
+    """A document could not be extracted (no parser, too large or corrupt)."""
+
+
+def is_pdf_url(url: str) -> bool:
+    """Whether a URL's path names a PDF file."""
+    return urllib.parse.urlparse(url).path.lower().endswith(".pdf")
+
+
+def is_pdf(content_type: str, head: bytes) -> bool:
+    """
+    Whether a response body is a PDF document.
+
+    Args:
+        content_type: The response's Content-Type header.
+        head: The first bytes of the body (proxies often send PDFs as
+            ``application/octet-stream``).
+    """
+    media_type = content_type.split(";")[0].strip().lower()
+    return media_type in _PDF_CONTENT_TYPES or head.lstrip().startswith(_PDF_MAGIC)
+
+
+def extract_pdf_text(
+    chunks: Iterable[bytes],
+    max_chars: int = MAX_PAGE_CHARS,
+    max_bytes: int = MAX_PDF_BYTES,
+    max_pages: int = MAX_PDF_PAGES,
+) -> str:
+    """
+    Extract the text of a PDF page by page, up to a character budget.
+
+    The body is spooled to a temporary file once it outgrows a small
+    in-memory buffer, and PDFium reads pages from it on demand; pages are
+    extracted in order until ``max_chars`` of text are gathered, so only
+    the first pages of a long report are ever parsed. Needs pypdfium2
+    (``pip install 'research-bot[pdf]'``).
+
+    Args:
+        chunks: Response body chunks (e.g. ``response.iter_content``).
+        max_chars: Characters of text to return at most.
+        max_bytes: Bytes of PDF to read at most.
+        max_pages: Pages to extract at most.
+
+    Returns:
+        Cleaned text with a ``[Page N]`` line before each page, and a note
+        of the page count if pages were left out.
+
+    Raises:
+        DocumentError: If pypdfium2 is missing, the PDF exceeds
+            ``max_bytes`` or it cannot be parsed.
+    """
+    try:
+        import pypdfium2 as pdfium
+    except ImportError as e:
+        raise DocumentError("reading PDFs needs pypdfium2: pip install 'research-bot[pdf]'") from e
+
+    with ExitStack() as stack:
+        spool: BinaryIO = io.BytesIO()
+        read = 0
+        for chunk in chunks:
+            read += len(chunk)
+            if read > max_bytes:
+                raise DocumentError(f"PDF larger than {max_bytes / (1024 * 1024):.1f} MB; not read")
+            if read > _PDF_SPOOL_BYTES and isinstance(spool, io.BytesIO):
+                spooled = stack.enter_context(tempfile.TemporaryFile())
+                spooled.write(spool.getbuffer())
+                spool = spooled
+            spool.write(chunk)
+        spool.seek(0)
+
+        # (page number, text) of the pages extracted
+        pages: List[Tuple[int, str]] = []
+        text_chars = 0
+        with _pdfium_lock:
+            try:
+                document = pdfium.PdfDocument(spool)
+            except pdfium.PdfiumError as e:
+                raise DocumentError(f"unreadable PDF ({e})") from e
+            try:
+                page_count = len(document)
+                for index in range(min(page_count, max_pages)):
+                    page = document[index]
+                    try:
+                        text_page = page.get_textpage()
+                        try:
+                            text = text_page.get_text_range()
+                        finally:
+                            text_page.close()
+                    finally:
+                        page.close()
+                    text = clean_text(text, max_chars)
+                    if text:
+                        pages.append((index + 1, f"[Page {index + 1}]\n{text}"))
+                        text_chars += len(text)
+                    if text_chars >= max_chars:
+                        break
+            except pdfium.PdfiumError as e:
+                raise DocumentError(f"unreadable PDF ({e})") from e
+            finally:
+                document.close()
+
+    text = clean_text("\n\n".join(part for _, part in pages), max_chars)
+    # The last page whose text made it into the budget
+    shown, offset = 0, 0
+    for number, part in pages:
+        if offset >= len(text):
+            break
+        shown = number
+        offset += len(part) + 2
+    if text and shown < page_count:
+        text += f"\n\n[PDF: text of pages 1-{shown} of {page_count}]"
+    return text
+
+
+def chunk_text(text: str, max_chars: int) -> List[str]:
+    """
+    Split text into chunks of at most ``max_chars``, at paragraph boundaries.
+
+    Paragraphs longer than ``max_chars`` are split at word boundaries. A
+    module-level function without CrewAI imports, so it can run in a
+    process pool.
+
+    Args:
+        text: Text to split.
+        max_chars: Maximum chunk length.
+
+    Returns:
+        Chunks in order; empty for blank text.
+    """
+    chunks: List[str] = []
+    current: List[str] = []
+    length = 0
+
+    def flush() -> None:
+        nonlocal length
+        if current:
+            chunks.append("\n\n".join(current))
+            current.clear()
+            length = 0
+
+    for paragraph in text.split("\n\n"):
+        paragraph = paragraph.strip()
+        if not paragraph:
+            continue
+        while len(paragraph) > max_chars:
+            flush()
+            cut = paragraph.rfind(" ", 0, max_chars)
+            cut = cut if cut > max_chars // 2 else max_chars
+            chunks.append(paragraph[:cut].rstrip())
+            paragraph = paragraph[cut:].lstrip()
+        if length + len(paragraph) + 2 > max_chars:
+            flush()
+        current.append(paragraph)
+        length += len(paragraph) + 2
+    flush()
+    return chunks
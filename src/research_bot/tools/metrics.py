@@ -0,0 +1,215 @@
+"""Per-run tool call metrics."""
+
+import re
+import threading
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from crewai.tools import BaseTool
+
+from research_bot.models.run import ToolUsage
+
+# Tools report failures as "<Kind> error: ..." strings instead of raising
+_ERROR_RESULT = re.compile(r"^[A-Z][\w ]* error: ")
+_URL = re.compile(r"https?://[^\s<>\"')\]]+")
+# Source URLs listed in tool results ("URL: ..." lines or "<...>"), as
+# opposed to links inside extracted page content
+_LISTED_URL = re.compile(r"(?:^\s*URL: |<)(https?://[^\s<>]+)", re.MULTILINE)
+
+
+@dataclass
+class _ToolCounters:
+    """Mutable counters for one tool."""
+
+    calls: int = 0
+    errors: int = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    fallbacks: int = 0
+    total_seconds: float = 0.0
+
+
+# Counters of the tool call running in the current context, if metered
+_current_call: ContextVar[Optional[_ToolCounters]] = ContextVar(
+    "research_bot_tool_call", default=None
+)
+# Metered tool each thread is running, for the sampling profiler
+_running_tools: Dict[int, str] = {}
+
+
+def is_error_result(result: str) -> bool:
+    """Whether a tool result reports a failure ("<Kind> error: ...")."""
+    return _ERROR_RESULT.match(result) is not None
+
+
+def running_tools() -> Dict[int, str]:
+    """Name of the metered tool each thread is running, by thread id."""
+    return dict(_running_tools)
+
+
+def record_cache_lookup(hit: bool) -> None:
+    """
+    Count a cache lookup against the metered tool call in progress.
+
+    Tools call this wherever they consult a result cache; outside a
+    ``MeteredTool`` call it does nothing.
+    """
+    counters = _current_call.get()
+    if counters is None:
+        return
+    if hit:
+        counters.cache_hits += 1
+    else:
+        counters.cache_misses += 1
+
+
+def record_fallback() -> None:
+    """
+    Count a fallback answer against the metered tool call in progress.
+
+    Tools call this when a stale cache entry or a direct fetch stands in for
+    a failing provider; outside a ``MeteredTool`` call it does nothing.
+    """
+    counters = _current_call.get()
+    if counters is not None:
+        counters.fallbacks += 1
+
+
+class ToolMetrics:
+    """
+    Collects tool usage for one research run.
+
+    Counts calls, errors, cache lookups, fallbacks and time per tool, and
+    remembers every URL that appeared in tool arguments or results.
+    Thread-safe.
+    """
+
+    def __init__(self, keep_results: bool = False) -> None:
+        """
+        Initialize metrics.
+
+        Args:
+            keep_results: Also keep the text of successful tool calls
+                (for stages that post-process the run's fetched corpus).
+        """
+        self._tools: Dict[str, _ToolCounters] = {}
+        self._sources: Dict[str, None] = {}
+        self._keep_results = keep_results
+        self._results: Dict[Tuple[str, str], str] = {}
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        tool: str,
+        call: _ToolCounters,
+        arguments: Dict[str, Any],
+        result: str,
+    ) -> None:
+        """
+        Add one finished tool call.
+
+        Args:
+            tool: Tool name.
+            call: Counters of this call.
+            arguments: Arguments the tool was called with.
+            result: Text the tool returned.
+        """
+        urls = [url for value in arguments.values() for url in _URL.findall(str(value))]
+        urls.extend(_LISTED_URL.findall(result))
+        with self._lock:
+            counters = self._tools.setdefault(tool, _ToolCounters())
+            counters.calls += call.calls
+            counters.errors += call.errors
+            counters.cache_hits += call.cache_hits
+            counters.cache_misses += call.cache_misses
+            counters.fallbacks += call.fallbacks
+            counters.total_seconds += call.total_seconds
+            for url in urls:
+                self._sources.setdefault(url.rstrip(".,;:"), None)
+            if self._keep_results and not is_error_result(result):
+                described = ", ".join(
+                    f"{name}={value}" for name, value in sorted(arguments.items())
+                )
+                key = (tool, described)
+                self._results.setdefault(key, result)
+
+    def usage(self) -> List[ToolUsage]:
+        """Return per-tool usage, ordered by first call."""
+        with self._lock:
+            return [
+                ToolUsage(
+                    tool=name,
+                    calls=counters.calls,
+                    errors=counters.errors,
+                    cache_hits=counters.cache_hits,
+                    cache_misses=counters.cache_misses,
+                    fallbacks=counters.fallbacks,
+                    total_seconds=counters.total_seconds,
+                )
+                for name, counters in self._tools.items()
+            ]
+
+    def results(self) -> List[Tuple[str, str, str]]:
+        """
+        Return ``(tool, arguments, result)`` of distinct successful calls.
+
+        Empty unless created with ``keep_results``; repeated calls with the
+        same arguments are kept once.
+        """
+        with self._lock:
+            return [
+                (tool, arguments, result) for (tool, arguments), result in self._results.items()
+            ]
+
+    def sources(self) -> List[str]:
+        """Return URLs seen in tool calls, in first-seen order."""
+        with self._lock:
+            return list(self._sources)
+
+
+class MeteredTool(BaseTool):
+    """Wraps a tool and records each call in a ``ToolMetrics``."""
+
+    name: str = "metered_tool"
+    description: str = "Records usage of a wrapped tool."
+
+    _inner: BaseTool
+    _metrics: ToolMetrics
+
+    def __init__(self, inner: BaseTool, metrics: ToolMetrics) -> None:
+        super().__init__(
+            name=inner.name,
+            description=inner.description,
+            args_schema=inner.args_schema,
+        )
+        self._inner = inner
+        self._metrics = metrics
+
+    def _run(self, **kwargs: Any) -> str:
+        # Cache lookups are tallied on this call's counters, then merged
+        call = _ToolCounters(calls=1)
+        token = _current_call.set(call)
+        thread = threading.get_ident()
+        outer = _running_tools.get(thread)
+        _running_tools[thread] = self.name
+        started = time.perf_counter()
+        result = ""
+        try:
+            result = self._inner._run(**kwargs)
+            return result
+        except Exception:
+            call.errors += 1
+            raise
+        finally:
+            _current_call.reset(token)
+            if outer is None:
+                _running_tools.pop(thread, None)
+            else:
+                _running_tools[thread] = outer
+            call.total_seconds = time.perf_counter() - started
+            result = result if isinstance(result, str) else str(result)
+            if is_error_result(result):
+                call.errors += 1
+            self._metrics.record(self.name, call, kwargs, result)
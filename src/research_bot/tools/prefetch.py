@@ -0,0 +1,281 @@
+"""Speculative page prefetching for search results."""
+
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Set, Tuple
+
+from research_bot.models.run import PrefetchUsage
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _Prefetch:
+    """State of one speculative fetch."""
+
+    future: "Future[None]"
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    failed: bool = False
+
+
+class PrefetchSession:
+    """
+    Tracks the speculative fetches of one research run.
+
+    Caps how many pages the run may prefetch, remembers which prefetched
+    pages the agents actually requested and, when closed, cancels fetches
+    that have not started yet. Thread-safe.
+    """
+
+    def __init__(
+        self, max_prefetches: int = 10, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        """
+        Initialize session.
+
+        Args:
+            max_prefetches: Most pages the run may prefetch; bounds wasted
+                fetches when agents ignore the top results.
+            clock: Monotonic time source.
+        """
+        self._max_prefetches = max_prefetches
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._prefetches: Dict[str, _Prefetch] = {}
+        self._requested: Set[str] = set()
+        self._used: Set[str] = set()
+        self._saved_seconds = 0.0
+        self._closed = False
+
+    def start(self, url: str, submit: Callable[[], "Future[None]"]) -> bool:
+        """
+        Schedule a prefetch of ``url`` unless it was seen before or the cap is hit.
+
+        Args:
+            url: Page to prefetch.
+            submit: Starts the fetch and returns its future.
+
+        Returns:
+            Whether a prefetch was scheduled.
+        """
+        with self._lock:
+            if (
+                self._closed
+                or url in self._prefetches
+                or url in self._requested
+                or len(self._prefetches) >= self._max_prefetches
+            ):
+                return False
+            # Submitted under the lock so the job cannot report back before
+            # it is registered
+            self._prefetches[url] = _Prefetch(future=submit())
+            return True
+
+    def began(self, url: str) -> None:
+        """Record that the prefetch of ``url`` left the queue."""
+        with self._lock:
+            prefetch = self._prefetches.get(url)
+            if prefetch is not None:
+                prefetch.started_at = self._clock()
+
+    def finished(self, url: str, failed: bool) -> None:
+        """Record that the prefetch of ``url`` completed."""
+        with self._lock:
+            prefetch = self._prefetches.get(url)
+            if prefetch is not None:
+                prefetch.finished_at = self._clock()
+                prefetch.failed = failed
+
+    def claim(self, url: str) -> None:
+        """Record that an agent requested ``url``; credits a prefetch if one ran."""
+        with self._lock:
+            self._requested.add(url)
+            prefetch = self._prefetches.get(url)
+            if prefetch is None or prefetch.failed or url in self._used:
+                return
+            # Still queued: the agent's own fetch is as fast, so drop it
+            if prefetch.future.cancel() or prefetch.started_at is None:
+                return
+            self._used.add(url)
+            # Time the agent did not have to wait: the whole fetch if it had
+            # finished, otherwise the part that ran ahead of the request
+            finished_at = prefetch.finished_at
+            if finished_at is None:
+                finished_at = self._clock()
+            self._saved_seconds += finished_at - prefetch.started_at
+
+    def close(self) -> PrefetchUsage:
+        """Cancel pending prefetches and return the run's totals."""
+        with self._lock:
+            self._closed = True
+            prefetches = list(self._prefetches.items())
+        cancelled = sum(1 for _, prefetch in prefetches if prefetch.future.cancel())
+
+        with self._lock:
+            issued = len(prefetches) - cancelled
+            failed = sum(1 for _, prefetch in prefetches if prefetch.failed)
+            used = len(self._used)
+            usage = PrefetchUsage(
+                issued=issued,
+                used=used,
+                wasted=max(0, issued - used - failed),
+                failed=failed,
+                cancelled=cancelled,
+                saved_seconds=self._saved_seconds,
+            )
+        if usage.issued:
+            logger.info("Prefetch summary", extra=usage.model_dump())
+        return usage
+
+
+# Prefetch session of the run executing in the current context
+_current_session: ContextVar[Optional[PrefetchSession]] = ContextVar(
+    "research_bot_prefetch_session", default=None
+)
+
+
+@contextmanager
+def prefetch_session(session: PrefetchSession) -> Iterator[PrefetchSession]:
+    """Make ``session`` the current run's prefetch session while the block runs."""
+    token = _current_session.set(session)
+    try:
+        yield session
+    finally:
+        _current_session.reset(token)
+
+
+def record_page_request(url: str) -> None:
+    """
+    Tell the current run's prefetch session that an agent requested a page.
+
+    Page tools call this for every requested URL; outside a prefetch
+    session it does nothing.
+    """
+    session = _current_session.get()
+    if session is not None:
+        session.claim(url.strip())
+
+
+class Prefetcher:
+    """
+    Fetches the top search hits in the background while the agent thinks.
+
+    Owned by a tool provider and shared across runs: ``fetch`` is expected to
+    store pages in the shared page cache (and coalesce with identical
+    in-flight requests), so the agent's later extraction calls become cache
+    hits. Prefetches only happen inside a ``prefetch_session``, which bounds
+    and accounts for them per run.
+
+    Fetches run on daemon threads: a prefetch still in flight when the
+    process exits is abandoned instead of holding up the exit for as long
+    as the page takes (a ``ThreadPoolExecutor`` joins its threads at exit).
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[str], object],
+        is_cached: Callable[[str], bool],
+        top_n: int = 3,
+        max_workers: int = 4,
+    ) -> None:
+        """
+        Initialize prefetcher.
+
+        Args:
+            fetch: Fetches a URL into the page cache.
+            is_cached: Whether a URL's page is already cached.
+            top_n: Results per search to prefetch.
+            max_workers: Concurrent background fetches across all runs.
+        """
+        self._fetch = fetch
+        self._is_cached = is_cached
+        self._top_n = top_n
+        self._max_workers = max_workers
+        self._jobs: "queue.SimpleQueue[Optional[Tuple[Future[None], PrefetchSession, str]]]" = (
+            queue.SimpleQueue()
+        )
+        self._workers: List[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def schedule(self, urls: Sequence[str]) -> int:
+        """
+        Start fetching the first ``top_n`` uncached URLs.
+
+        Returns:
+            Number of prefetches started.
+        """
+        session = _current_session.get()
+        if session is None:
+            return 0
+
+        started = 0
+        for url in (url.strip() for url in urls[: self._top_n]):
+            if not url or self._is_cached(url):
+                continue
+            if session.start(url, lambda url=url: self._submit(session, url)):
+                started += 1
+        return started
+
+    def shutdown(self) -> None:
+        """Drop queued prefetches and stop the worker threads, without waiting."""
+        with self._lock:
+            self._closed = True
+            workers = len(self._workers)
+        while True:
+            try:
+                job = self._jobs.get_nowait()
+            except queue.Empty:
+                break
+            if job is not None:
+                job[0].cancel()
+        for _ in range(workers):
+            self._jobs.put(None)
+
+    def _submit(self, session: PrefetchSession, url: str) -> "Future[None]":
+        """Queue a prefetch, starting another worker thread if all are busy."""
+        future: "Future[None]" = Future()
+        with self._lock:
+            if self._closed:
+                future.cancel()
+                return future
+            self._jobs.put((future, session, url))
+            if len(self._workers) < self._max_workers:
+                worker = threading.Thread(
+                    target=self._work,
+                    name=f"prefetch_{len(self._workers)}",
+                    daemon=True,
+                )
+                self._workers.append(worker)
+                worker.start()
+        return future
+
+    def _work(self) -> None:
+        """Worker thread: run queued prefetches until shut down."""
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+            future, session, url = job
+            if not future.set_running_or_notify_cancel():
+                continue  # cancelled while queued
+            self._run(session, url)
+            future.set_result(None)
+
+    def _run(self, session: PrefetchSession, url: str) -> None:
+        """Executor job: fetch one page, never raising."""
+        session.began(url)
+        try:
+            self._fetch(url)
+        except Exception as e:
+            logger.debug("Prefetch failed", extra={"url": url, "error": str(e)})
+            session.finished(url, failed=True)
+        else:
+            session.finished(url, failed=False)
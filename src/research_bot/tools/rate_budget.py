@@ -0,0 +1,69 @@
+"""Per-provider request rate budgets."""
+
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque
+
+# Budgets are counted over a sliding minute
+_WINDOW_SECONDS = 60.0
+
+
+class RateBudget:
+    """
+    Counts a provider's requests against its allowance per minute.
+
+    Tools record every request that reaches the provider (cache hits and
+    fallbacks don't count). The budget never blocks a call; it reports
+    ``headroom``, the share of the allowance left in the last minute, so
+    the job scheduler can hold back less urgent jobs before the provider
+    starts rejecting requests. Shared by every tool and run in a process.
+    Thread-safe.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        calls_per_minute: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize budget.
+
+        Args:
+            name: Provider name.
+            calls_per_minute: Requests the provider allows per minute.
+            clock: Monotonic time source.
+        """
+        if calls_per_minute <= 0:
+            raise ValueError("calls_per_minute must be positive")
+        self._name = name
+        self._calls_per_minute = calls_per_minute
+        self._clock = clock
+        self._calls: Deque[float] = deque()
+        self._lock = threading.Lock()
+
+    @property
+    def name(self) -> str:
+        """Provider name."""
+        return self._name
+
+    def record(self) -> None:
+        """Count one request to the provider."""
+        with self._lock:
+            self._calls.append(self._clock())
+
+    def used(self) -> int:
+        """Requests made in the last minute."""
+        with self._lock:
+            self._expire()
+            return len(self._calls)
+
+    def headroom(self) -> float:
+        """Share of the per-minute allowance left (0.0 once it is used up)."""
+        return max(0.0, 1.0 - self.used() / self._calls_per_minute)
+
+    def _expire(self) -> None:
+        cutoff = self._clock() - _WINDOW_SECONDS
+        while self._calls and self._calls[0] <= cutoff:
+            self._calls.popleft()
@@ -1,13 +1,51 @@
 """Web page extraction tool using scrape.do API."""
 
+import itertools
+import time
 import urllib.parse
-from typing import Type
+from typing import Any, Optional, Type
 
 import requests
 from crewai.tools import BaseTool
 from pydantic import BaseModel, Field
 
 from research_bot.config.settings import Settings
+from research_bot.tools.cache import ResultCache
+from research_bot.tools.circuit_breaker import CircuitBreaker, CircuitOpenError
+from research_bot.tools.extraction import (
+    MAX_PAGE_CHARS,
+    READ_CHUNK_BYTES,
+    DocumentError,
+    extract_pdf_text,
+    extract_text,
+    is_pdf,
+    is_pdf_url,
+)
+from research_bot.tools.metrics import record_cache_lookup, record_fallback
+from research_bot.tools.prefetch import record_page_request
+from research_bot.tools.rate_budget import RateBudget
+from research_bot.tools.single_flight import SingleFlight
+from research_bot.tools.url_health import UrlHealth, UrlRejectedError, describe_failure
+
+# Shared across tool instances so concurrent crews coalesce identical fetches
+_inflight_fetches: SingleFlight[str] = SingleFlight()
+
+# Pages with less text than this (consent walls, paywalls, blank shells)
+# count as failed fetches in the URL health statistics
+MIN_PAGE_TEXT_CHARS = 50
+
+# User agent of direct page fetches (the fallback while scrape.do fails)
+DIRECT_FETCH_USER_AGENT = "Mozilla/5.0 (compatible; research-bot/1.0)"
+
+
+def _is_provider_failure(error: Exception) -> bool:
+    """Whether a scrape.do error counts against the service (not the requested page)."""
+    if isinstance(error, DocumentError):
+        return False
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        status = error.response.status_code
+        return status >= 500 or status == 429
+    return True
 
 
 class ScrapeInput(BaseModel):
@@ -29,24 +67,205 @@ class ScrapeTool(BaseTool):
 
     _api_key: str
     _base_url: str = "https://api.scrape.do/"
+    _session: requests.Session
+    _cache: Optional[ResultCache[str]]
+    _max_bytes: int
+    _max_pdf_bytes: int
+    _max_pdf_pages: int
+    _breaker: Optional[CircuitBreaker]
+    _direct_fallback: bool
+    _health: Optional[UrlHealth]
+    _rate_budget: Optional[RateBudget]
+
+    def __init__(
+        self,
+        settings: Settings,
+        session: Optional[requests.Session] = None,
+        cache: Optional[ResultCache[str]] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        direct_fallback: bool = False,
+        health: Optional[UrlHealth] = None,
+        rate_budget: Optional[RateBudget] = None,
+    ) -> None:
+        """
+        Initialize the extraction tool.
 
-    def __init__(self, settings: Settings) -> None:
+        Args:
+            settings: Application settings.
+            session: Optional shared HTTP session (keeps connections pooled).
+            cache: Optional page content cache shared across runs.
+            breaker: Optional circuit breaker shared by all users of
+                scrape.do. While it is open, fetches fail fast.
+            direct_fallback: When scrape.do fails (or its circuit is open),
+                fetch the page directly, without JavaScript rendering.
+            health: Optional URL health shared across runs. URLs it knows
+                to fail are rejected without a fetch, and every fetch's
+                outcome and latency is recorded in it.
+            rate_budget: Optional scrape.do request budget; every API
+                request (not direct fetches) is counted against it.
+        """
         super().__init__()
         self._api_key = settings.scrape_do_api_key
+        self._session = session or requests.Session()
+        self._cache = cache
+        self._max_bytes = settings.scrape_max_bytes
+        self._max_pdf_bytes = settings.scrape_max_pdf_bytes
+        self._max_pdf_pages = settings.pdf_max_pages
+        self._breaker = breaker
+        self._direct_fallback = direct_fallback
+        self._health = health
+        self._rate_budget = rate_budget
 
-    def _run(self, url: str, render: bool = True) -> str:
-        """Extract content from URL using scrape.do API."""
+    def _fetch(self, url: str, render: bool) -> str:
+        """Fetch page content via scrape.do, through the circuit breaker."""
+        encoded_url = urllib.parse.quote_plus(url)
+        # A headless browser adds nothing to a PDF but latency
+        render_page = render and not is_pdf_url(url)
+        api_url = (
+            f"{self._base_url}?token={self._api_key}"
+            f"&url={encoded_url}&render={str(render_page).lower()}"
+        )
+
+        def request() -> str:
+            if self._rate_budget is not None:
+                self._rate_budget.record()
+            return self._read(api_url, timeout=30)
+
+        if self._breaker is not None:
+            content = self._breaker.call(request, is_failure=_is_provider_failure)
+        else:
+            content = request()
+
+        if self._cache is not None:
+            self._cache.set((url.strip(), render), content)
+        return content
+
+    def _fetch_direct(self, url: str) -> str:
+        """Fetch the page itself, without scrape.do (no JavaScript rendering)."""
+        content = self._read(url, timeout=15, headers={"User-Agent": DIRECT_FETCH_USER_AGENT})
+        if self._cache is not None:
+            self._cache.set((url.strip(), False), content)
+        return content
+
+    def _read(self, request_url: str, timeout: float, **kwargs: Any) -> str:
+        """
+        GET a page or PDF document and extract its text.
+
+        Raises:
+            requests.RequestException: If the request fails.
+            DocumentError: If a PDF cannot be read.
+        """
+        # Streamed so that only a bounded prefix of large pages is ever held
+        response = self._session.get(request_url, timeout=timeout, stream=True, **kwargs)
         try:
-            encoded_url = urllib.parse.quote_plus(url)
-            api_url = (
-                f"{self._base_url}?token={self._api_key}"
-                f"&url={encoded_url}&render={str(render).lower()}"
+            response.raise_for_status()
+            content_type = response.headers.get("Content-Type", "")
+            chunks = response.iter_content(chunk_size=READ_CHUNK_BYTES)
+            head = next(chunks, b"")
+            body = itertools.chain((head,), chunks)
+            if is_pdf(content_type, head):
+                length = response.headers.get("Content-Length", "")
+                if length.isdigit() and int(length) > self._max_pdf_bytes:
+                    raise DocumentError(
+                        f"PDF larger than {self._max_pdf_bytes / (1024 * 1024):.1f} MB; not read"
+                    )
+                return extract_pdf_text(
+                    body,
+                    max_chars=MAX_PAGE_CHARS,
+                    max_bytes=self._max_pdf_bytes,
+                    max_pages=self._max_pdf_pages,
+                )
+            content = extract_text(
+                body,
+                # requests assumes ISO-8859-1 for text/* without a charset;
+                # pages without one are far more often UTF-8
+                encoding=response.encoding if "charset=" in content_type.lower() else None,
+                html="html" in content_type.lower() or not content_type,
+                max_chars=MAX_PAGE_CHARS,
+                max_bytes=self._max_bytes,
             )
+        finally:
+            response.close()
+        return content
 
-            response = requests.get(api_url, timeout=30)
-            response.raise_for_status()
+    def get_content(self, url: str, render: bool = True) -> str:
+        """
+        Return page content from the cache or a (coalesced) fetch.
+
+        If scrape.do fails, an expired cached copy of the page is returned,
+        or else (with ``direct_fallback``) the page is fetched directly.
+
+        Raises:
+            UrlRejectedError: If URL health knows the URL to fail.
+            requests.RequestException: If the fetch and its fallbacks fail.
+            CircuitOpenError: If the circuit is open and no fallback applies.
+            DocumentError: If the URL is a PDF that cannot be read.
+        """
+        key = (url.strip(), render)
+        if self._cache is not None:
+            cached = self._cache.get(key)
+            record_cache_lookup(cached is not None)
+            if cached is not None:
+                return cached
+        if self._health is None:
+            return self._fetch_with_fallback(url, render)
+
+        failure = self._health.rejection(url)
+        if failure is not None:
+            raise UrlRejectedError(failure)
+        started = time.perf_counter()
+        try:
+            content = self._fetch_with_fallback(url, render)
+        except requests.RequestException as e:
+            reason, ttl_seconds = describe_failure(e)
+            self._health.record_failure(url, reason, time.perf_counter() - started, ttl_seconds)
+            raise
+        if len(content.strip()) < MIN_PAGE_TEXT_CHARS:
+            self._health.record_failure(
+                url, "no readable text (paywall or script-only page)", time.perf_counter() - started
+            )
+        else:
+            self._health.record_success(url, time.perf_counter() - started)
+        return content
 
-            content = response.text[:10000]
+    def _fetch_with_fallback(self, url: str, render: bool) -> str:
+        """Fetch a page (coalesced), falling back if scrape.do fails."""
+        key = (url.strip(), render)
+        try:
+            return _inflight_fetches.do(key, lambda: self._fetch(url, render))
+        except (requests.RequestException, CircuitOpenError) as e:
+            if not isinstance(e, CircuitOpenError) and not _is_provider_failure(e):
+                raise  # the page itself failed (e.g. 404); no fallback can help
+            return self._fallback(url, render, e)
+
+    def _fallback(self, url: str, render: bool, error: Exception) -> str:
+        """Serve a page scrape.do could not: stale cache first, then a direct fetch."""
+        if self._cache is not None:
+            for key in ((url.strip(), render), (url.strip(), not render)):
+                stale = self._cache.get_stale(key)
+                if stale is not None:
+                    record_fallback()
+                    return stale
+        if not self._direct_fallback:
+            raise error
+        content = _inflight_fetches.do((url.strip(), "direct"), lambda: self._fetch_direct(url))
+        record_fallback()
+        return content
+
+    def _run(self, url: str, render: bool = True) -> str:
+        """Extract content from URL using scrape.do API."""
+        record_page_request(url)
+        try:
+            content = self.get_content(url, render)
             return f"Content from {url}:\n\n{content}"
+        except UrlRejectedError as e:
+            return (
+                f"Extraction error: {url} is known to fail ({e.failure.reason}); "
+                "skipped. Use a different source."
+            )
+        except CircuitOpenError:
+            return "Extraction error: the page extraction service is failing; try again later."
+        except DocumentError as e:
+            return f"Extraction error: {url}: {e}"
         except requests.RequestException as e:
             return f"Extraction error: {e}"
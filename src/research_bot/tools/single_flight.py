@@ -0,0 +1,63 @@
+"""In-flight request coalescing for research tools."""
+
+import threading
+from concurrent.futures import Future
+from typing import Callable, Dict, Generic, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[T]):
+    """
+    Coalesce concurrent calls that share a key into a single execution.
+
+    The first caller for a key (the leader) runs the function; callers that
+    arrive while it is still running wait on the leader's future and receive
+    the same result or exception. Once the call finishes the key is released,
+    so this never serves stale results - it is not a cache.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, "Future[T]"] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """
+        Execute ``fn`` once for all concurrent callers using ``key``.
+
+        Args:
+            key: Identity of the call (e.g. query or URL plus options).
+            fn: Zero-argument callable performing the actual work.
+
+        Returns:
+            The result of the shared call.
+
+        Raises:
+            Whatever ``fn`` raised, re-raised in every waiting caller.
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            is_leader = future is None
+            if future is None:
+                future = Future()
+                self._calls[key] = future
+
+        if not is_leader:
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+
+    def in_flight(self) -> int:
+        """Return the number of calls currently executing."""
+        with self._lock:
+            return len(self._calls)
@@ -0,0 +1,128 @@
+"""Run-local store of search results referenced by short ids."""
+
+import re
+import threading
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+_SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])\s+")
+_WORD = re.compile(r"[a-z0-9]+")
+
+# Only the head of a snippet is scanned; search snippets front-load the
+# relevant text and scanning long pages would dominate formatting time
+MAX_SCAN_CHARS = 1500
+
+# Words too common to say anything about relevance
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from how in is it of on or that the this to "
+    "was what when where which who why with".split()
+)
+
+
+@dataclass(frozen=True)
+class StoredSource:
+    """A search result kept out of the prompt until expanded."""
+
+    source_id: str
+    title: str
+    url: str
+    content: str
+    query: str
+
+
+class SourceStore:
+    """
+    Holds full search results for one research run.
+
+    Search tools put results here and show agents only a short id, the
+    title, URL and one key sentence; the full text is returned on demand by
+    ``ExpandSourceTool``. Ids are stable per URL, so a page returned by
+    several searches is listed under the same id. Thread-safe.
+    """
+
+    def __init__(self, prefix: str = "S") -> None:
+        """
+        Initialize the store.
+
+        Args:
+            prefix: Prefix for generated ids (``S1``, ``S2``, ...).
+        """
+        self._prefix = prefix
+        self._sources: Dict[str, StoredSource] = {}
+        self._ids_by_url: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def add(self, title: str, url: str, content: str, query: str = "") -> str:
+        """
+        Store a result and return its id.
+
+        A URL already in the store keeps its id; its content is replaced if
+        the new result carries more text.
+        """
+        key = url.strip()
+        with self._lock:
+            source_id = self._ids_by_url.get(key)
+            if source_id is not None:
+                existing = self._sources[source_id]
+                if len(content) > len(existing.content):
+                    self._sources[source_id] = StoredSource(
+                        source_id, title or existing.title, existing.url, content, query
+                    )
+                return source_id
+
+            source_id = f"{self._prefix}{len(self._sources) + 1}"
+            self._ids_by_url[key] = source_id
+            self._sources[source_id] = StoredSource(source_id, title, key, content, query)
+            return source_id
+
+    def get(self, source_id: str) -> Optional[StoredSource]:
+        """
+        Return a stored result by id, or None.
+
+        Case-insensitive; the brackets results are listed with (``[S1]``)
+        and surrounding whitespace are ignored.
+        """
+        key = source_id.strip().strip("[]").strip().upper()
+        with self._lock:
+            return self._sources.get(key)
+
+    def sources(self) -> List[StoredSource]:
+        """Return all stored results in insertion order."""
+        with self._lock:
+            return list(self._sources.values())
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._sources)
+
+
+def key_sentence(text: str, query: str = "", max_chars: int = 200) -> str:
+    """
+    Pick the sentence of ``text`` that best matches ``query``.
+
+    Sentences in the first ``MAX_SCAN_CHARS`` are scored by how many
+    distinct query terms they contain; ties go to the earlier sentence. The
+    result is cut to ``max_chars``.
+    """
+    head = text[:MAX_SCAN_CHARS].strip()
+    lowered = head.lower()
+    terms = [
+        term for term in set(_WORD.findall(query.lower())) - _STOPWORDS if term in lowered
+    ]
+
+    if not terms:
+        # Nothing to rank by: take the first sentence without splitting the rest
+        match = _SENTENCE_BOUNDARY.search(head)
+        best = head[: match.start()] if match else head
+    else:
+        sentences = [s for s in _SENTENCE_BOUNDARY.split(head) if s]
+        best, best_score = sentences[0], 0
+        for sentence in sentences:
+            sentence_lowered = sentence.lower()
+            score = sum(1 for term in terms if term in sentence_lowered)
+            if score > best_score:
+                best, best_score = sentence, score
+
+    if len(best) > max_chars:
+        best = best[: max_chars - 3].rstrip() + "..."
+    return best
@@ -1,12 +1,40 @@
 """Tavily web search tool for research."""
 
-from typing import Type
+from typing import Any, Dict, Hashable, List, Optional, Tuple, Type
 
 from crewai.tools import BaseTool
 from pydantic import BaseModel, Field
 from tavily import TavilyClient
+from tavily.errors import BadRequestError
 
 from research_bot.config.settings import Settings
+from research_bot.tools.cache import ResultCache
+from research_bot.tools.circuit_breaker import CircuitBreaker, CircuitOpenError
+from research_bot.tools.extraction import MAX_PAGE_CHARS, clean_text
+from research_bot.tools.metrics import record_cache_lookup, record_fallback
+from research_bot.tools.prefetch import Prefetcher
+from research_bot.tools.rate_budget import RateBudget
+from research_bot.tools.single_flight import SingleFlight
+from research_bot.tools.sources import SourceStore, key_sentence
+from research_bot.tools.url_health import UrlHealth
+
+# Shared across tool instances so concurrent crews coalesce identical queries
+_inflight_searches: SingleFlight[Dict[str, Any]] = SingleFlight()
+
+COMPACT_DESCRIPTION = (
+    "Search the web for information on a topic. Returns one entry per result: "
+    "a source id, title, URL and key sentence. Use expand_search_result with "
+    "the ids to read the full snippets."
+)
+
+# Raw page text shorter than this is usually a consent wall or an extraction
+# failure; such pages are left for the extraction tool to fetch
+MIN_RAW_CONTENT_CHARS = 200
+
+STALE_RESULTS_NOTE = (
+    "Note: the search provider is unavailable; these are earlier cached "
+    "results for this query and may be out of date.\n"
+)
 
 
 class TavilySearchInput(BaseModel):
@@ -28,32 +56,208 @@ class TavilySearchTool(BaseTool):
 
     _client: TavilyClient
     _settings: Settings
+    _cache: Optional[ResultCache[Dict[str, Any]]]
+    _sources: Optional[SourceStore]
+    _prefetcher: Optional[Prefetcher]
+    _page_cache: Optional[ResultCache[str]]
+    _breaker: Optional[CircuitBreaker]
+    _health: Optional[UrlHealth]
+    _rate_budget: Optional[RateBudget]
 
-    def __init__(self, settings: Settings) -> None:
-        super().__init__()
-        self._client = TavilyClient(api_key=settings.tavily_api_key)
+    def __init__(
+        self,
+        settings: Settings,
+        client: Optional[TavilyClient] = None,
+        cache: Optional[ResultCache[Dict[str, Any]]] = None,
+        sources: Optional[SourceStore] = None,
+        prefetcher: Optional[Prefetcher] = None,
+        page_cache: Optional[ResultCache[str]] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        health: Optional[UrlHealth] = None,
+        rate_budget: Optional[RateBudget] = None,
+    ) -> None:
+        """
+        Initialize the search tool.
+
+        Args:
+            settings: Application settings.
+            client: Optional shared Tavily client (kept warm across runs).
+            cache: Optional result cache shared across runs.
+            sources: Optional run-local store. When given, results are
+                returned in compact form (id, title, URL, key sentence) and
+                the full text is kept in the store for ``ExpandSourceTool``.
+            prefetcher: Optional prefetcher that starts fetching the top
+                result pages while the agent reads the results.
+            page_cache: Optional page cache of the extraction tool. When
+                given, searches also request each result's page text and
+                store it there, so extracting a result page needs no fetch.
+            breaker: Optional circuit breaker shared by all users of the
+                Tavily API. While it is open, searches fail fast and are
+                answered from expired cache entries where possible.
+            health: Optional URL health of the extraction tool. Results
+                known to fail, or from slow or unreliable domains, are
+                listed last with a warning, so agents avoid extracting
+                them; results known to fail are not prefetched.
+            rate_budget: Optional Tavily request budget; every API request
+                is counted against it.
+        """
+        if sources is not None:
+            super().__init__(description=COMPACT_DESCRIPTION)
+        else:
+            super().__init__()
+        self._client = client or TavilyClient(api_key=settings.tavily_api_key)
         self._settings = settings
+        self._cache = cache
+        self._sources = sources
+        self._prefetcher = prefetcher
+        self._page_cache = page_cache
+        self._breaker = breaker
+        self._health = health
+        self._rate_budget = rate_budget
 
-    def _run(self, query: str, max_results: int = 5) -> str:
-        """Execute Tavily search and return formatted results."""
-        try:
-            response = self._client.search(
+    def _cache_key(self, query: str, max_results: int) -> Hashable:
+        return (query.strip(), max_results, self._page_cache is not None)
+
+    def _search(self, query: str, max_results: int) -> Dict[str, Any]:
+        """Call the Tavily API, sharing the request with identical in-flight searches."""
+        page_cache = self._page_cache
+        key = self._cache_key(query, max_results)
+        if self._cache is not None:
+            cached = self._cache.get(key)
+            record_cache_lookup(cached is not None)
+            if cached is not None:
+                return cached
+
+        def request() -> Dict[str, Any]:
+            if self._rate_budget is not None:
+                self._rate_budget.record()
+            return self._client.search(
                 query=query,
                 max_results=max_results,
                 include_answer=True,
+                include_raw_content="text" if page_cache is not None else False,
             )
 
-            results = []
+        def search() -> Dict[str, Any]:
+            if self._breaker is not None:
+                # An invalid query is the caller's fault, not the provider's
+                response = self._breaker.call(
+                    request,
+                    is_failure=lambda e: not isinstance(e, BadRequestError),
+                )
+            else:
+                response = request()
+            if page_cache is not None:
+                response = self._store_pages(response, page_cache)
+            if self._cache is not None:
+                self._cache.set(key, response)
+            return response
+
+        return _inflight_searches.do(key, search)
+
+    @staticmethod
+    def _store_pages(response: Dict[str, Any], page_cache: ResultCache[str]) -> Dict[str, Any]:
+        """
+        Move raw page text from a response into the page cache.
+
+        Pages are cleaned and cut to the extraction tool's budget and cached
+        under its default (rendered) key. The returned response has no raw
+        content, so the search cache stays small.
+        """
+        results = []
+        for result in response.get("results", []):
+            raw = result.get("raw_content")
+            result = {name: value for name, value in result.items() if name != "raw_content"}
+            if raw:
+                text = clean_text(raw, MAX_PAGE_CHARS)
+                if len(text) >= MIN_RAW_CONTENT_CHARS:
+                    page_cache.set((result["url"].strip(), True), text)
+            results.append(result)
+        return {**response, "results": results}
+
+    def _rank(self, results: List[Dict[str, Any]]) -> List[Tuple[Dict[str, Any], str]]:
+        """
+        Order results by URL health and attach warnings.
+
+        Returns:
+            ``(result, warning)`` pairs, healthy results first (otherwise in
+            Tavily's order); the warning is "" for healthy results.
+        """
+        if self._health is None:
+            return [(result, "") for result in results]
+        health = self._health
+        ranked = sorted(results, key=lambda result: health.penalty(result["url"]))
+        return [(result, health.annotation(result["url"])) for result in ranked]
+
+    @staticmethod
+    def _format_compact(
+        query: str,
+        response: Dict[str, Any],
+        ranked: List[Tuple[Dict[str, Any], str]],
+        sources: SourceStore,
+    ) -> str:
+        """Store full results and list them as ids with key sentences."""
+        lines: List[str] = []
+        if response.get("answer"):
+            lines.append(f"Summary: {key_sentence(response['answer'], query, max_chars=300)}")
+
+        for result, warning in ranked:
+            content = result.get("content") or ""
+            source_id = sources.add(result["title"], result["url"], content, query)
+            sentence = key_sentence(content, query) or "No content available"
+            flag = f" ({warning})" if warning else ""
+            lines.append(f"[{source_id}] {result['title']} <{result['url']}>{flag}\n    {sentence}")
+
+        return "\n".join(lines) if lines else "No results found."
+
+    def _search_with_fallback(self, query: str, max_results: int) -> Tuple[Dict[str, Any], str]:
+        """
+        Search, falling back to an expired cached response if the provider fails.
+
+        Returns:
+            The response and a note for the agent ("" for a fresh response).
+
+        Raises:
+            Exception: The provider's error if there is no cached response.
+        """
+        try:
+            return self._search(query, max_results), ""
+        except Exception:
+            key = self._cache_key(query, max_results)
+            stale = self._cache.get_stale(key) if self._cache is not None else None
+            if stale is None:
+                raise
+            record_fallback()
+            return stale, STALE_RESULTS_NOTE
+
+    def _run(self, query: str, max_results: int = 5) -> str:
+        """Execute Tavily search and return formatted results."""
+        try:
+            response, note = self._search_with_fallback(query, max_results)
+            ranked = self._rank(response.get("results", []))
+            if self._prefetcher is not None:
+                self._prefetcher.schedule([
+                    result["url"]
+                    for result, _ in ranked
+                    if self._health is None or self._health.rejection(result["url"]) is None
+                ])
+            if self._sources is not None:
+                return note + self._format_compact(query, response, ranked, self._sources)
+
+            results = [note] if note else []
             if response.get("answer"):
                 results.append(f"Summary: {response['answer']}\n")
 
-            for idx, result in enumerate(response.get("results", []), 1):
+            for idx, (result, warning) in enumerate(ranked, 1):
+                flag = f" ({warning})" if warning else ""
                 results.append(
                     f"[{idx}] {result['title']}\n"
-                    f"    URL: {result['url']}\n"
+                    f"    URL: {result['url']}{flag}\n"
                     f"    {result.get('content', 'No content available')[:500]}\n"
                 )
 
             return "\n".join(results) if results else "No results found."
+        except CircuitOpenError:
+            return "Search error: the search provider is failing; try again later."
         except Exception as e:
             return f"Search error: {e}"
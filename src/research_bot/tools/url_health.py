@@ -0,0 +1,320 @@
+"""URL health - negative cache of failing URLs and per-domain fetch statistics."""
+
+import logging
+import sqlite3
+import threading
+import time
+import urllib.parse
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+# How long a URL is rejected after a failure that will not go away by itself
+# (missing page, paywall or block) and after repeated transient failures
+PERMANENT_FAILURE_TTL_SECONDS = 7 * 86400.0
+BLOCKED_TTL_SECONDS = 86400.0
+TRANSIENT_FAILURE_TTL_SECONDS = 3600.0
+# Consecutive transient failures (timeouts, 5xx, connection errors) before
+# a URL is rejected
+TRANSIENT_FAILURE_THRESHOLD = 2
+
+# Weight of the newest sample in a domain's moving averages
+_SMOOTHING = 0.3
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS failed_urls (
+    url TEXT PRIMARY KEY,
+    reason TEXT NOT NULL,
+    failures INTEGER NOT NULL,
+    expires_at REAL
+);
+CREATE TABLE IF NOT EXISTS domains (
+    domain TEXT PRIMARY KEY,
+    samples INTEGER NOT NULL,
+    success_rate REAL NOT NULL,
+    latency_seconds REAL NOT NULL
+);
+"""
+
+
+def domain_of(url: str) -> str:
+    """Host of a URL, lower-cased and without a ``www.`` prefix."""
+    host = (urllib.parse.urlsplit(url.strip()).hostname or "").lower()
+    return host[4:] if host.startswith("www.") else host
+
+
+def describe_failure(error: Exception) -> Tuple[str, Optional[float]]:
+    """
+    Classify a failed page fetch.
+
+    Args:
+        error: The fetch error.
+
+    Returns:
+        A reason for the agent and how long to reject the URL, or None for
+        transient failures (rejected only once they repeat).
+    """
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        status = error.response.status_code
+        if status in (404, 410):
+            return f"page not found (HTTP {status})", PERMANENT_FAILURE_TTL_SECONDS
+        if status in (401, 402, 403, 451):
+            return f"blocked or paywalled (HTTP {status})", BLOCKED_TTL_SECONDS
+        if 400 <= status < 500 and status not in (408, 429):
+            return f"request rejected (HTTP {status})", BLOCKED_TTL_SECONDS
+        return f"server error (HTTP {status})", None
+    if isinstance(error, requests.Timeout):
+        return "timed out", None
+    return "unreachable", None
+
+
+@dataclass(frozen=True)
+class UrlFailure:
+    """A URL known to fail."""
+
+    url: str
+    reason: str
+    failures: int
+    # Wall-clock time the URL is rejected until (None: not rejected yet)
+    expires_at: Optional[float]
+
+
+class UrlRejectedError(Exception):
+    """Raised instead of fetching a URL that is known to fail."""
+
+    def __init__(self, failure: UrlFailure) -> None:
+        super().__init__(f"{failure.url} is known to fail: {failure.reason}")
+        self.failure = failure
+
+
+@dataclass(frozen=True)
+class DomainStats:
+    """Moving averages of page fetches from one domain."""
+
+    domain: str
+    samples: int
+    success_rate: float
+    latency_seconds: float
+
+
+class UrlHealth:
+    """
+    Remembers which URLs fail and how well each domain serves pages.
+
+    URLs that fail for good (404, paywall, block) are rejected for a while
+    after one failure, URLs that fail transiently (timeouts, server errors)
+    after ``TRANSIENT_FAILURE_THRESHOLD`` in a row; a success clears them.
+    Per domain, the success rate and fetch latency are tracked as moving
+    averages, so domains recover once they serve pages well again.
+
+    Lookups are answered from memory. With a ``path``, every update is also
+    written to SQLite (under the lock, so writes land in order) and the
+    state is loaded on start, so it outlives the process; updates by other
+    processes show up after a restart.
+    Thread-safe; shared by all runs of a tool provider.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str | Path] = None,
+        slow_seconds: float = 10.0,
+        min_samples: int = 3,
+        min_success_rate: float = 0.5,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Initialize URL health, loading persisted state if any.
+
+        Args:
+            path: Optional SQLite database file (None: memory only).
+            slow_seconds: Average fetch latency from which a domain is slow.
+            min_samples: Fetches from a domain before it may be judged.
+            min_success_rate: Success rate below which a domain is unreliable.
+            clock: Wall-clock time source (expiries survive restarts).
+        """
+        self._path = Path(path) if path else None
+        self._slow_seconds = slow_seconds
+        self._min_samples = max(1, min_samples)
+        self._min_success_rate = min_success_rate
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._failures: Dict[str, UrlFailure] = {}
+        self._domains: Dict[str, DomainStats] = {}
+        if self._path is not None:
+            self._load()
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        """Open a short-lived autocommit connection."""
+        conn = sqlite3.connect(self._path, timeout=30.0, isolation_level=None)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def _load(self) -> None:
+        """Create the database if needed and read its live entries."""
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connection() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            conn.execute("DELETE FROM failed_urls WHERE expires_at < ?", (self._clock(),))
+            for url, reason, failures, expires_at in conn.execute(
+                "SELECT url, reason, failures, expires_at FROM failed_urls"
+            ):
+                self._failures[url] = UrlFailure(url, reason, failures, expires_at)
+            for row in conn.execute(
+                "SELECT domain, samples, success_rate, latency_seconds FROM domains"
+            ):
+                self._domains[row[0]] = DomainStats(*row)
+
+    def rejection(self, url: str) -> Optional[UrlFailure]:
+        """The failure a URL is currently rejected for, or None."""
+        with self._lock:
+            failure = self._failures.get(url.strip())
+        if failure is None or failure.expires_at is None or failure.expires_at <= self._clock():
+            return None
+        return failure
+
+    def domain(self, url: str) -> Optional[DomainStats]:
+        """Statistics of a URL's domain, or None before any fetch from it."""
+        with self._lock:
+            return self._domains.get(domain_of(url))
+
+    def rejected(self) -> List[UrlFailure]:
+        """URLs currently rejected, latest expiry first."""
+        now = self._clock()
+        with self._lock:
+            failures = [
+                failure for failure in self._failures.values()
+                if failure.expires_at is not None and failure.expires_at > now
+            ]
+        return sorted(failures, key=lambda failure: failure.expires_at or 0.0, reverse=True)
+
+    def domains(self) -> List[DomainStats]:
+        """Statistics of every domain fetched from, least reliable first."""
+        with self._lock:
+            stats = list(self._domains.values())
+        return sorted(stats, key=lambda entry: (entry.success_rate, -entry.latency_seconds))
+
+    def record_success(self, url: str, latency_seconds: float) -> None:
+        """Record a fetched page: the URL is healthy again."""
+        url = url.strip()
+        with self._lock:
+            cleared = self._failures.pop(url, None) is not None
+            stats = self._update_domain(url, True, latency_seconds)
+            if self._path is not None:
+                with self._connection() as conn:
+                    if cleared:
+                        conn.execute("DELETE FROM failed_urls WHERE url = ?", (url,))
+                    self._save_domain(conn, stats)
+
+    def record_failure(
+        self,
+        url: str,
+        reason: str,
+        latency_seconds: float,
+        ttl_seconds: Optional[float] = None,
+    ) -> UrlFailure:
+        """
+        Record a failed fetch.
+
+        Args:
+            url: The page URL.
+            reason: Why it failed (shown to agents).
+            latency_seconds: Time the attempt took.
+            ttl_seconds: How long to reject the URL; None for a transient
+                failure, which rejects it for ``TRANSIENT_FAILURE_TTL_SECONDS``
+                once ``TRANSIENT_FAILURE_THRESHOLD`` happened in a row.
+
+        Returns:
+            The URL's failure entry.
+        """
+        url = url.strip()
+        now = self._clock()
+        with self._lock:
+            previous = self._failures.get(url)
+            failures = (previous.failures if previous is not None else 0) + 1
+            if ttl_seconds is None and failures >= TRANSIENT_FAILURE_THRESHOLD:
+                ttl_seconds = TRANSIENT_FAILURE_TTL_SECONDS
+            failure = UrlFailure(
+                url=url,
+                reason=reason,
+                failures=failures,
+                expires_at=now + ttl_seconds if ttl_seconds is not None else None,
+            )
+            self._failures[url] = failure
+            stats = self._update_domain(url, False, latency_seconds)
+            if self._path is not None:
+                with self._connection() as conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO failed_urls (url, reason, failures, expires_at) "
+                        "VALUES (?, ?, ?, ?)",
+                        (url, reason, failures, failure.expires_at),
+                    )
+                    self._save_domain(conn, stats)
+
+        if failure.expires_at is not None:
+            logger.info(
+                "URL rejected",
+                extra={
+                    "url": url,
+                    "reason": reason,
+                    "failures": failures,
+                    "ttl_seconds": ttl_seconds,
+                },
+            )
+        return failure
+
+    def penalty(self, url: str) -> int:
+        """How strongly to avoid a URL: 0 healthy, 1 slow or unreliable domain, 2 rejected."""
+        if self.rejection(url) is not None:
+            return 2
+        return 1 if self._domain_problem(self.domain(url)) else 0
+
+    def annotation(self, url: str) -> str:
+        """A short warning for agents about a URL ("" if it looks healthy)."""
+        failure = self.rejection(url)
+        if failure is not None:
+            return f"known to fail: {failure.reason}; do not extract"
+        return self._domain_problem(self.domain(url))
+
+    def _domain_problem(self, stats: Optional[DomainStats]) -> str:
+        if stats is None or stats.samples < self._min_samples:
+            return ""
+        if stats.success_rate < self._min_success_rate:
+            return f"unreliable site: {stats.success_rate:.0%} of recent fetches succeeded"
+        if stats.latency_seconds >= self._slow_seconds:
+            return f"slow site: pages take about {stats.latency_seconds:.0f} s to fetch"
+        return ""
+
+    def _update_domain(self, url: str, success: bool, latency_seconds: float) -> DomainStats:
+        """Fold one fetch into its domain's averages (caller holds the lock)."""
+        domain = domain_of(url)
+        previous = self._domains.get(domain)
+        if previous is None:
+            stats = DomainStats(domain, 1, 1.0 if success else 0.0, latency_seconds)
+        else:
+            stats = DomainStats(
+                domain=domain,
+                samples=previous.samples + 1,
+                success_rate=previous.success_rate
+                + _SMOOTHING * (float(success) - previous.success_rate),
+                latency_seconds=previous.latency_seconds
+                + _SMOOTHING * (latency_seconds - previous.latency_seconds),
+            )
+        self._domains[domain] = stats
+        return stats
+
+    @staticmethod
+    def _save_domain(conn: sqlite3.Connection, stats: DomainStats) -> None:
+        conn.execute(
+            "INSERT OR REPLACE INTO domains (domain, samples, success_rate, latency_seconds) "
+            "VALUES (?, ?, ?, ?)",
+            (stats.domain, stats.samples, stats.success_rate, stats.latency_seconds),
+        )